@@ -1,32 +1,45 @@
 from helper import *
+from casr_packed import *
 class casr_30:
     def __init__(self, state,mode='s'):
-        self.state = state[:]
         self.n = len(state)
+        self.mask = (1 << self.n) - 1
+        self.word = bits_to_int(state)
         self.mode = mode
 
+    @property
+    def state(self):
+        return cell_list(self)
+
+    @state.setter
+    def state(self, state):
+        self.word = bits_to_int(state)
+
     def rule30(self, L, C, R):
         return (L & ~C & ~R) | (~L & C) | (~L & ~C & R)
 
     def step(self):
+        self.word = step_30(self.word, self.n, self.mask)
+        return self.state
+
+    def step_cells(self):
+        """
+        Cell by cell reference of step(), kept for cross checking
+        """
+        state = self.state
         next_state = [0] * self.n
         for i in range(self.n):
-            L = self.state[(i - 1) % self.n]
-            C = self.state[i]
-            R = self.state[(i + 1) % self.n]
+            L = state[(i - 1) % self.n]
+            C = state[i]
+            R = state[(i + 1) % self.n]
             next_state[i] = self.rule30(L, C, R) & 1
         self.state = next_state
         return next_state
     # output_cell=-1 is MSB
     # output_cell=0 is LSB
     def generate(self, steps, output_cell=-1):
-        stream = []
-        for _ in range(steps):
-            self.step()
-            if self.mode == 'p':
-                stream.append(self.state)
-            else:
-                stream.append(self.state[output_cell])
+        stream, self.word = run_packed(step_30, self.word, self.n, steps,
+                                       self.mode, output_cell, self.mask)
         return stream
 
 # Example
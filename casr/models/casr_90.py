@@ -1,32 +1,50 @@
 from helper import *
+from casr_packed import *
+from casr_jump import jump_word
 class casr_90:
     def __init__(self, state,mode='s'):
         """
         state: list of bits (0/1)
         """
-        self.state = state[:]
         self.n = len(state)
+        self.mask = (1 << self.n) - 1
+        self.word = bits_to_int(state)
         self.mode = mode
 
+    @property
+    def state(self):
+        return cell_list(self)
+
+    @state.setter
+    def state(self, state):
+        self.word = bits_to_int(state)
+
     def step(self):
+        self.word = step_90(self.word, self.n, self.mask)
+        return self.state
+
+    def step_cells(self):
+        """
+        Cell by cell reference of step(), kept for cross checking
+        """
+        state = self.state
         next_state = [0] * self.n
         for i in range(self.n):
-            left  = self.state[(i - 1) % self.n]
-            right = self.state[(i + 1) % self.n]
+            left  = state[(i - 1) % self.n]
+            right = state[(i + 1) % self.n]
             next_state[i] = left ^ right
         self.state = next_state
-        #print(next_state)
-        return self.state
+        return next_state
+
+    def jump(self, k):
+        """
+        Advance the state by k clocks without stepping through them
+        """
+        self.word = jump_word(self.word, k, self.n, 0)
 
     def generate(self, steps, output_cell=-1):
-        stream = []
-        for _ in range(steps):
-            self.step()
-            if self.mode == 'p':
-                stream.append(self.state)
-            else:
-                stream.append(self.state[output_cell])
-            #stream.append(self.state[output_cell])
+        stream, self.word = run_packed(step_90, self.word, self.n, steps,
+                                       self.mode, output_cell, self.mask)
         return stream
 
 
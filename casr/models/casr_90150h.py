@@ -1,4 +1,6 @@
 from helper import *
+from casr_packed import *
+from casr_jump import jump_word
 class casr_90150h:
     def __init__(self, state, rule_vector,mode='s'):
         """
@@ -6,17 +8,35 @@ class casr_90150h:
         rule_vector: list of bits (0 = Rule 90, 1 = Rule 150)
         """
         assert len(state) == len(rule_vector)
-        self.state = state[:]
         self.rules = rule_vector[:]
         self.n = len(state)
+        self.mask = (1 << self.n) - 1
+        self.word = bits_to_int(state)
+        self.m150 = bits_to_int([1 if r else 0 for r in rule_vector])
         self.mode = mode
 
+    @property
+    def state(self):
+        return cell_list(self)
+
+    @state.setter
+    def state(self, state):
+        self.word = bits_to_int(state)
+
     def step(self):
+        self.word = step_90150h(self.word, self.n, self.mask, self.m150)
+        return self.state
+
+    def step_cells(self):
+        """
+        Cell by cell reference of step(), kept for cross checking
+        """
+        state = self.state
         next_state = [0] * self.n
         for i in range(self.n):
-            left   = self.state[(i - 1) % self.n]
-            center = self.state[i]
-            right  = self.state[(i + 1) % self.n]
+            left   = state[(i - 1) % self.n]
+            center = state[i]
+            right  = state[(i + 1) % self.n]
 
             if self.rules[i] == 0:
                 # Rule 90
@@ -26,16 +46,18 @@ class casr_90150h:
                 next_state[i] = left ^ center ^ right
 
         self.state = next_state
-        return self.state
+        return next_state
+
+    def jump(self, k):
+        """
+        Advance the state by k clocks without stepping through them
+        """
+        self.word = jump_word(self.word, k, self.n, self.m150)
 
     def generate(self, steps, output_cell=-1):
-        stream = []
-        for _ in range(steps):
-            self.step()
-            if self.mode == 'p':
-                stream.append(self.state)
-            else:
-                stream.append(self.state[output_cell])
+        stream, self.word = run_packed(step_90150h, self.word, self.n, steps,
+                                       self.mode, output_cell, self.mask,
+                                       self.m150)
         return stream
 
 
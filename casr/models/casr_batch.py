@@ -0,0 +1,164 @@
+import numpy as np
+from casr_packed import packed_states
+
+RULES = ('30', '90', '150', '90150h', 'nl')
+
+
+def _pack_columns(bits, width):
+    """
+    Pack a (rows, cols) 0/1 array along the columns into (rows, width)
+    uint64 words, column j going to bit j % 64 of word j // 64.
+    """
+    rows, cols = bits.shape
+    padded = np.zeros((rows, width * 64), dtype=np.uint8)
+    padded[:, :cols] = bits
+    packed = np.packbits(padded, axis=1, bitorder='little')
+    return packed.view('<u8').astype(np.uint64)
+
+
+def _unpack_columns(words, cols):
+    """
+    Inverse of _pack_columns, returns a (rows, cols) uint8 array of bits.
+    """
+    as_bytes = np.ascontiguousarray(words, dtype='<u8').view(np.uint8)
+    return np.unpackbits(as_bytes, axis=-1, bitorder='little')[..., :cols]
+
+
+class casr_batch:
+    """
+    A batch of independent CASRs of the same width, all clocked together.
+
+    The state is bit-sliced: row i holds cell i of every automaton, 64
+    automata per uint64 word. A step is then a roll of the rows plus a
+    few bitwise ops over the whole (n_cells x n_words) array, and the
+    per-cell rule vectors become per-row masks.
+
+    states: (n_seeds, n_cells) bits, LSB at index 0 like the list models
+    rule: '30', '90', '150', '90150h' or 'nl'
+    rule_vector: (n_cells,) shared by all seeds or (n_seeds, n_cells).
+      '90150h' -> 0 = Rule 90, otherwise Rule 150
+      'nl'     -> 0 = Rule 90, 1 = Rule 150, otherwise Rule 30
+    """
+
+    def __init__(self, states, rule='90150h', rule_vector=None, mode='s'):
+        if rule not in RULES:
+            raise ValueError(f"Unknown rule {rule}, expected one of {RULES}")
+        states = np.asarray(states, dtype=np.uint8)
+        if states.ndim != 2:
+            raise ValueError("states must be a (n_seeds, n_cells) array")
+        self.n_seeds, self.n = states.shape
+        self.n_words = (self.n_seeds + 63) // 64
+        self.rule = rule
+        self.mode = mode
+        self.x = _pack_columns(states.T & 1, self.n_words)
+
+        self.m150 = None
+        self.m30 = None
+        if rule in ('90150h', 'nl'):
+            if rule_vector is None:
+                raise ValueError(f"Rule {rule} needs a rule_vector")
+            rules = np.asarray(rule_vector)
+            if rules.shape[-1] != self.n:
+                raise ValueError("rule_vector and state widths differ")
+            if rule == '90150h':
+                self.m150 = self._rule_mask(rules != 0)
+            else:
+                self.m150 = self._rule_mask(rules == 1)
+                self.m30 = self._rule_mask((rules != 0) & (rules != 1))
+
+    def _rule_mask(self, selected):
+        """
+        Turn a per-cell (or per-seed, per-cell) boolean selection into a
+        mask that broadcasts against the bit-sliced state.
+        """
+        if selected.ndim == 1:
+            ones = np.uint64(0xFFFFFFFFFFFFFFFF)
+            return np.where(selected, ones, np.uint64(0))[:, None]
+        return _pack_columns(selected.T.astype(np.uint8), self.n_words)
+
+    @property
+    def states(self):
+        """
+        Current states as a (n_seeds, n_cells) array of bits
+        """
+        return _unpack_columns(self.x, self.n_seeds).T
+
+    def step(self):
+        x = self.x
+        left = np.roll(x, 1, axis=0)    # cell i gets cell i-1
+        right = np.roll(x, -1, axis=0)  # cell i gets cell i+1
+        if self.rule == '90':
+            x = left ^ right
+        elif self.rule == '150':
+            x = left ^ x ^ right
+        elif self.rule == '30':
+            x = left ^ (x | right)
+        elif self.rule == '90150h':
+            x = left ^ right ^ (x & self.m150)
+        else:
+            linear = left ^ right ^ (x & self.m150)
+            x = (linear & ~self.m30) | ((left ^ (x | right)) & self.m30)
+        self.x = x
+        return x
+
+    def nonlinear_output(self):
+        """
+        casr_nl output filter for every seed, packed 64 seeds per word
+        """
+        a = self.x[0]
+        b = self.x[self.n // 2]
+        c = self.x[-1]
+        return (a ^ b) ^ (b & c)
+
+    def generate(self, steps, output_cell=-1):
+        """
+        Run every automaton steps times.
+        's' mode returns a (n_seeds, steps) array with the stream of
+        output_cell (the nonlinear output for rule 'nl') of each seed.
+        'p' mode returns a list with the packed_states of each seed, the
+        same layout as the 'p' mode of the single-ring models (one
+        uint64 word per 64 cells, .bits() unpacks them). They are views
+        of one (n_seeds, steps, (n_cells + 63) // 64) array.
+        Calls continue from the current state, so long runs can be
+        taken in chunks.
+        """
+        if self.mode == 'p':
+            row_words = (self.n + 63) // 64
+            words = np.empty((self.n_seeds, steps, row_words), dtype='<u8')
+            for k in range(steps):
+                self.step()
+                words[:, k] = _pack_columns(self.states, row_words)
+            return [packed_states(w, self.n) for w in words]
+
+        cell = range(self.n)[output_cell]
+        words = np.empty((steps, self.n_words), dtype=np.uint64)
+        for k in range(steps):
+            self.step()
+            if self.rule == 'nl':
+                words[k] = self.nonlinear_output()
+            else:
+                words[k] = self.x[cell]
+        return _unpack_columns(words, self.n_seeds).T
+
+
+# Example usage
+if __name__ == "__main__":
+    from casr_90150h import casr_90150h
+
+    rng = np.random.default_rng(1)
+    seeds = rng.integers(0, 2, size=(1000, 24), dtype=np.uint8)
+    # x"33333B"
+    rules = [
+    1, 1, 0, 1, #B
+    1, 1, 0, 0, #3
+    1, 1, 0, 0, #3
+    1, 1, 0, 0, #3
+    1, 1, 0, 0, #3
+    1, 1, 0, 0  #3
+    ]
+    batch = casr_batch(seeds, '90150h', rules)
+    stream = batch.generate(20)
+
+    # every row matches the single-seed model
+    single = casr_90150h(seeds[7].tolist(), rules).generate(20)
+    print(stream[7].tolist() == single)
@@ -1,3 +1,4 @@
+from casr_packed import *
 class casr_nl:
     """
     Nonlinear Hybrid CASR
@@ -9,21 +10,39 @@ class casr_nl:
 
     def __init__(self, state, rule_vector):
         assert len(state) == len(rule_vector)
-        self.state = state[:]
         self.rules = rule_vector[:]
         self.n = len(state)
+        self.mask = (1 << self.n) - 1
+        self.word = bits_to_int(state)
+        self.m150, self.m30 = rule_masks(rule_vector)
+
+    @property
+    def state(self):
+        return cell_list(self)
+
+    @state.setter
+    def state(self, state):
+        self.word = bits_to_int(state)
 
     def rule30(self, L, C, R):
         # Wolfram Rule 30 truth table
         return (L & ~C & ~R) | (~L & C & R) | (~L & C & ~R) | (~L & ~C & R)
 
     def step(self):
+        self.word = step_nl(self.word, self.n, self.mask, self.m150, self.m30)
+        return self.state
+
+    def step_cells(self):
+        """
+        Cell by cell reference of step(), kept for cross checking
+        """
+        state = self.state
         next_state = [0] * self.n
 
         for i in range(self.n):
-            L = self.state[(i - 1) % self.n]
-            C = self.state[i]
-            R = self.state[(i + 1) % self.n]
+            L = state[(i - 1) % self.n]
+            C = state[i]
+            R = state[(i + 1) % self.n]
 
             rule = self.rules[i]
 
@@ -45,16 +64,15 @@ class casr_nl:
         Nonlinear output filter:
         XOR + AND mixing of distant cells
         """
-        a = self.state[0]
-        b = self.state[self.n // 2]
-        c = self.state[-1]
-        return (a ^ b) ^ (b & c)
+        return nl_output(self.word, self.n)
 
     def generate(self, steps):
         stream = []
+        x, n, mask, m150, m30 = self.word, self.n, self.mask, self.m150, self.m30
         for _ in range(steps):
-            self.step()
-            stream.append(self.nonlinear_output())
+            x = step_nl(x, n, mask, m150, m30)
+            stream.append(nl_output(x, n))
+        self.word = x
         return stream
 
 
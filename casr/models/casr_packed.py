@@ -0,0 +1,255 @@
+"""
+Bit-packed engine for the CASR models.
+
+The whole ring is held in one Python int where bit i is cell i
+(LSB at index 0, the same order as the list based state). A full
+clock is then a handful of whole-word rotates and masks instead of
+a per-cell loop:
+
+  left  neighbour of every cell : rotl(x)
+  right neighbour of every cell : rotr(x)
+
+'p' mode output is kept packed as well, see packed_states.
+"""
+import numpy as np
+
+# maps the ascii '0'/'1' of a binary string to the ints 0/1
+_BIT_TABLE = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def bits_to_int(bits):
+    """
+    Pack a list of bits (LSB at index 0) into an int.
+    """
+    if not bits:
+        return 0
+    return int("".join(map(str, reversed(bits))), 2)
+
+
+def int_to_bits(value, n):
+    """
+    Unpack the n least significant bits of value into a list of
+    bits (LSB at index 0).
+    """
+    return list(format(value, f"0{n}b")[::-1].encode().translate(_BIT_TABLE))
+
+
+class cell_list(list):
+    """
+    The `state` of a packed ring: a bit list (LSB at index 0) that
+    writes cell assignments (state[i] = b, state[i:j] = bits) through
+    to the ring, as when `state` was a plain list attribute. Only the
+    assigned cells are written, the ring length is fixed.
+    """
+    __slots__ = ('_ring',)
+
+    def __init__(self, ring):
+        super().__init__(int_to_bits(ring.word, ring.n))
+        self._ring = ring
+
+    def __setitem__(self, k, value):
+        if isinstance(k, slice):
+            cells = range(len(self))[k]
+            value = list(value)
+            if len(value) != len(cells):
+                raise ValueError(f"Cannot resize a ring of {len(self)} cells")
+        else:
+            cells = [range(len(self))[k]]
+            value = [value]
+        word = self._ring.word
+        for i, bit in zip(cells, value):
+            word = word | (1 << i) if bit else word & ~(1 << i)
+        super().__setitem__(k, value if isinstance(k, slice) else value[0])
+        self._ring.word = word
+
+    def _resize(self, *args):
+        raise TypeError("The ring length is fixed, assign cells or the whole state instead")
+
+    __delitem__ = append = extend = insert = pop = remove = clear = _resize
+    __iadd__ = __imul__ = _resize
+
+
+def rule_masks(rule_vector):
+    """
+    Build the (rule 150, rule 30) cell masks of a rule vector.
+    0 -> Rule 90, 1 -> Rule 150, anything else -> Rule 30
+    """
+    m150 = 0
+    m30 = 0
+    for i, rule in enumerate(rule_vector):
+        if rule == 1:
+            m150 |= 1 << i
+        elif rule != 0:
+            m30 |= 1 << i
+    return m150, m30
+
+
+def rotl(x, n, mask):
+    """
+    Rotate an n-bit ring one cell towards the MSB (cell i gets cell i-1).
+    """
+    return ((x << 1) & mask) | (x >> (n - 1))
+
+
+def rotr(x, n, mask):
+    """
+    Rotate an n-bit ring one cell towards the LSB (cell i gets cell i+1).
+    """
+    return (x >> 1) | ((x & 1) << (n - 1))
+
+
+def step_90(x, n, mask):
+    """
+    Rule 90 : L ^ R
+    """
+    return rotl(x, n, mask) ^ rotr(x, n, mask)
+
+
+def step_150(x, n, mask):
+    """
+    Rule 150 : L ^ C ^ R
+    """
+    return rotl(x, n, mask) ^ x ^ rotr(x, n, mask)
+
+
+def step_30(x, n, mask):
+    """
+    Rule 30 : L ^ (C | R)
+    """
+    return rotl(x, n, mask) ^ (x | rotr(x, n, mask))
+
+
+def step_90150h(x, n, mask, m150):
+    """
+    Hybrid 90/150 : L ^ R, plus C on the cells selected by m150
+    """
+    return rotl(x, n, mask) ^ rotr(x, n, mask) ^ (x & m150)
+
+
+def step_nl(x, n, mask, m150, m30):
+    """
+    Nonlinear hybrid 90/150/30. Cells in m30 use Rule 30, the others
+    are the linear 90/150 hybrid.
+    """
+    left = rotl(x, n, mask)
+    right = rotr(x, n, mask)
+    linear = left ^ right ^ (x & m150)
+    return (linear & ~m30 & mask) | ((left ^ (x | right)) & m30)
+
+
+class packed_states:
+    """
+    'p' mode output of generate(): one state per row, packed LSB first
+    into little-endian uint64 words (bit i of a row = cell i). Rows
+    read as bit lists, like the old list of states, and slicing gives
+    a view of the same buffer. ints(), bits() and vhdl_hex() convert
+    the whole block at once.
+    """
+    __slots__ = ('words', 'n')
+
+    def __init__(self, words, n):
+        """
+        words: (rows, (n + 63) // 64) uint64 array
+        """
+        self.words = words
+        self.n = n
+
+    @classmethod
+    def from_ints(cls, values, n):
+        n_bytes = 8 * ((n + 63) // 64)
+        data = b"".join(v.to_bytes(n_bytes, "little") for v in values)
+        return cls(np.frombuffer(data, dtype="<u8").reshape(-1, n_bytes // 8), n)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return packed_states(self.words[k], self.n)
+        return int_to_bits(self.int_at(k), self.n)
+
+    def __iter__(self):
+        n = self.n
+        for value in self.ints():
+            yield int_to_bits(value, n)
+
+    @property
+    def nbytes(self):
+        return self.words.nbytes
+
+    def int_at(self, k):
+        return int.from_bytes(self.words[k].tobytes(), "little")
+
+    def ints(self):
+        """
+        The states as ints
+        """
+        data = np.ascontiguousarray(self.words).tobytes()
+        step = 8 * self.words.shape[1]
+        return [int.from_bytes(data[i:i + step], "little") for i in range(0, len(data), step)]
+
+    def bits(self):
+        """
+        (rows, n) uint8 array of the cells, LSB at index 0
+        """
+        as_bytes = np.ascontiguousarray(self.words, dtype="<u8").view(np.uint8)
+        return np.unpackbits(as_bytes, axis=1, count=self.n, bitorder="little")
+
+    def tolist(self):
+        """
+        The list of bit lists the list based generate() returned
+        """
+        return list(self)
+
+    def vhdl_hex(self, width=None):
+        """
+        x"..." literal of every state, as helper.prep_out(states, width)
+        """
+        width = self.n if width is None else width
+        if width < self.n:
+            raise ValueError(f"States of {self.n} cells are longer than width ({width})")
+        hex_width = (width + 3) // 4
+        n_bytes = (hex_width + 1) // 2
+        as_bytes = np.ascontiguousarray(self.words, dtype="<u8").view(np.uint8)
+        rows = np.zeros((len(as_bytes), n_bytes), dtype=np.uint8)
+        keep = min(n_bytes, as_bytes.shape[1])
+        rows[:, :keep] = as_bytes[:, :keep]
+        digits = rows[:, ::-1].tobytes().hex().upper()
+        # an odd number of hex digits drops the leading 0 of every record
+        step = 2 * n_bytes
+        skip = step - hex_width
+        return [f'x"{digits[i + skip:i + step]}"' for i in range(0, len(digits), step)]
+
+
+def run_packed(step_fn, x, n, steps, mode, output_cell, *masks):
+    """
+    Clock a packed ring steps times and collect the output the same
+    way as the list based generate(): the whole state per step in
+    'p' mode (as packed_states), otherwise the bit of output_cell (-1
+    is the MSB). Returns (stream, final word).
+    """
+    if mode == 'p':
+        n_bytes = 8 * ((n + 63) // 64)
+        data = bytearray(steps * n_bytes)
+        for k in range(0, steps * n_bytes, n_bytes):
+            x = step_fn(x, n, *masks)
+            data[k:k + n_bytes] = x.to_bytes(n_bytes, "little")
+        words = np.frombuffer(data, dtype="<u8").reshape(steps, n_bytes // 8)
+        return packed_states(words, n), x
+    stream = []
+    bit = range(n)[output_cell]
+    for _ in range(steps):
+        x = step_fn(x, n, *masks)
+        stream.append((x >> bit) & 1)
+    return stream, x
+
+
+def nl_output(x, n):
+    """
+    casr_nl output filter on a packed ring:
+    (cell 0 ^ cell n/2) ^ (cell n/2 & cell n-1)
+    """
+    a = x & 1
+    b = (x >> (n // 2)) & 1
+    c = x >> (n - 1)
+    return (a ^ b) ^ (b & c)
@@ -0,0 +1,250 @@
+"""
+Cycle lengths of the CASR rings.
+
+A 90/150 ring is linear, next = T x, so its periods follow from
+polynomials over GF(2) (gf2_poly) instead of clocking:
+  characteristic polynomial  product of the relative annihilators of a
+                             Krylov flag, O(n^2) packed-int operations
+  minimal polynomial         x^t g(x): every state is on a cycle after at
+                             most t clocks and every cycle length divides
+                             ord(g), the order of x modulo g
+  one state                  its annihilator x^t g(x) gives the transient
+                             t and the exact cycle length ord(g)
+The ring is maximal length (one cycle through all 2^n - 1 nonzero states)
+when the characteristic polynomial is primitive of degree n.
+
+Rule 30 and the casr_nl mixes are nonlinear; brent() finds the transient
+and cycle length of a seed by clocking the packed state, which is
+practical up to n of about 32.
+"""
+import argparse
+import random
+from casr_packed import step_90150h, step_nl
+from gf2_poly import deg, factor_degrees, is_primitive, order, plcm, pmul, poly_str
+
+
+def _linear_step(n, m150):
+    mask = (1 << n) - 1
+    return lambda x: step_90150h(x, n, mask, m150)
+
+
+def _reduce(basis, w, combo):
+    while w:
+        row = basis.get(w.bit_length() - 1)
+        if row is None:
+            break
+        w ^= row[0]
+        combo ^= row[1]
+    return w, combo
+
+
+def _krylov(step, v, basis):
+    """
+    Annihilator of v relative to the span of basis (an invariant
+    subspace), adding the Krylov vectors of v to basis
+    """
+    w, combo = _reduce(basis, v, 1)
+    while w:
+        basis[w.bit_length() - 1] = (w, combo)
+        w, combo = _reduce(basis, step(w), combo << 1)
+    return combo
+
+
+def annihilator(x, n, m150):
+    """
+    Least polynomial p with p(T) x = 0 for the state x of the ring
+    """
+    return _krylov(_linear_step(n, m150), x, {})
+
+
+def charpoly(n, m150):
+    """
+    Characteristic polynomial of the transition matrix T of a 90/150
+    ring, m150 selecting the Rule 150 cells
+    """
+    step = _linear_step(n, m150)
+    basis = {}
+    poly = 1
+    for j in range(n):
+        if len(basis) == n:
+            break
+        if _reduce(basis, 1 << j, 0)[0]:
+            # the relative annihilators of a flag of invariant
+            # subspaces multiply to the characteristic polynomial
+            basis_rows = {k: (w, 0) for k, (w, _) in basis.items()}
+            poly = pmul(poly, _krylov(step, 1 << j, basis_rows))
+            basis = basis_rows
+    return poly
+
+
+def hybrid_charpoly(n, m150):
+    """
+    charpoly() in closed form. T + xI is tridiagonal with ones off the
+    diagonal and in the two corners, so over GF(2) its determinant is
+    K(1..n) + K(2..n-1), K being the continuants of x + d_i (d_i = 1 on
+    the Rule 150 cells). Needs n >= 3, below that both neighbours of a
+    cell coincide.
+    """
+    if n < 3:
+        return charpoly(n, m150)
+
+    def continuant(lo, hi):
+        p0, p1 = 1, 2 ^ (m150 >> lo & 1)
+        for i in range(lo + 1, hi):
+            p0, p1 = p1, pmul(2 ^ (m150 >> i & 1), p1) ^ p0
+        return p1
+
+    return continuant(0, n) ^ continuant(1, n - 1)
+
+
+def _apply(step, n, poly):
+    """
+    Columns of poly(T), by Horner's rule on all columns at once
+    """
+    cols = [0] * n
+    for i in range(deg(poly), -1, -1):
+        cols = [step(c) for c in cols]
+        if poly >> i & 1:
+            cols = [c ^ (1 << j) for j, c in enumerate(cols)]
+    return cols
+
+
+def minpoly(n, m150, trials=4, seed=1):
+    """
+    Minimal polynomial of T: the lcm of the annihilators of a few random
+    states, completed with the basis states that poly(T) does not yet
+    annihilate, so the result is exact
+    """
+    step = _linear_step(n, m150)
+    rng = random.Random(seed)
+    poly = 1
+    for _ in range(trials):
+        poly = plcm(poly, _krylov(step, rng.getrandbits(n), {}))
+    while True:
+        residual = [j for j, c in enumerate(_apply(step, n, poly)) if c]
+        if not residual:
+            return poly
+        poly = plcm(poly, _krylov(step, 1 << residual[0], {}))
+
+
+def _split_x(poly):
+    """
+    poly = x^t g with g(0) = 1, returns (t, g)
+    """
+    t = (poly & -poly).bit_length() - 1
+    return t, poly >> t
+
+
+def state_period(x, n, m150):
+    """
+    (transient, cycle length, exact) of the state x of a 90/150 ring.
+    exact is False when some 2^d - 1 could not be fully factored and the
+    length is only a multiple of the true one.
+    """
+    if x == 0:
+        return 0, 1, True
+    t, g = _split_x(annihilator(x, n, m150))
+    length, exact = order(g)
+    return t, length, exact
+
+
+def ring_period(n, m150):
+    """
+    Period structure of a 90/150 ring: the characteristic and minimal
+    polynomials, the factor degrees [(degree, multiplicity, count)],
+    the longest transient and cycle length over all states, and whether
+    the ring is maximal length (None when that could not be decided)
+    """
+    char = charpoly(n, m150)
+    mini = minpoly(n, m150)
+    transient, g = _split_x(mini)
+    length, exact = order(g)
+    try:
+        maximal = is_primitive(char)
+    except ValueError:
+        maximal = None
+    return {'n': n, 'm150': m150, 'charpoly': char, 'minpoly': mini,
+            'factors': factor_degrees(char), 'transient': transient,
+            'period': length, 'exact': exact, 'maximal': maximal}
+
+
+def brent(step, x0, limit=None):
+    """
+    Brent's cycle detection on the packed state: (transient, cycle
+    length) of x0 under step, None when no cycle closes within limit
+    clocks
+    """
+    power = length = 1
+    tortoise, hare = x0, step(x0)
+    clocks = 1
+    while tortoise != hare:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+        clocks += 1
+        if limit is not None and clocks > limit:
+            return None
+    tortoise = hare = x0
+    for _ in range(length):
+        hare = step(hare)
+    transient = 0
+    while tortoise != hare:
+        tortoise = step(tortoise)
+        hare = step(hare)
+        transient += 1
+    return transient, length
+
+
+def nonlinear_period(x, n, m150=0, m30=None, limit=None):
+    """
+    (transient, cycle length) of the state x of a casr_nl ring, or of a
+    Rule 30 ring with the default m30 (every cell)
+    """
+    mask = (1 << n) - 1
+    m30 = mask if m30 is None else m30 & mask
+    m150 &= mask & ~m30
+    return brent(lambda s: step_nl(s, n, mask, m150, m30), x & mask, limit)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cycle lengths of a CASR ring")
+    parser.add_argument('generator', choices=('30', '90', '150', 'h', 'nl'))
+    parser.add_argument('width', type=int)
+    parser.add_argument('--rules', default='0', help="hex Rule 150 mask ('h', 'nl')")
+    parser.add_argument('--m30', default='0', help="hex Rule 30 mask ('nl')")
+    parser.add_argument('--seed', help='hex seed, its own transient and cycle length')
+    parser.add_argument('--limit', type=int, default=1 << 32, help='clock limit of the nonlinear search')
+    args = parser.parse_args(argv)
+
+    n = args.width
+    mask = (1 << n) - 1
+    seed = None if args.seed is None else int(args.seed, 16) & mask
+    if args.generator in ('30', 'nl'):
+        if seed is None:
+            parser.error("the nonlinear rings need a --seed")
+        m30 = None if args.generator == '30' else int(args.m30, 16)
+        result = nonlinear_period(seed, n, int(args.rules, 16), m30, args.limit)
+        if result is None:
+            print(f"no cycle within {args.limit} clocks")
+        else:
+            print(f"transient {result[0]}, cycle length {result[1]}")
+        return
+    m150 = {'90': 0, '150': mask}.get(args.generator, int(args.rules, 16) & mask)
+    info = ring_period(n, m150)
+    print(f"characteristic polynomial: {poly_str(info['charpoly'])}")
+    print("factors (degree, multiplicity, count):", info['factors'])
+    print(f"minimal polynomial degree {deg(info['minpoly'])}")
+    bound = "" if info['exact'] else " (multiple of, 2^d-1 not fully factored)"
+    print(f"longest transient {info['transient']}, cycle lengths divide {info['period']}{bound}")
+    print("maximal length:", {True: "yes", False: "no", None: "undecided"}[info['maximal']])
+    if seed is not None:
+        t, length, exact = state_period(seed, n, m150)
+        print(f"seed: transient {t}, cycle length {length}{'' if exact else ' (multiple of)'}")
+
+
+# Example usage
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Rule vector search for casr_90150h.
+
+A 90/150 ring is never maximal length: its characteristic polynomial is
+a square, times x + 1 for an odd width (casr_period). For w = 4 and
+w >= 6 the longest cycle a ring of width w can have is 2 (2^h - 1),
+h = w // 2, reached when
+
+  charpoly = p^2 (w even) or (x + 1) p^2 (w odd), p primitive of degree h
+  minpoly  = charpoly
+
+and a rule vector meeting both is what this search calls maximal. Seeds
+whose annihilator is the whole characteristic polynomial run on those
+cycles (casr_period.state_period checks a seed). The bound fails at
+w = 3 and 5, where a charpoly (x + 1)^w gives cycles of 4 and 8 (rule
+vector 0b01011 at w = 5); going through every rule vector finds none
+longer than the bound for w = 4 and 6..18. The search leaves 3 and 5 out.
+
+Candidates are either every rule vector in turn (enumerate, rotations
+and reflections skipped since they give the same polynomial) or seeded
+random ones, handed in blocks to a process pool. The checkpoint JSON
+lists the finished blocks and the hits, so an interrupted search resumes
+where it stopped. Hits are merged into the rule table (casr/rule_table.txt),
+the CASR counterpart of mt/config_table.txt.
+
+  python casr_rule_search.py 512 --count 4 -j 8 --checkpoint search512.json
+  python casr_rule_search.py 16 --mode enumerate --count 100
+"""
+import argparse
+import json
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from casr_period import hybrid_charpoly, minpoly
+from gf2_poly import deg, is_primitive, pderiv, pdivmod, psqrt
+
+TABLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'rule_table.txt')
+
+# candidates per block handed to a worker
+BLOCK = 256
+
+
+def max_period(n):
+    """
+    Longest cycle of a 90/150 ring of width n, n = 4 or n >= 6
+    """
+    if n < 4 or n == 5:
+        raise ValueError(f"No cycle bound for a width of {n}")
+    return 2 * ((1 << (n // 2)) - 1)
+
+
+def half_poly(n, m150):
+    """
+    The primitive p with charpoly = p^2 (times x + 1 for odd n), None
+    when the rule vector has no such factor
+    """
+    c = hybrid_charpoly(n, m150)
+    if n % 2:
+        c, rem = pdivmod(c, 0b11)
+        if rem:
+            return None
+    if pderiv(c):
+        return None
+    p = psqrt(c)
+    try:
+        return p if deg(p) == n // 2 and is_primitive(p) else None
+    except ValueError:
+        # 2^(n/2) - 1 not fully factored, primitivity unknown
+        return None
+
+
+def is_maximal(n, m150):
+    """
+    Whether the rule vector m150 gives a ring with cycles of max_period(n)
+    """
+    return (n == 4 or n >= 6) and half_poly(n, m150) is not None and deg(minpoly(n, m150)) == n
+
+
+def _canonical(m150, n):
+    """
+    Whether m150 is the least of its rotations and reflections
+    """
+    mask = (1 << n) - 1
+    mirrored = int(format(m150, f'0{n}b')[::-1], 2)
+    for word in (m150, mirrored):
+        for _ in range(n):
+            if word < m150:
+                return False
+            word = ((word << 1) | (word >> (n - 1))) & mask
+    return True
+
+
+def candidate(n, mode, seed, index):
+    """
+    Rule vector number index of a search, None when enumerate skips it
+    """
+    if mode == 'enumerate':
+        return index if _canonical(index, n) else None
+    return random.Random(f"{seed}:{n}:{index}").getrandbits(n)
+
+
+def search_block(n, mode, seed, start, stop):
+    """
+    Maximal rule vectors among candidates start..stop, as (index, rules, p)
+    """
+    hits = []
+    for index in range(start, stop):
+        m150 = candidate(n, mode, seed, index)
+        if m150 is None:
+            continue
+        p = half_poly(n, m150)
+        if p is not None and deg(minpoly(n, m150)) == n:
+            hits.append((index, m150, p))
+    return hits
+
+
+def _load_checkpoint(path, key):
+    if path and os.path.exists(path):
+        with open(path) as f:
+            state = json.load(f)
+        if state['key'] != key:
+            raise ValueError(f"{path} belongs to another search: {state['key']}")
+        return state
+    return {'key': key, 'done': [], 'found': []}
+
+
+def _save_checkpoint(path, state):
+    if path:
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+
+def search(n, count=1, mode='random', seed=0, max_candidates=None, processes=None,
+           checkpoint=None, block=BLOCK):
+    """
+    Search until count maximal rule vectors are found or max_candidates
+    have been tried (enumerate stops after 2^n anyway). Returns the hits
+    as a list of dicts {index, rules, poly}, in candidate order.
+    """
+    if n < 4 or n == 5:
+        raise ValueError("Rule vector search needs a width of 4 or at least 6")
+    total = 1 << n if mode == 'enumerate' else None
+    if max_candidates is not None:
+        total = max_candidates if total is None else min(total, max_candidates)
+    key = {'width': n, 'mode': mode, 'seed': seed, 'block': block}
+    state = _load_checkpoint(checkpoint, key)
+    done = set(state['done'])
+    found = state['found']
+
+    def blocks():
+        b = 0
+        while total is None or b * block < total:
+            if b not in done:
+                stop = (b + 1) * block if total is None else min((b + 1) * block, total)
+                yield b, b * block, stop
+            b += 1
+
+    def record(b, hits):
+        done.add(b)
+        found.extend({'index': i, 'rules': f"{m:X}", 'poly': f"{p:X}"} for i, m, p in hits)
+        found.sort(key=lambda hit: hit['index'])
+        state['done'] = sorted(done)
+        _save_checkpoint(checkpoint, state)
+
+    pending = blocks()
+    if processes == 1:
+        for b, start, stop in pending:
+            if len(found) >= count:
+                break
+            record(b, search_block(n, mode, seed, start, stop))
+        return found[:count]
+    with ProcessPoolExecutor(processes) as pool:
+        in_flight = deque()
+        limit = 2 * (processes or os.cpu_count() or 1)
+        for b, start, stop in pending:
+            if len(found) >= count:
+                break
+            in_flight.append((b, pool.submit(search_block, n, mode, seed, start, stop)))
+            if len(in_flight) >= limit:
+                b0, future = in_flight.popleft()
+                record(b0, future.result())
+        while in_flight:
+            b0, future = in_flight.popleft()
+            record(b0, future.result())
+    return found[:count]
+
+
+TABLE_HEADER = """w=w_casr_g
+rule_i=rule vector, hex, bit i set for a Rule 150 cell i
+bits=bit length of the longest cycle 2*(2^(w/2)-1), w/2 rounded down, the same for every listed rule vector (the bound holds for w = 4 and w >= 6)
+p=primitive polynomial with charpoly = p^2, times x+1 for odd w (hex, bit i = x^i)
+
+   w  bits  rule_i  p
+----  ----  ------  -
+"""
+
+
+def read_table(path=TABLE):
+    """
+    {width: [(rules, poly)]} of a rule table
+    """
+    table = {}
+    if not os.path.exists(path):
+        return table
+    with open(path) as f:
+        lines = iter(f)
+        for line in lines:
+            if line.startswith('----'):
+                break
+        for line in lines:
+            fields = line.split()
+            if len(fields) == 4:
+                table.setdefault(int(fields[0]), []).append((int(fields[2], 16), int(fields[3], 16)))
+    return table
+
+
+def write_table(table, path=TABLE):
+    with open(path, 'w') as f:
+        f.write(TABLE_HEADER)
+        for n in sorted(table):
+            for rules, poly in table[n]:
+                f.write(f"{n:4d}  {max_period(n).bit_length():4d}  {rules:0{(n + 3) // 4}X}  {poly:X}\n")
+
+
+def add_to_table(n, hits, path=TABLE):
+    """
+    Merge search hits into the rule table, keeping the listed ones first
+    """
+    table = read_table(path)
+    rows = table.setdefault(n, [])
+    for hit in hits:
+        row = (int(hit['rules'], 16), int(hit['poly'], 16))
+        if row not in rows:
+            rows.append(row)
+    write_table(table, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search maximal rule vectors of casr_90150h")
+    parser.add_argument('widths', type=int, nargs='+')
+    parser.add_argument('--count', type=int, default=1, help='rule vectors to find per width')
+    parser.add_argument('--mode', choices=('random', 'enumerate'), default='random')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random candidates')
+    parser.add_argument('--max-candidates', type=int, default=None)
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--checkpoint', help="resume file, '{w}' is replaced by the width")
+    parser.add_argument('--table', default=TABLE, help='rule table to update')
+    args = parser.parse_args(argv)
+
+    for n in args.widths:
+        checkpoint = args.checkpoint.replace('{w}', str(n)) if args.checkpoint else None
+        try:
+            hits = search(n, args.count, args.mode, args.seed, args.max_candidates, args.jobs, checkpoint)
+        except ValueError as e:
+            parser.error(str(e))
+        for hit in hits:
+            print(f"{n:4d}  {hit['rules']}")
+        if len(hits) < args.count:
+            print(f"{n:4d}  found {len(hits)} of {args.count}")
+        add_to_table(n, hits, args.table)
+
+
+if __name__ == "__main__":
+    main()
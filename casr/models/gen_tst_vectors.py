@@ -1,27 +1,60 @@
-from casr_30 import *
-from casr_90 import *
-from casr_150 import *
-from casr_90150h import *
-from helper import *
+"""
+Test vector generator for casr_tb.vhd.
+
+A job is one vector file: a dict with
+  generator: '30', '90', '150' or 'h' (casr_90150h)
+  width:     number of cells, the seed is the width low bits of seed
+  seed:      hex string (or int)
+  rules:     hex string (or int), 'h' only
+  count:     number of vectors
+  id:        seed id used in the file name
+  format:    'txt' (default) or 'bin'
+and writes ./casr_tst_vectors/casr_seed{id}_vectors_{generator}.txt, the
+VHDL array of the 'p' mode states followed by the seed (and rule) lines,
+or the same states as a golden_vectors binary file (.bin).
+
+A manifest is a JSON list of jobs. An entry without a generator is a
+seed set and expands to the four files the testbench reads (30/90/150
+with the 64/128/256 low bits of the seed, h with all 512 bits), its
+rules defaulting to the seed rotated by 256 bits.
+
+  python gen_tst_vectors.py                   # the two seed sets in casr_tst_vectors
+  python gen_tst_vectors.py manifest.json -j 8 -o ./casr_tst_vectors
+  python gen_tst_vectors.py manifest.json --format bin
+
+Jobs run across a process pool and every file is streamed to disk.
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from casr_packed import bits_to_int, step_30, step_90, step_150, step_90150h
+from golden_vectors import vector_writer
+from helper import ints_to_bits
+
+STEP_FNS = {'30': step_30, '90': step_90, '150': step_150, 'h': step_90150h}
+
+# generator and width of the four files of a seed set
+SEED_SET = (('30', 64), ('90', 128), ('150', 256), ('h', 512))
+
+# the seed sets of casr_tst_vectors
+DEFAULT_SETS = [
+    {"id": "1", "count": 100,
+     "seed": "285f44ab321ed5e5d7f04bb5ad4d5b981ec6f4e08d475d5f8e7dbbb955f6389dfc7ffdd5e74ef4c24f7f1722ef758ac4db33fa5e3c4d8a2c36bd0f75a4abe07d"},
+    {"id": "2", "count": 100,
+     "seed": "49712b8c46739a443529e0903981802d69e9721382d28cfc4a670fffeff8d0f58af5d4a3fca5c516e9e2d67f4e5e361e139180d31d7ef528c0735ff9c3f47b0d"},
+]
+
+# vectors formatted per write
+CHUNK = 4096
+
 
 def hex_to_lsb_array(hex_str, width=512):
     """
     Convert a hex string to a binary array with LSB at index 0.
     """
-    # Convert hex to integer
-    value = int(hex_str, 16)
-
-    # Convert integer to binary string without '0b'
-    bin_str = bin(value)[2:]
-
-    # Pad binary string to the desired width (MSB padding)
-    bin_str = bin_str.zfill(width)
-
-    # Reverse the string so LSB is at index 0 and convert to list of ints
-    bit_array = [int(bit) for bit in reversed(bin_str)]
-
-    return bit_array
-
+    return ints_to_bits([int(hex_str, 16)], width)[0].tolist()
 
 
 def write_vhdl_array(values, filename, indent="    "):
@@ -31,82 +64,140 @@ def write_vhdl_array(values, filename, indent="    "):
     """
     with open(filename, "w") as f:
         f.write("(\n")
-        for i, val in enumerate(values):
-            comma = "," if i < len(values) - 1 else ""
-            f.write(f"{indent}{val}{comma}\n")
+        f.write("".join(f"{indent}{val}{',' if i < len(values) - 1 else ''}\n"
+                        for i, val in enumerate(values)))
         f.write(");\n")
 
-def generate(n_vectors,seed,rules,seed_id=''):
-    casr_30_seed = seed[:64]
-    casr_90_seed = seed[:128]
-    casr_150_seed = seed[:256]
-
-    casr_30_f  = f"./casr_tst_vectors/casr_seed{seed_id}_vectors_30.txt"
-    casr_90_f  = f"./casr_tst_vectors/casr_seed{seed_id}_vectors_90.txt"
-    casr_150_f = f"./casr_tst_vectors/casr_seed{seed_id}_vectors_150.txt"
-    casr_h_f   = f"./casr_tst_vectors/casr_seed{seed_id}_vectors_h.txt"
-    
-    ## creat opject and give it seed
-    casr30 = casr_30(casr_30_seed,'p')
-    ## store results from CASR
-    casr_30_v = prep_out(casr30.generate(n_vectors),64)
-    ## write into vhdl-style array
-    write_vhdl_array(casr_30_v, casr_30_f)
-    ## append seed to end of file
-    with open(casr_30_f, 'a') as file:
-        file.write(bits_lsb_to_vhdl_hex(casr_30_seed)+'\n') # generate vhdl hex
-        file.write("".join(str(b) for b in reversed(casr_30_seed))+'\n') # reverse seed array and print string
-        file.write("".join(map(str, casr_30_seed))+'\n') # print seed array as string
-
-    ## creat opject and give it seed
-    casr90 = casr_90(casr_90_seed,'p')
-    ## store results from CASR
-    casr_90_v = prep_out(casr90.generate(n_vectors),128)
-    ## write into vhdl-style array
-    write_vhdl_array(casr_90_v, casr_90_f)
-    ## append seed to end of file
-    with open(casr_90_f, 'a') as file:
-        file.write(bits_lsb_to_vhdl_hex(casr_90_seed)+'\n') # generate vhdl hex
-        file.write("".join(str(b) for b in reversed(casr_90_seed))+'\n') # reverse seed array and print string
-        file.write("".join(map(str, casr_90_seed))+'\n') # print seed array as string
-
-    ## creat opject and give it seed
-    casr150 = casr_150(casr_150_seed,'p')
-    ## store results from CASR
-    casr_150_v = prep_out(casr150.generate(n_vectors),256)
-    ## write into vhdl-style array
-    write_vhdl_array(casr_150_v, casr_150_f)
-    ## append seed to end of file
-    with open(casr_150_f, 'a') as file:
-        file.write(bits_lsb_to_vhdl_hex(casr_150_seed)+'\n') # generate vhdl hex
-        file.write("".join(str(b) for b in reversed(casr_150_seed))+'\n') # reverse seed array and print string
-        file.write("".join(map(str, casr_150_seed))+'\n') # print seed array as string
-
-    ## creat opject and give it seed
-    casr90150h = casr_90150h(seed, rules,'p')
-    ## store results from CASR
-    casr_h_v = prep_out(casr90150h.generate(n_vectors),512)
-    ## write into vhdl-style array
-    write_vhdl_array(casr_h_v, casr_h_f)
-    ## append seed to end of file
-    with open(casr_h_f, 'a') as file:
-        file.write(bits_lsb_to_vhdl_hex(seed)+'\n') # generate vhdl hex
-        file.write("".join(str(b) for b in reversed(seed))+'\n') # reverse seed array and print string
-        file.write("".join(map(str, seed))+'\n') # print seed array as string
-        file.write(bits_lsb_to_vhdl_hex(rules)+'\n') # generate vhdl hex
-        file.write("".join(str(b) for b in reversed(rules))+'\n') # reverse rules array and print string
-        file.write("".join(map(str, rules))+'\n')# print rules array as string
-
-    
-#generate(100,)
-
-# Example usage
-hex_value = "285f44ab321ed5e5d7f04bb5ad4d5b981ec6f4e08d475d5f8e7dbbb955f6389dfc7ffdd5e74ef4c24f7f1722ef758ac4db33fa5e3c4d8a2c36bd0f75a4abe07d"
-binary_array = hex_to_lsb_array(hex_value, width=512)
-h_rule = binary_array[256:] + binary_array[:256]
-generate(100,binary_array,h_rule,"1")
-
-hex_value = "49712b8c46739a443529e0903981802d69e9721382d28cfc4a670fffeff8d0f58af5d4a3fca5c516e9e2d67f4e5e361e139180d31d7ef528c0735ff9c3f47b0d"
-binary_array = hex_to_lsb_array(hex_value, width=512)
-h_rule = binary_array[256:] + binary_array[:256]
-generate(100,binary_array,h_rule,"2")
\ No newline at end of file
+
+def _as_int(value):
+    if isinstance(value, str):
+        return int(value, 16)
+    if isinstance(value, (list, tuple)):
+        return bits_to_int(value)
+    return int(value)
+
+
+def trailer_lines(value, width):
+    """
+    The three lines written after the array for a seed or rule vector:
+    VHDL hex, MSB first bits, LSB first bits
+    """
+    msb_first = format(value, f"0{width}b")
+    return [f'x"{value:0{(width + 3) // 4}X}"', msb_first, msb_first[::-1]]
+
+
+def vector_path(out_dir, seed_id, generator, fmt='txt'):
+    return os.path.join(out_dir, f"casr_seed{seed_id}_vectors_{generator}.{fmt}")
+
+
+def iter_states(generator, width, seed, rules=0, count=None):
+    """
+    Packed 'p' mode states (bit i = cell i) of a generator, count of
+    them or endless
+    """
+    mask = (1 << width) - 1
+    x = _as_int(seed) & mask
+    masks = (_as_int(rules) & mask,) if generator == 'h' else ()
+    step = STEP_FNS[generator]
+    k = 0
+    while count is None or k < count:
+        x = step(x, width, mask, *masks)
+        yield x
+        k += 1
+
+
+def run_job(job, out_dir="./casr_tst_vectors", indent="    "):
+    """
+    Write the vector file of one job, returns its path
+    """
+    generator, n = job['generator'], job['width']
+    seed = _as_int(job['seed']) & ((1 << n) - 1)
+    rules = _as_int(job['rules']) & ((1 << n) - 1) if generator == 'h' else 0
+    count = job['count']
+    hex_width = (n + 3) // 4
+    states = iter_states(generator, n, seed, rules, count)
+
+    fmt = job.get('format', 'txt')
+    path = vector_path(out_dir, job['id'], generator, fmt)
+    if fmt == 'bin':
+        with vector_writer(path, n, generator, seed, rules) as w:
+            w.write_many(states)
+        return path
+    with open(path, "w") as f:
+        f.write("(\n")
+        for start in range(0, count, CHUNK):
+            lines = [f'{indent}x"{x:0{hex_width}X}"' for x in islice(states, CHUNK)]
+            f.write(("" if start == 0 else ",\n") + ",\n".join(lines))
+        f.write("\n);\n" if count else ");\n")
+        lines = trailer_lines(seed, n)
+        if generator == 'h':
+            lines += trailer_lines(rules, n)
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+def expand_manifest(entries):
+    """
+    Jobs of a manifest, seed sets expanded to their four files
+    """
+    jobs = []
+    for entry in entries:
+        if 'generator' in entry:
+            jobs.append(dict(entry))
+            continue
+        seed = _as_int(entry['seed']) & ((1 << 512) - 1)
+        rules = entry.get('rules')
+        if rules is None:
+            rules = (seed >> 256) | ((seed & ((1 << 256) - 1)) << 256)
+        for generator, width in SEED_SET:
+            job = dict(entry, generator=generator, width=width, seed=seed)
+            if generator == 'h':
+                job['rules'] = rules
+            jobs.append(job)
+    return jobs
+
+
+def run_manifest(entries, out_dir="./casr_tst_vectors", processes=None, fmt=None):
+    """
+    Run every job of a manifest across a process pool (processes=1 runs
+    them in this process). fmt is the format of jobs that do not set one.
+    Returns the written paths in job order.
+    """
+    jobs = expand_manifest(entries)
+    if fmt is not None:
+        jobs = [dict(job, format=job.get('format', fmt)) for job in jobs]
+    os.makedirs(out_dir, exist_ok=True)
+    if processes == 1 or len(jobs) <= 1:
+        return [run_job(job, out_dir) for job in jobs]
+    with ProcessPoolExecutor(processes) as pool:
+        return list(pool.map(run_job, jobs, [out_dir] * len(jobs)))
+
+
+def generate(n_vectors, seed, rules, seed_id=''):
+    """
+    Write the four vector files of one seed set (seed and rules as bit
+    lists, LSB at index 0)
+    """
+    run_manifest([{'id': seed_id, 'count': n_vectors, 'seed': bits_to_int(seed),
+                   'rules': bits_to_int(rules)}], processes=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate CASR test vector files")
+    parser.add_argument('manifest', nargs='?', help='JSON list of jobs (default: the two seed sets)')
+    parser.add_argument('-o', '--out', default='./casr_tst_vectors', help='output folder')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--format', choices=('txt', 'bin'), default=None,
+                        help='file format of jobs that do not set one (default: txt)')
+    args = parser.parse_args(argv)
+
+    entries = DEFAULT_SETS
+    if args.manifest:
+        with open(args.manifest) as f:
+            entries = json.load(f)
+    for path in run_manifest(entries, args.out, args.jobs, args.format):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Write casr/tb/casr_test_vectors_pkg.vhd straight from the models.
+
+The package holds the seed/rule constants of one seed set, n_gen_rand and
+the casr30/casr90/casr150/casr90150h vector arrays read by casr_tb.vhd.
+The arrays are stepped and written chunk by chunk, so memory use does not
+grow with n_gen_rand.
+
+  python gen_vectors_pkg.py                        # seed set 1, 100 vectors
+  python gen_vectors_pkg.py -n 1000000 -o ../tb/casr_test_vectors_pkg.vhd
+  python gen_vectors_pkg.py --seed 49712b8c... --id 1 -n 100000
+"""
+import argparse
+import time
+from itertools import islice
+from gen_tst_vectors import DEFAULT_SETS, SEED_SET, _as_int, iter_states
+
+# package name prefix and vectors per line of each generator
+ARRAYS = {'30': ('casr30', 5), '90': ('casr90', 3), '150': ('casr150', 1), 'h': ('casr90150h', 1)}
+
+# lines written per chunk
+CHUNK_LINES = 1024
+
+# casr_tb.vhd reads the constants of seed set 1 (casr30_seed1_c, ...), so
+# every seed set is written under these names
+TB_SEED_ID = "1"
+
+HEADER = """\
+--------------------------------------------------------------------------------
+-- Title       : casr test vectors inputs/outputs
+-- Project     : hdl_rand
+--------------------------------------------------------------------------------
+-- File        : casr_test_vectors_pkg.vhd
+-- Author      : Ameer Shalabi <ameershalabi94@gmail.com>
+-- Last update : {date}
+--------------------------------------------------------------------------------
+-------------------------------------------------------------------------------
+-- Description: casr package with test vectors
+--------------------------------------------------------------------------------
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+use ieee.math_real.all;
+
+package casr_test_vectors_pkg is
+
+"""
+
+FOOTER = """\
+end package casr_test_vectors_pkg;
+
+package body casr_test_vectors_pkg is
+
+end package body casr_test_vectors_pkg;"""
+
+
+def seed_constants(seed, rules):
+    """
+    Seed/rule constant declarations of one seed set, under the names
+    casr_tb.vhd reads whatever the seed set
+    """
+    names = [(f"{ARRAYS[g][0]}_seed{TB_SEED_ID}_c", w, seed) for g, w in SEED_SET]
+    names.append((f"casr90150h_rule{TB_SEED_ID}_c", 512, rules))
+    pad = max(len(name) for name, _, _ in names)
+    types = [f"std_logic_vector({width - 1} downto 0)" for _, width, _ in names]
+    type_pad = max(len(t) for t in types) + 1
+    decls = []
+    for (name, width, value), vec_type in zip(names, types):
+        decls.append(f"    constant {name:<{pad}} : {vec_type:<{type_pad}}"
+                     f":= x\"{value & ((1 << width) - 1):0{(width + 3) // 4}X}\";\n")
+    return "".join(decls)
+
+
+def write_array(f, generator, width, seed, rules, n_gen_rand):
+    """
+    Stream one vector array declaration to f. A single vector is
+    written as a named association, (x"...") is not an aggregate.
+    """
+    prefix, per_line = ARRAYS[generator]
+    hex_width = (width + 3) // 4
+    f.write(f"    type {prefix}_vectors_t is array (0 to n_gen_rand-1) of std_logic_vector({width - 1} downto 0);\n")
+    f.write(f"    constant {prefix}_vectors : {prefix}_vectors_t := (\n")
+    states = iter_states(generator, width, seed, rules, n_gen_rand)
+    n_lines = (n_gen_rand + per_line - 1) // per_line
+    for start in range(0, n_lines, CHUNK_LINES):
+        lines = []
+        for _ in range(min(CHUNK_LINES, n_lines - start)):
+            row = ",".join(f'x"{x:0{hex_width}X}"' for x in islice(states, per_line))
+            if n_gen_rand == 1:
+                row = "0 => " + row
+            lines.append("            " + row)
+        f.write(("" if start == 0 else ",\n") + ",\n".join(lines))
+    f.write("\n        );\n")
+
+
+def write_package(path, seed, rules=None, n_gen_rand=100):
+    """
+    Write the whole package for one seed set (512-bit seed, rules
+    defaulting to the seed rotated by 256 bits as in gen_tst_vectors)
+    """
+    if n_gen_rand < 1:
+        raise ValueError(f"n_gen_rand must be at least 1, got {n_gen_rand}")
+    seed = _as_int(seed) & ((1 << 512) - 1)
+    if rules is None:
+        rules = (seed >> 256) | ((seed & ((1 << 256) - 1)) << 256)
+    rules = _as_int(rules)
+    with open(path, "w") as f:
+        f.write(HEADER.format(date=time.strftime("%a %b %d %H:%M:%S %Y")))
+        f.write(seed_constants(seed, rules))
+        f.write(f"\n    constant n_gen_rand : integer := {n_gen_rand};\n")
+        for k, (generator, width) in enumerate(SEED_SET):
+            if k:
+                f.write("\n" if k == 1 else "\n\n")
+            write_array(f, generator, width, seed, rules, n_gen_rand)
+        f.write("\n\n" + FOOTER)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate casr_test_vectors_pkg.vhd")
+    parser.add_argument('-n', '--n-gen-rand', type=int, default=100, help='vectors per automaton')
+    parser.add_argument('--id', default="1", help='seed set of gen_tst_vectors to use (the constants keep the seed1 names casr_tb.vhd reads)')
+    parser.add_argument('--seed', help='512-bit seed in hex (default: seed set of --id in gen_tst_vectors)')
+    parser.add_argument('--rules', help='512-bit casr_90150h rule vector in hex')
+    parser.add_argument('-o', '--out', default='../tb/casr_test_vectors_pkg.vhd')
+    args = parser.parse_args(argv)
+    if args.n_gen_rand < 1:
+        parser.error("--n-gen-rand must be at least 1")
+
+    seed = args.seed
+    if seed is None:
+        seed = next(s['seed'] for s in DEFAULT_SETS if s['id'] == args.id)
+    print(write_package(args.out, seed, args.rules, args.n_gen_rand))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,667 @@
+"""
+Polynomials over GF(2) held as ints, bit i being the coefficient of x^i.
+
+Multiplication is carry-less, squaring spreads the bits through a byte
+table, and reduction folds the high part back through the taps when the
+modulus is sparse (trinomials, pentanomials) or clears one bit at a time
+otherwise. On top of that: gcd, square-free and distinct-degree
+factorization, irreducibility, the order of x and primitivity, which
+needs the prime factors of 2^d - 1 (mersenne_factors).
+"""
+import math
+import random
+from functools import reduce
+import numpy as np
+
+# byte -> its bits spread to the even positions of 16 bits, little-endian
+_SPREAD = [int(''.join('0' + c for c in format(b, '08b')), 2).to_bytes(2, 'little') for b in range(256)]
+_SPREAD16 = np.array([int.from_bytes(s, 'little') for s in _SPREAD], dtype='<u2')
+
+# from this many bytes on psqr looks the bytes up with NumPy
+NUMPY_BYTES = 64
+
+# moduli with at most this many nonzero terms are reduced by folding
+SPARSE_TERMS = 8
+
+X = 2
+
+
+def deg(f):
+    return f.bit_length() - 1
+
+
+def pmul(a, b):
+    """
+    Carry-less product
+    """
+    if a.bit_count() > b.bit_count():
+        a, b = b, a
+    result = 0
+    while a:
+        low = a & -a
+        result ^= b << (low.bit_length() - 1)
+        a ^= low
+    return result
+
+
+def psqr(a):
+    """
+    a^2, the bits of a moved to the even positions
+    """
+    data = a.to_bytes((a.bit_length() + 7) // 8, 'little')
+    if len(data) >= NUMPY_BYTES:
+        return int.from_bytes(_SPREAD16[np.frombuffer(data, dtype=np.uint8)].tobytes(), 'little')
+    return int.from_bytes(b''.join([_SPREAD[byte] for byte in data]), 'little')
+
+
+def _taps(f):
+    """
+    Exponents below the leading one of a sparse f
+    """
+    rest = f ^ (1 << deg(f))
+    taps = []
+    while rest:
+        low = rest & -rest
+        taps.append(low.bit_length() - 1)
+        rest ^= low
+    return taps
+
+
+def pmod(a, f):
+    """
+    a mod f
+    """
+    n = deg(f)
+    if n < 0:
+        raise ZeroDivisionError("polynomial modulo zero")
+    if f.bit_count() <= SPARSE_TERMS and n > 0:
+        taps = _taps(f)
+        mask = (1 << n) - 1
+        while a >> n:
+            high = a >> n
+            a &= mask
+            for t in taps:
+                a ^= high << t
+        return a
+    while True:
+        d = a.bit_length() - 1
+        if d < n:
+            return a
+        a ^= f << (d - n)
+
+
+def pdivmod(a, f):
+    """
+    Quotient and remainder
+    """
+    n = deg(f)
+    if n < 0:
+        raise ZeroDivisionError("polynomial division by zero")
+    q = 0
+    while True:
+        d = a.bit_length() - 1
+        if d < n:
+            return q, a
+        q |= 1 << (d - n)
+        a ^= f << (d - n)
+
+
+def pmulmod(a, b, f):
+    return pmod(pmul(a, b), f)
+
+
+def ppowmod(a, e, f):
+    """
+    a^e mod f
+    """
+    result = 1
+    a = pmod(a, f)
+    for bit in bin(e)[2:]:
+        result = pmod(psqr(result), f)
+        if bit == '1':
+            # multiplying by x is a shift
+            result = pmod(result << 1 if a == X else pmul(result, a), f)
+    return pmod(result, f)
+
+
+def x_pow2k(k, f):
+    """
+    x^(2^k) mod f, by k squarings
+    """
+    h = pmod(X, f)
+    for _ in range(k):
+        h = pmod(psqr(h), f)
+    return h
+
+
+def pgcd(a, b):
+    while b:
+        a, b = b, pmod(a, b)
+    return a
+
+
+def plcm(a, b):
+    return pdivmod(pmul(a, b), pgcd(a, b))[0]
+
+
+def pderiv(f):
+    """
+    Formal derivative, only the odd powers survive
+    """
+    even = int('01' * ((f.bit_length() + 1) // 2 + 1), 2)
+    return (f >> 1) & even
+
+
+def psqrt(f):
+    """
+    Square root of a polynomial with only even powers
+    """
+    bits = format(f, 'b')[::-1][::2]
+    return int(bits[::-1], 2) if bits else 0
+
+
+def squarefree(f):
+    """
+    [(g, e)] with f = prod g^e, the g square-free and pairwise coprime
+    """
+    factors = []
+    e = 1
+    while deg(f) > 0:
+        d = pderiv(f)
+        if d == 0:
+            # f is a square
+            f = psqrt(f)
+            e *= 2
+            continue
+        c = pgcd(f, d)
+        w = pdivmod(f, c)[0]
+        i = 1
+        while w != 1:
+            y = pgcd(w, c)
+            z = pdivmod(w, y)[0]
+            if z != 1:
+                factors.append((z, e * i))
+            i += 1
+            w = y
+            c = pdivmod(c, y)[0]
+        if c == 1:
+            break
+        f = psqrt(c)
+        e *= 2
+    return factors
+
+
+def distinct_degree(f):
+    """
+    [(d, g)] for square-free f, g the product of its irreducible factors
+    of degree d
+    """
+    blocks = []
+    h = pmod(X, f)
+    d = 0
+    while deg(f) >= 2 * (d + 1):
+        d += 1
+        h = pmod(psqr(h), f)
+        g = pgcd(h ^ X, f)
+        if g != 1:
+            blocks.append((d, g))
+            f = pdivmod(f, g)[0]
+            h = pmod(h, f)
+    if deg(f) > 0:
+        blocks.append((deg(f), f))
+    return blocks
+
+
+def factor_degrees(f):
+    """
+    [(degree, multiplicity, number of factors)] of the irreducible factors
+    of f
+    """
+    out = []
+    for g, e in squarefree(f):
+        for d, block in distinct_degree(g):
+            out.append((d, e, deg(block) // d))
+    return sorted(out)
+
+
+def _prime_divisors(n):
+    return [p for p in factor_int(n)]
+
+
+def is_irreducible(f):
+    """
+    Rabin's test
+    """
+    n = deg(f)
+    if n <= 0:
+        return False
+    if x_pow2k(n, f) != pmod(X, f):
+        return False
+    for q in _prime_divisors(n):
+        if pgcd(x_pow2k(n // q, f) ^ X, f) != 1:
+            return False
+    return True
+
+
+# integer factorization
+
+_SMALL_PRIMES = [p for p in range(2, 1000) if all(p % q for q in range(2, int(p ** 0.5) + 1))]
+
+
+def is_probable_prime(n):
+    """
+    Miller-Rabin with the first 20 prime bases
+    """
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES[:20]:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _SMALL_PRIMES[:20]:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_brent(n, max_iterations=1 << 22, seed=1):
+    """
+    A nontrivial factor of the composite n, None when none is found
+    within max_iterations
+    """
+    if n % 2 == 0:
+        return 2
+    rng = random.Random(seed)
+    y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+    g = r = q = 1
+    iterations = 0
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += m
+        r *= 2
+        iterations += r
+        if iterations > max_iterations:
+            return None
+    if g == n:
+        while True:
+            ys = (ys * ys + c) % n
+            g = math.gcd(abs(x - ys), n)
+            if g > 1:
+                break
+    return g if g != n else None
+
+
+def _primes_upto(limit):
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = b'\0\0'
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return [p for p in range(limit + 1) if sieve[p]]
+
+
+def _xdbl(x, z, a24, n):
+    s, d = (x + z) ** 2 % n, (x - z) ** 2 % n
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+def _xadd(xp, zp, xq, zq, xd, zd, n):
+    u = (xp - zp) * (xq + zq)
+    v = (xp + zp) * (xq - zq)
+    return zd * (u + v) ** 2 % n, xd * (u - v) ** 2 % n
+
+
+def _ladder(k, x, z, a24, n):
+    x0, z0, x1, z1 = x, z, *_xdbl(x, z, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            x0, z0 = _xadd(x1, z1, x0, z0, x, z, n)
+            x1, z1 = _xdbl(x1, z1, a24, n)
+        else:
+            x1, z1 = _xadd(x1, z1, x0, z0, x, z, n)
+            x0, z0 = _xdbl(x0, z0, a24, n)
+    return x0, z0
+
+
+def ecm(n, b1, curves, seed=1):
+    """
+    A nontrivial factor of the composite n by Lenstra's elliptic curve
+    method (Montgomery curves, Suyama parametrization, stage 2 up to
+    100 * b1), None when curves curves find none
+    """
+    rng = random.Random(seed)
+    stage1 = []
+    for p in _primes_upto(b1):
+        q = p
+        while q * p <= b1:
+            q *= p
+        stage1.append(q)
+    d = 210
+    b2 = 100 * b1
+    stage2 = [p for p in _primes_upto(b2) if p > b1]
+    for _ in range(curves):
+        sigma = rng.randrange(6, n - 1)
+        u, v = (sigma * sigma - 5) % n, 4 * sigma % n
+        x, z = pow(u, 3, n), pow(v, 3, n)
+        den = 16 * x * v % n
+        g = math.gcd(den, n)
+        if g != 1:
+            if g != n:
+                return g
+            continue
+        a24 = pow(v - u, 3, n) * (3 * u + v) * pow(den, -1, n) % n
+        for k in stage1:
+            x, z = _ladder(k, x, z, a24, n)
+        g = math.gcd(z, n)
+        if g == n:
+            continue
+        if g != 1:
+            return g
+        # stage 2: x(m d Q) against x(j Q) for the odd j < d
+        q2 = _xdbl(x, z, a24, n)
+        odd = {1: (x, z), 3: _xadd(*q2, x, z, x, z, n)}
+        for j in range(5, d, 2):
+            odd[j] = _xadd(*odd[j - 2], *q2, *odd[j - 4], n)
+        dq = _ladder(d, x, z, a24, n)
+        m = max(b1 // d, 2)
+        prev, r = _ladder((m - 1) * d, x, z, a24, n), _ladder(m * d, x, z, a24, n)
+        acc = 1
+        i = 0
+        while i < len(stage2):
+            while i < len(stage2) and stage2[i] < (m + 1) * d:
+                xj, zj = odd[abs(stage2[i] - m * d)]
+                acc = acc * (r[0] * zj - xj * r[1]) % n
+                i += 1
+            m += 1
+            prev, r = r, _xadd(*r, *dq, *prev, n)
+        g = math.gcd(acc, n)
+        if 1 < g < n:
+            return g
+    return None
+
+
+# (b1, curves) of the ecm passes after Pollard-Brent gives up
+ECM_EFFORT = ((2000, 25), (11000, 60))
+
+
+def factor_int(n, step=1, max_iterations=1 << 20, unresolved=None, ecm_effort=ECM_EFFORT):
+    """
+    {prime: exponent} of n. Trial division by the small primes and by
+    1 + k * step (every prime factor of a cyclotomic value Phi_d(2) is
+    1 mod d), then Pollard-Brent and ECM. Composites that survive
+    ecm_effort are returned as keys too and listed in unresolved when
+    given.
+    """
+    factors = {}
+
+    def add(p, e=1):
+        factors[p] = factors.get(p, 0) + e
+
+    for p in _SMALL_PRIMES:
+        while n % p == 0:
+            add(p)
+            n //= p
+    if step > 1:
+        p = step + 1
+        limit = min(1 << 20, int(math.isqrt(n)) + 1) if n > 1 else 0
+        while p <= limit and n > 1:
+            while n % p == 0:
+                add(p)
+                n //= p
+            p += step
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_probable_prime(m):
+            add(m)
+            continue
+        root = math.isqrt(m)
+        if root * root == m:
+            stack += [root, root]
+            continue
+        d = pollard_brent(m, max_iterations)
+        for b1, curves in ecm_effort:
+            if d is not None:
+                break
+            d = ecm(m, b1, curves)
+        if d is None:
+            add(m)
+            if unresolved is not None:
+                unresolved.append(m)
+            continue
+        stack += [d, m // d]
+    return factors
+
+
+_mersenne_cache = {}
+
+
+def cyclotomic_value(d):
+    """
+    Phi_d(2)
+    """
+    num, den = 1, 1
+    for j in range(1, d + 1):
+        if d % j == 0:
+            mu = _mobius(d // j)
+            if mu == 1:
+                num *= (1 << j) - 1
+            elif mu == -1:
+                den *= (1 << j) - 1
+    return num // den
+
+
+def _mobius(n):
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def mersenne_factors(d, max_iterations=1 << 20, ecm_effort=ECM_EFFORT):
+    """
+    {prime: exponent} of 2^d - 1, factoring its cyclotomic parts Phi_k(2),
+    k | d, separately. The second value lists the composites that could
+    not be split (their keys then stand for unknown primes). Results are
+    cached per d, whatever the effort.
+    """
+    if d in _mersenne_cache:
+        return _mersenne_cache[d]
+    factors = {}
+    unresolved = []
+    for k in range(1, d + 1):
+        if d % k:
+            continue
+        value = cyclotomic_value(k)
+        for p, e in factor_int(value, step=k if k > 2 else 1, max_iterations=max_iterations,
+                               unresolved=unresolved, ecm_effort=ecm_effort).items():
+            factors[p] = factors.get(p, 0) + e
+    factors.pop(1, None)
+    _mersenne_cache[d] = (factors, unresolved)
+    return factors, unresolved
+
+
+def known_factors(d, primes):
+    """
+    Seed the cache of 2^d - 1 with known prime factors (such as those of
+    the Cunningham tables). Every factor is checked; whatever they leave
+    is factored as usual, so a partial list still helps.
+    """
+    n = (1 << d) - 1
+    factors = {}
+    for p in primes:
+        p = int(p)
+        if p < 2 or n % p or not is_probable_prime(p):
+            raise ValueError(f"{p} is not a prime factor of 2^{d}-1")
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    unresolved = []
+    for p, e in factor_int(n, unresolved=unresolved).items():
+        factors[p] = factors.get(p, 0) + e
+    factors.pop(1, None)
+    _mersenne_cache[d] = (factors, unresolved)
+    return factors, unresolved
+
+
+def read_factor_table(path):
+    """
+    {k: (status, primes)} of a table of known prime factors of Phi_k(2),
+    one "k status p1 p2 ..." line per k (# starts a comment). status
+    tells what Phi_k(2) divided by the primes leaves: 1 nothing, P a
+    probable prime, C a composite nobody has split.
+    """
+    table = {}
+    with open(path) as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            k, status, *primes = line.split()
+            table[int(k)] = (status, [int(p) for p in primes])
+    return table
+
+
+def cyclotomic_factors(k, status, primes):
+    """
+    {prime: exponent} of Phi_k(2) from a factor table line, and the
+    composite left (None when the factorization is complete)
+    """
+    rest = cyclotomic_value(k)
+    factors = {}
+    for p in primes:
+        if rest % p:
+            raise ValueError(f"{p} does not divide Phi_{k}(2)")
+        while rest % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            rest //= p
+    if status == '1':
+        if rest != 1:
+            raise ValueError(f"Phi_{k}(2) is not the product of its listed primes")
+        return factors, None
+    if rest == 1:
+        raise ValueError(f"Phi_{k}(2) has nothing left past its listed primes")
+    if status == 'P':
+        factors[rest] = 1
+        return factors, None
+    factors[rest] = 1
+    return factors, rest
+
+
+def load_factor_table(table):
+    """
+    Fill the cache of 2^d - 1 from a read_factor_table() table, for every
+    d whose divisors it covers, so mersenne_factors does no factoring for
+    them. The listed primes are taken as they are.
+    """
+    parts = {k: cyclotomic_factors(k, *line) for k, line in table.items()}
+    for d in range(1, max(table) + 1):
+        divisors = [k for k in range(1, d + 1) if d % k == 0]
+        if not all(k in parts for k in divisors):
+            continue
+        factors = {}
+        unresolved = []
+        for k in divisors:
+            part, rest = parts[k]
+            for p, e in part.items():
+                factors[p] = factors.get(p, 0) + e
+            if rest is not None:
+                unresolved.append(rest)
+        factors.pop(1, None)
+        _mersenne_cache[d] = (factors, unresolved)
+
+
+def _order_in(g, d):
+    """
+    Order of x modulo g, a product of distinct irreducibles of degree d.
+    Returns (order, exact).
+    """
+    if deg(g) == 1 and g == X:
+        raise ValueError("x is not invertible modulo x")
+    if d == 1:
+        return 1, True
+    factors, unresolved = mersenne_factors(d)
+    order = (1 << d) - 1
+    for q in factors:
+        while order % q == 0 and ppowmod(X, order // q, g) == 1:
+            order //= q
+    return order, not unresolved
+
+
+def order(f):
+    """
+    Order of x modulo f, f(0) = 1: the least e with x^e = 1 mod f, which
+    is the cycle length of an LFSR or linear CA with that polynomial.
+    Returns (order, exact), exact being False when a factor of some
+    2^d - 1 stayed unfactored (order is then a multiple of the true one).
+    """
+    if not f & 1:
+        raise ValueError("order needs f(0) = 1")
+    result, exact = 1, True
+    for g, e in squarefree(f):
+        # ord(g^e) = ord(g) * 2^ceil(log2 e)
+        o = 1 << (e - 1).bit_length()
+        for d, block in distinct_degree(g):
+            block_order, ok = _order_in(block, d)
+            o = math.lcm(o, block_order)
+            exact &= ok
+        result = math.lcm(result, o)
+    return result, exact
+
+
+def is_primitive(f):
+    """
+    Whether f is primitive: irreducible of degree n with x of order
+    2^n - 1. Raises ValueError when 2^n - 1 could not be fully factored.
+    """
+    n = deg(f)
+    if n < 1 or not f & 1 or not is_irreducible(f):
+        return False
+    if n == 1:
+        return f == 3
+    factors, unresolved = mersenne_factors(n)
+    if unresolved:
+        raise ValueError(f"2^{n}-1 not fully factored, cofactors {unresolved}")
+    period = (1 << n) - 1
+    return all(ppowmod(X, period // q, f) != 1 for q in factors)
+
+
+def poly_str(f):
+    terms = [("1" if i == 0 else "x" if i == 1 else f"x^{i}") for i in range(deg(f), -1, -1) if f >> i & 1]
+    return " + ".join(terms) or "0"
+
+
+def product(polys):
+    return reduce(pmul, polys, 1)
+
+
+# Example usage
+if __name__ == "__main__":
+    for f in (0b10011, 0b11111, (1 << 127) | 2 | 1, (1 << 64) | 0b11011):
+        print(poly_str(f), "irreducible:", is_irreducible(f), "primitive:", is_primitive(f),
+              "order:", order(f)[0])
@@ -0,0 +1,256 @@
+"""
+Binary golden-vector files.
+
+Layout (all little-endian):
+  0   header, 64 bytes: magic b'RNGVEC01', version (u16), reserved (u16),
+      width in bits (u32), record size in bytes (u32), count (u64),
+      offset of the first record (u64), generator name (16 bytes ascii)
+  64  seed, one record
+      rules, one record (0 when the generator has none)
+      zero padding up to the next multiple of 64
+  data_offset
+      count records of record size bytes, a record being one state as
+      a little-endian integer (bit i = cell i) padded to whole 64-bit
+      words, so the data is a (count, record_size // 8) uint64 array
+
+vector_file maps a file read-only, giving vector k without reading the
+others. The converters go to and from the casr_tst_vectors text files and
+the helper.prep_out list of x"..." literals.
+"""
+import mmap
+import os
+import re
+import struct
+from itertools import islice
+import numpy as np
+from helper import ints_to_bits, ints_to_vhdl_hex, vhdl_hex_to_ints
+
+MAGIC = b'RNGVEC01'
+VERSION = 1
+HEADER = struct.Struct('<8sHHIIQQ16s12x')
+ALIGN = 64
+
+# vectors per write
+CHUNK = 4096
+
+_HEX_LITERAL = re.compile(r'x"([0-9A-Fa-f]+)"')
+
+
+def record_size(width):
+    """
+    Bytes per record of a width bit state
+    """
+    return (width + 63) // 64 * 8
+
+
+class vector_writer:
+    """
+    Stream states to a new vector file, the count is written on close.
+
+      with vector_writer(path, 512, 'h', seed, rules) as w:
+          for x in states:
+              w.write(x)
+    """
+
+    def __init__(self, path, width, generator='', seed=0, rules=0):
+        self.path = path
+        self.width = width
+        self.generator = generator
+        self.record_size = record_size(width)
+        self.mask = (1 << width) - 1
+        self.count = 0
+        self.data_offset = -(-(HEADER.size + 2 * self.record_size) // ALIGN) * ALIGN
+        self._pending = []
+        self.f = open(path, 'wb')
+        self.f.write(self._header())
+        self.f.write((seed & self.mask).to_bytes(self.record_size, 'little'))
+        self.f.write((rules & self.mask).to_bytes(self.record_size, 'little'))
+        self.f.write(bytes(self.data_offset - HEADER.size - 2 * self.record_size))
+
+    def _header(self):
+        return HEADER.pack(MAGIC, VERSION, 0, self.width, self.record_size, self.count,
+                           self.data_offset, self.generator.encode('ascii')[:16])
+
+    def write(self, x):
+        self._pending.append(x & self.mask)
+        if len(self._pending) >= CHUNK:
+            self.flush()
+
+    def write_many(self, states):
+        for x in states:
+            self.write(x)
+
+    def write_words(self, words):
+        """
+        Write a (k, record_size // 8) uint64 array of packed states
+        """
+        self.flush()
+        words = np.ascontiguousarray(words, dtype='<u8')
+        self.f.write(words.tobytes())
+        self.count += len(words)
+
+    def flush(self):
+        if self._pending:
+            rs = self.record_size
+            self.f.write(b''.join(x.to_bytes(rs, 'little') for x in self._pending))
+            self.count += len(self._pending)
+            self._pending = []
+
+    def close(self):
+        if self.f.closed:
+            return
+        self.flush()
+        self.f.seek(0)
+        self.f.write(self._header())
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class vector_file:
+    """
+    Read-only view of a vector file. vf[k] is state k as an int, vf.words
+    the memory mapped (count, record_size // 8) uint64 array.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            head = f.read(HEADER.size)
+            (magic, version, _, self.width, self.record_size, self.count,
+             self.data_offset, generator) = HEADER.unpack(head)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a vector file")
+            if version != VERSION:
+                raise ValueError(f"Unsupported vector file version {version}")
+            self.generator = generator.rstrip(b'\0').decode('ascii')
+            rs = self.record_size
+            self.seed = int.from_bytes(f.read(rs), 'little')
+            self.rules = int.from_bytes(f.read(rs), 'little')
+            size = os.fstat(f.fileno()).st_size
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        if self.data_offset + self.count * self.record_size > size:
+            raise ValueError(f"{path} is truncated")
+        self.words = np.memmap(path, dtype='<u8', mode='r', offset=self.data_offset,
+                               shape=(self.count, self.record_size // 8)) if self.count else \
+            np.zeros((0, self.record_size // 8), dtype='<u8')
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(self.count))]
+        k = range(self.count)[k]
+        start = self.data_offset + k * self.record_size
+        return int.from_bytes(self._mm[start:start + self.record_size], 'little')
+
+    def __iter__(self):
+        return self.iter_ints()
+
+    def iter_ints(self, start=0):
+        """
+        States from start on as ints, read a chunk at a time
+        """
+        rs = self.record_size
+        for k in range(start, self.count, CHUNK):
+            n = min(CHUNK, self.count - k)
+            offset = self.data_offset + k * rs
+            block = self._mm[offset:offset + n * rs]
+            for i in range(0, n * rs, rs):
+                yield int.from_bytes(block[i:i + rs], 'little')
+
+    def bits(self, k):
+        """
+        State k as a list of bits, LSB at index 0
+        """
+        return ints_to_bits([self[k]], self.width)[0].tolist()
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self.words = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def text_to_binary(txt_path, bin_path, generator=None):
+    """
+    Convert a casr_seed{id}_vectors_{generator}.txt file. The generator
+    defaults to the file name suffix, the width comes from the seed lines.
+    """
+    if generator is None:
+        generator = os.path.splitext(os.path.basename(txt_path))[0].rsplit('_', 1)[-1]
+    with open(txt_path) as f:
+        lines = iter(f)
+        if next(lines).strip() != '(':
+            raise ValueError(f"{txt_path} does not start with a VHDL array")
+        values = []
+        for line in lines:
+            line = line.strip()
+            if line.startswith(')'):
+                break
+            values.append(int(_HEX_LITERAL.search(line).group(1), 16))
+        trailer = [line.strip() for line in lines if line.strip()]
+    width = len(trailer[1])
+    seed = int(trailer[1], 2)
+    rules = int(trailer[4], 2) if len(trailer) >= 6 else 0
+    with vector_writer(bin_path, width, generator, seed, rules) as w:
+        w.write_many(values)
+    return bin_path
+
+
+def binary_to_text(bin_path, txt_path, indent="    "):
+    """
+    Write a vector file back in the casr_tst_vectors text format
+    """
+    from gen_tst_vectors import trailer_lines
+    with vector_file(bin_path) as vf, open(txt_path, 'w') as f:
+        hex_width = (vf.width + 3) // 4
+        f.write("(\n")
+        states = vf.iter_ints()
+        for start in range(0, vf.count, CHUNK):
+            lines = [f'{indent}x"{x:0{hex_width}X}"' for x in islice(states, CHUNK)]
+            f.write(("" if start == 0 else ",\n") + ",\n".join(lines))
+        f.write("\n);\n" if vf.count else ");\n")
+        lines = trailer_lines(vf.seed, vf.width)
+        if vf.generator == 'h':
+            lines += trailer_lines(vf.rules, vf.width)
+        f.write("\n".join(lines) + "\n")
+    return txt_path
+
+
+def from_prep_out(hex_values, path, width, generator='', seed=0, rules=0):
+    """
+    Write the x"..." literals returned by helper.prep_out to a vector file
+    """
+    with vector_writer(path, width, generator, seed, rules) as w:
+        w.write_many(vhdl_hex_to_ints(hex_values))
+    return path
+
+
+def to_prep_out(path, start=0, stop=None):
+    """
+    States start..stop of a vector file as helper.prep_out literals
+    """
+    with vector_file(path) as vf:
+        stop = vf.count if stop is None else min(stop, vf.count)
+        return ints_to_vhdl_hex(islice(vf.iter_ints(start), max(0, stop - start)), vf.width)
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+    for txt in sys.argv[1:]:
+        out = os.path.splitext(txt)[0] + '.bin'
+        text_to_binary(txt, out)
+        print(out, os.path.getsize(txt), '->', os.path.getsize(out), 'bytes')
@@ -1,51 +1,116 @@
+import numpy as np
+
+# maps the 0/1 bytes of a bit row to the ascii '0'/'1'
+_ASCII_TABLE = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _bit_matrix(array2d):
+    """
+    Rows of bits as a (rows, n) uint8 array, None when the rows differ in
+    length. Raises ValueError for anything but 0s and 1s.
+    """
+    if isinstance(array2d, np.ndarray):
+        if array2d.ndim != 2:
+            return None
+        if array2d.dtype != np.uint8 and not ((array2d == 0) | (array2d == 1)).all():
+            raise ValueError("Input must contain only 0s and 1s")
+        a = array2d.astype(np.uint8, copy=False)
+    else:
+        rows = list(array2d)
+        if len(set(map(len, rows))) > 1:
+            return None
+        try:
+            data = b"".join(map(bytes, rows))
+        except (TypeError, ValueError):
+            raise ValueError("Input must contain only 0s and 1s")
+        a = np.frombuffer(data, dtype=np.uint8).reshape(len(rows), len(rows[0]) if rows else 0)
+    if (a > 1).any():
+        raise ValueError("Input must contain only 0s and 1s")
+    return a
+
+def bits_to_ints(array2d):
+    """
+    Pack rows of bits (LSB at index 0) into a list of ints
+    """
+    a = _bit_matrix(array2d)
+    if a is None:
+        return [bits_to_ints([row])[0] for row in array2d]
+    packed = np.packbits(a, axis=1, bitorder="little")
+    n_bytes = packed.shape[1]
+    if n_bytes == 0:
+        return [0] * len(a)
+    data = packed.tobytes()
+    return [int.from_bytes(data[i:i + n_bytes], "little") for i in range(0, len(data), n_bytes)]
+
+def ints_to_bits(values, width):
+    """
+    Unpack the width low bits of every int into a (len(values), width)
+    uint8 array, LSB at index 0
+    """
+    if width <= 0:
+        raise ValueError("Width must be a positive integer")
+    n_bytes = (width + 7) // 8
+    mask = (1 << width) - 1
+    data = b"".join((int(v) & mask).to_bytes(n_bytes, "little") for v in values)
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, n_bytes)
+    return np.unpackbits(rows, axis=1, count=width, bitorder="little")
+
+def ints_to_vhdl_hex(values, width):
+    """
+    VHDL hex literals (x"...", upper case, zero padded) of the width low
+    bits of every int
+    """
+    if width <= 0:
+        raise ValueError("Width must be a positive integer")
+    hex_width = (width + 3) // 4
+    n_bytes = (hex_width + 1) // 2
+    mask = (1 << width) - 1
+    digits = b"".join((int(v) & mask).to_bytes(n_bytes, "big") for v in values).hex().upper()
+    # an odd number of hex digits drops the leading 0 of every record
+    step = 2 * n_bytes
+    skip = step - hex_width
+    return [f'x"{digits[i + skip:i + step]}"' for i in range(0, len(digits), step)]
+
+def vhdl_hex_to_ints(literals):
+    """
+    Values of VHDL hex literals such as x"1F"
+    """
+    return [int(lit.strip().lstrip("xX").strip('"'), 16) for lit in literals]
+
 def array2d_to_std(array2d):
     """
     Reverse order of a list of bits LSB at index 0 to MSB at index 0
     """
-    new_2d_arr = []
-    for arr in array2d:
-        new_arr = []
-        for i in arr:
-            new_arr.insert(0, i)
-        new_2d_arr.append(new_arr)
-    return new_2d_arr
+    return [list(arr)[::-1] for arr in array2d]
 
 def arr2d_to_strings(arr):
     """
     Convert a list into a string
     """
-    return ["".join(map(str, row)) for row in arr]
+    strings = []
+    for row in arr:
+        try:
+            s = bytes(row).translate(_ASCII_TABLE).decode()
+            if s.count("0") + s.count("1") != len(s):
+                raise ValueError
+        except (TypeError, ValueError, UnicodeDecodeError):
+            s = "".join(map(str, row))
+        strings.append(s)
+    return strings
 
 def out_2_str(arr):
     """
     Reverse order of a list of bits LSB at index 0 to MSB at index 0
     """
-    return arr2d_to_strings(array2d_to_std(arr))
+    return [s[::-1] for s in arr2d_to_strings(arr)]
 
 def bits_lsb_to_vhdl_hex(bits):
     """
     Convert a list of bits (LSB at index 0) to a VHDL hex literal.
     Pads with 0s on the MSB side if bit-length is not a multiple of 4.
     """
-    if not all(b in (0, 1) for b in bits):
-        raise ValueError("Input must contain only 0s and 1s")
-
-    # Number of hex digits needed
-    hex_width = (len(bits) + 3) // 4
-
-    # Pad with zeros on MSB side
-    padded_len = hex_width * 4
-    padded_bits = bits + [0] * (padded_len - len(bits))
-
-    # Convert to MSB-first binary string
-    bin_str = "".join(str(b) for b in reversed(padded_bits))
-
-    # Binary → integer
-    value = int(bin_str, 2)
-
-    # Format integer separately, then wrap in VHDL syntax
-    hex_str = format(value, f"0{hex_width}X")
-    return f'x"{hex_str}"'
+    value = bits_to_ints([bits])[0]
+    return ints_to_vhdl_hex([value], len(bits))[0]
 
 def bin_to_vhdl_hex(bin_list, width):
     """
@@ -54,29 +119,35 @@ def bin_to_vhdl_hex(bin_list, width):
     if width <= 0:
         raise ValueError("Width must be a positive integer")
 
-    hex_width = (width + 3) // 4  # number of hex digits
-
-    result = []
+    values = []
     for b in bin_list:
-        if not set(b).issubset({"0", "1"}):
+        if b.replace("0", "").replace("1", ""):
             raise ValueError(f"Invalid binary string: {b}")
 
         if len(b) > width:
             raise ValueError(f"Binary string longer than width ({width}): {b}")
 
-        padded = b.zfill(width)                   # pad MSB side
-        value = int(padded, 2)                    # binary → int
-        hex_digits = format(value, f"0{hex_width}X")  # leading zeros
-
-        result.append(f'x"{hex_digits}"')
+        values.append(int(b or "0", 2))
 
-    return result
+    return ints_to_vhdl_hex(values, width)
 
 def prep_out(arr,w):
     """
     Take an output and convert it into a list of hex
     """
-    return bin_to_vhdl_hex(out_2_str(arr),w)
+    if w <= 0:
+        raise ValueError("Width must be a positive integer")
+    if hasattr(arr, "vhdl_hex"):
+        # casr_packed.packed_states, converted without unpacking
+        return arr.vhdl_hex(w)
+    try:
+        bits = _bit_matrix(arr)
+    except ValueError:
+        bits = None
+    if bits is None or bits.shape[1] > w:
+        # ragged or invalid rows take the string path and its errors
+        return bin_to_vhdl_hex(out_2_str(arr), w)
+    return ints_to_vhdl_hex(bits_to_ints(bits), w)
 
 #bits = [0,1,0,1,1,1,0,0,1,0,0,1,1,1,1,0]
 #print(bits_lsb_to_vhdl_hex(bits))
@@ -6,7 +6,7 @@
 -- Author      : Ameer Shalabi <ameershalabi94@gmail.com>
 -- Company     : -
 -- Created     : Wed Nov 11 08:47:34 2020
--- Last update : Sat Mar 16 17:52:24 2024
+-- Last update : Sun Oct 18 10:12:40 2026
 -- Platform    : -
 -- Standard    : <VHDL-2008>
 -------------------------------------------------------------------------------
@@ -18,6 +18,8 @@
 library ieee;
 use ieee.std_logic_1164.all;
 
+use work.lfsr_taps_pkg.all;
+
 entity LFSR_generic is
 	generic(LFSR_len : natural := 12);
 	port (
@@ -32,44 +34,12 @@ entity LFSR_generic is
 end entity LFSR_generic;
 
 architecture LFSR_generic_arch of LFSR_generic is
-	type XOR_placment_Type is array(2 to 32) of std_logic_vector(31 downto 0);
-
-	constant XOR_placment_ROM : XOR_placment_Type := (
-			"00000000000000000000000000000011",
-			"00000000000000000000000000000101",
-			"00000000000000000000000000001001",
-			"00000000000000000000000000010010",
-			"00000000000000000000000000100001",
-			"00000000000000000000000001000001",
-			"00000000000000000000000010001110",
-			"00000000000000000000000100001000",
-			"00000000000000000000001000000100",
-			"00000000000000000000010000000010",
-			"00000000000000000000100000101001",
-			"00000000000000000001000000001101",
-			"00000000000000000010000000010101",
-			"00000000000000000100000000000001",
-			"00000000000000001000000000010110",
-			"00000000000000010000000000000100",
-			"00000000000000100000000001000000",
-			"00000000000001000000000000010011",
-			"00000000000010000000000000000100",
-			"00000000000100000000000000000010",
-			"00000000001000000000000000000001",
-			"00000000010000000000000000010000",
-			"00000000100000000000000000001101",
-			"00000001000000000000000000000100",
-			"00000010000000000000000000100011",
-			"00000100000000000000000000010011",
-			"00001000000000000000000000000100",
-			"00010000000000000000000000000010",
-			"00100000000000000000000000101001",
-			"01000000000000000000000000000100",
-			"10000000000000000000000001100010"
-		);
-	constant XOR_placment : std_logic_vector(LFSR_len-1 downto 0) := XOR_placment_ROM(LFSR_len)(LFSR_len-1 downto 0);
+	-- tap ROM of lfsr_taps_pkg, lengths 2 to LFSR_MAX_LEN
+	constant XOR_placment : std_logic_vector(LFSR_len-1 downto 0) := xor_placment_of(LFSR_len);
 
 	signal LFSR_Reg  : std_logic_vector(LFSR_len-1 downto 0);
+	-- feedback straight from the top bit, a register here would make an
+	-- (L+1)-bit LFSR that is not maximal length
 	signal LFSR_feed : std_logic;
 
 begin
@@ -78,14 +48,11 @@ begin
 	begin
 		if (rst='0') then
 			LFSR_Reg <= XOR_placment;
-			LFSR_feed <= '0';
 		elsif rising_edge(clk) then
-			LFSR_feed <= '0';
 			if load = '1' then
 				LFSR_Reg <= load_data;
 			end if;
 			if gen_e = '1' then
-				LFSR_feed <= LFSR_Reg(LFSR_len-1);
 				for gate in LFSR_len-1 downto 1 loop
 					if (XOR_placment(gate-1)='1') then
 						LFSR_Reg(gate) <= LFSR_Reg(gate-1) xor LFSR_feed;
@@ -97,5 +64,6 @@ begin
 			end if;
 		end if;
 	end process;
-	LFSR_out <= LFSR_Reg;
+	LFSR_feed <= LFSR_Reg(LFSR_len-1);
+	LFSR_out  <= LFSR_Reg;
 end LFSR_generic_arch;
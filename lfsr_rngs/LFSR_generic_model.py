@@ -0,0 +1,267 @@
+"""
+Word-level model of LFSR_generic.vhdl, the LFSR core of the generators in
+this folder, and the parts the generator models share.
+
+LFSR_generic is a Galois LFSR on the tap ROM polynomial, LFSR_feed being
+wired to the top bit of LFSR_Reg. With bit i of an int holding
+LFSR_Reg(i), one clock with gen_e set is
+
+  reg  <- ((reg << 1) & mask) xor (reg(LFSR_len-1) ? ((XOR_placment << 1) | 1) & mask : 0)
+
+and gen_e wins over load.
+
+registered_feed=True models the earlier core, which registered LFSR_feed
+so that the top bit reached the taps one clock late,
+
+  reg  <- ((reg << 1) & mask) xor (feed ? ((XOR_placment << 1) | 1) & mask : 0)
+  feed <- reg(LFSR_len-1)
+
+feed being cleared with gen_e clear. That is an (L+1)-bit LFSR and not
+maximal length. REGISTERED_FEED is the default, the LFSR_generic.vhdl in
+this tree.
+
+Registers are NumPy uint64 arrays, so one model clocks any number of
+LFSRs (or generator instances, one per seed) at once.
+"""
+import json
+import os
+from abc import ABC, abstractmethod
+import numpy as np
+
+# entries 2..32 of the lfsr_taps_pkg tap ROM (the original XOR_placment_ROM), entry LFSR_len
+XOR_placment_ROM = dict(zip(range(2, 33), (int(v, 2) for v in (
+    "00000000000000000000000000000011",
+    "00000000000000000000000000000101",
+    "00000000000000000000000000001001",
+    "00000000000000000000000000010010",
+    "00000000000000000000000000100001",
+    "00000000000000000000000001000001",
+    "00000000000000000000000010001110",
+    "00000000000000000000000100001000",
+    "00000000000000000000001000000100",
+    "00000000000000000000010000000010",
+    "00000000000000000000100000101001",
+    "00000000000000000001000000001101",
+    "00000000000000000010000000010101",
+    "00000000000000000100000000000001",
+    "00000000000000001000000000010110",
+    "00000000000000010000000000000100",
+    "00000000000000100000000001000000",
+    "00000000000001000000000000010011",
+    "00000000000010000000000000000100",
+    "00000000000100000000000000000010",
+    "00000000001000000000000000000001",
+    "00000000010000000000000000010000",
+    "00000000100000000000000000001101",
+    "00000001000000000000000000000100",
+    "00000010000000000000000000100011",
+    "00000100000000000000000000010011",
+    "00001000000000000000000000000100",
+    "00010000000000000000000000000010",
+    "00100000000000000000000000101001",
+    "01000000000000000000000000000100",
+    "10000000000000000000000001100010",
+))))
+
+_ONE = np.uint64(1)
+
+# bit reversed value of every byte
+_REV8 = np.array([int(f'{b:08b}'[::-1], 2) for b in range(256)], dtype=np.uint8)
+
+
+# lfsr_taps_pkg.vhd is generated from this cache of tools/primitive_taps.py
+TAPS_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lfsr_taps.json')
+
+# the registers are uint64
+MAX_LENGTH = 64
+
+# LFSR_generic.vhdl takes LFSR_feed straight from LFSR_Reg
+REGISTERED_FEED = False
+
+_taps_cache = None
+
+
+def xor_placment(length):
+    """
+    XOR_placment constant of an LFSR_generic of length LFSR_len, the
+    lengths past 32 coming from the lfsr_taps_pkg tap ROM
+    """
+    global _taps_cache
+    if length in XOR_placment_ROM:
+        return XOR_placment_ROM[length] & ((1 << length) - 1)
+    if _taps_cache is None:
+        with open(TAPS_JSON) as f:
+            _taps_cache = json.load(f)
+    if not 2 <= length <= MAX_LENGTH or str(length) not in _taps_cache:
+        raise ValueError(f"LFSR_len must be in 2..{MAX_LENGTH} and in the tap ROM, got {length}")
+    placment = 1 << (length - 1)
+    for e in _taps_cache[str(length)]['exponents']:
+        placment |= 1 << (e - 1)
+    return placment
+
+
+def reverse_bits(x, width):
+    """
+    Reverse the low width bits of every word of a uint64 array, i.e.
+    bit i goes to bit width-1-i
+    """
+    x = np.ascontiguousarray(x, dtype='<u8')
+    rev = _REV8[x.view(np.uint8)].reshape(x.shape + (8,))[..., ::-1]
+    rev = np.ascontiguousarray(rev).view('<u8').reshape(x.shape)
+    return rev.astype(np.uint64) >> np.uint64(64 - width)
+
+
+class LFSR_generic:
+    """
+    An array of LFSR_generic instances of the same LFSR_len.
+
+    shape: shape of the register arrays, () for a single LFSR
+    reg: LFSR_Reg (LFSR_out) of each instance
+    feed: LFSR_feed of each instance, with registered_feed
+    """
+
+    def __init__(self, length, shape=(), registered_feed=REGISTERED_FEED):
+        self.length = length
+        self.registered_feed = registered_feed
+        self.taps = xor_placment(length)
+        self.mask = np.uint64((1 << length) - 1)
+        # LFSR_Reg(0) always takes the feed, LFSR_Reg(i) where XOR_placment(i-1) is set
+        self.feed_mask = np.uint64(((self.taps << 1) | 1) & ((1 << length) - 1))
+        self.top = np.uint64(length - 1)
+        self.shape = shape
+        self.reset()
+
+    def reset(self):
+        self.reg = np.full(self.shape, self.taps, dtype=np.uint64)
+        self.feed = np.zeros(self.shape, dtype=np.uint64)
+
+    def clock(self, load=False, load_data=0, gen_e=True):
+        """
+        One rising clock edge. load is a shared flag, load_data and gen_e
+        broadcast against the register shape.
+        """
+        reg = self.reg
+        feed = self.feed if self.registered_feed else reg >> self.top
+        stepped = ((reg << _ONE) & self.mask) ^ (feed * self.feed_mask)
+        held = reg
+        if load:
+            held = np.broadcast_to(np.asarray(load_data, dtype=np.uint64) & self.mask, self.shape)
+        if np.ndim(gen_e) == 0:
+            if gen_e:
+                self.reg, self.feed = stepped, reg >> self.top
+            else:
+                self.reg, self.feed = held.copy(), np.zeros(self.shape, dtype=np.uint64)
+            return self.reg
+        self.reg = np.where(gen_e, stepped, held)
+        self.feed = np.where(gen_e, reg >> self.top, np.uint64(0))
+        return self.reg
+
+    def generate(self, count):
+        """
+        LFSR_out after each of count clocks with gen_e high, as a
+        (count, *shape) array
+        """
+        out = np.empty((count,) + tuple(self.shape), dtype=np.uint64)
+        for k in range(count):
+            out[k] = self.clock()
+        return out
+
+
+class lfsr_block(ABC):
+    """
+    Input register stage (enb_r, clr_r, init_r, init_data_r) and run
+    protocol shared by bit_select_rand, select_slide_rand and lfsr_ring.
+
+    seeds: init_data_i of each instance, one instance per seed
+    width: width of init_data_r
+    registered_feed: LFSR_feed of the LFSR_generic cores, see LFSR_generic
+
+    A subclass implements clock() for one rising edge of the whole block
+    and _init_completes(), which tells whether the coming edge sets
+    init_done_r.
+    """
+
+    def __init__(self, seeds, width, registered_feed=REGISTERED_FEED):
+        self.registered_feed = registered_feed
+        self.width = width
+        self.data_mask = np.uint64((1 << width) - 1)
+        self.seeds = np.atleast_1d(np.asarray(seeds, dtype=np.uint64)) & self.data_mask
+        self.n_seeds = len(self.seeds)
+        self.reset()
+
+    def reset(self):
+        """
+        State while rst is low
+        """
+        self.enb_r = False
+        self.clr_r = False
+        self.init_r = False
+        self.init_data_r = np.zeros(self.n_seeds, dtype=np.uint64)
+        self.init_done_r = False
+        self.enb_gen_r = False
+
+    def _input_stage(self, enb, clr, init_i, init_data_i):
+        """
+        Next (enb_r, clr_r, init_r, init_data_r) of input_reg_proc
+        """
+        init_r, init_data_r = self.init_r, self.init_data_r
+        if self.enb_r:
+            if init_data_i is None:
+                init_data_i = self.seeds
+            init_r = bool(init_i)
+            init_data_r = np.broadcast_to(np.asarray(init_data_i, dtype=np.uint64) & self.data_mask,
+                                          (self.n_seeds,))
+            if self.clr_r:
+                init_r = False
+                init_data_r = np.zeros(self.n_seeds, dtype=np.uint64)
+        return bool(enb), bool(clr), init_r, init_data_r
+
+    @property
+    def init_done_o(self):
+        return self.init_done_r
+
+    @abstractmethod
+    def _init_completes(self):
+        """
+        Whether the coming edge sets init_done_r
+        """
+
+    @abstractmethod
+    def clock(self, enb=True, clr=False, init_i=False, init_data_i=None):
+        """
+        One rising edge of the whole block, returns output_rand_o
+        """
+
+    def init(self, max_cycles=64):
+        """
+        Clock the block from reset until generation starts: enb high,
+        init_data_i = seeds, init_i high until the edge that sets
+        init_done_r and low from that edge on (holding it longer makes
+        bit_select_rand reload its cleared init registers). Returns the
+        number of clocks used.
+        """
+        for cycle in range(max_cycles):
+            if self.enb_gen_r:
+                return cycle
+            finishing = self.init_done_r or self._init_completes()
+            self.clock(init_i=not finishing)
+        raise RuntimeError(f"Generation did not start within {max_cycles} clocks")
+
+    def generate(self, count):
+        """
+        output_rand_o after each of count clocks, as a (n_seeds, count)
+        array. Runs init() first if generation has not started yet.
+        Calls continue from the current state.
+        """
+        if not self.enb_gen_r:
+            self.init()
+        out = np.empty((count, self.n_seeds), dtype=np.uint64)
+        for k in range(count):
+            out[k] = self.clock()
+        return np.ascontiguousarray(out.T)
+
+
+# Example usage
+if __name__ == "__main__":
+    lfsr = LFSR_generic(12)
+    print([hex(v) for v in lfsr.generate(8)])
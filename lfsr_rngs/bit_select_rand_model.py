@@ -0,0 +1,150 @@
+"""
+Cycle-accurate model of bit_select_rand.vhd.
+
+2**n_select_bits_g RAND LFSRs of width 2**n_select_bits_g are loaded
+with words derived from init_data_i. Every clock, bit b of output_rand_o
+is bit sel of RAND LFSR b, sel being the value of the selector LFSR. RAND
+LFSR b only moves when bit b of RAND_LFSR_en_vector is set, and that
+vector is fed back from the output and init_data_r.
+"""
+import numpy as np
+from LFSR_generic_model import REGISTERED_FEED, LFSR_generic, lfsr_block, reverse_bits
+
+
+class bit_select_rand(lfsr_block):
+    """
+    seeds: init_data_i of each instance (one instance per seed)
+    n_select_bits_g: 2..5, as LFSR_RAND_in_arr holds 32 words
+    """
+
+    def __init__(self, seeds, n_select_bits_g=4, registered_feed=REGISTERED_FEED):
+        if not 2 <= n_select_bits_g <= 5:
+            raise ValueError(f"n_select_bits_g must be in 2..5, got {n_select_bits_g}")
+        self.n_select_bits = n_select_bits_g
+        self.n_rand = 2**n_select_bits_g
+        self.w_lfsr = 2**n_select_bits_g
+        self.bit_idx = np.arange(self.n_rand, dtype=np.uint64)
+        super().__init__(seeds, self.w_lfsr, registered_feed)
+
+    def reset(self):
+        super().reset()
+        n_seeds = self.n_seeds
+        self.selector_LFSR_data_in_r = 0
+        self.LFSR_RAND_in_arr = np.zeros((n_seeds, 32), dtype=np.uint64)
+        self.w_2_init_03_done_r = False
+        self.w_2_init_12_done_r = False
+        self.w_4_init_s1_done_r = False
+        self.w_4_init_s2_done_r = False
+        self.RAND_LFSR_en_vector = np.zeros(n_seeds, dtype=np.uint64)
+        self.output_rand_o_r = np.zeros(n_seeds, dtype=np.uint64)
+        self.selector_LFSR = LFSR_generic(self.n_select_bits, registered_feed=self.registered_feed)
+        self.RAND_LFSRs = LFSR_generic(self.w_lfsr, (n_seeds, self.n_rand), registered_feed=self.registered_feed)
+
+    def _init_completes(self):
+        return self.enb_r and self.init_r and self.w_4_init_s2_done_r
+
+    def _in_arr_next(self):
+        """
+        LFSR_RAND_in_arr after one clock of the init branch of
+        LFSR_RAND_in_proc. Statements are applied in order, so later
+        assignments to the same index win as in the VHDL.
+        """
+        w, n = self.w_lfsr, self.n_rand
+        half = np.uint64(w // 2)
+        low = np.uint64((1 << (w // 2)) - 1)
+        arr = self.LFSR_RAND_in_arr
+        new = arr.copy()
+        d = self.init_data_r
+        new[:, 0] = ~d & self.data_mask
+        new[:, n - 1] = d
+        if self.w_2_init_03_done_r:
+            new[:, 1] = ((arr[:, 0] >> half) << half) | (arr[:, n - 1] >> half)
+            new[:, n - 2] = ((arr[:, 0] & low) << half) | (arr[:, n - 1] & low)
+            if self.w_2_init_12_done_r:
+                new[:, 2] = reverse_bits(arr[:, 0], w)
+                new[:, 3] = reverse_bits(arr[:, 1], w)
+                new[:, n - 4] = reverse_bits(arr[:, n - 2], w)
+                new[:, n - 3] = reverse_bits(arr[:, n - 1], w)
+                if self.w_4_init_s1_done_r:
+                    src = [0, 1, 2, 3, n - 4, n - 3, n - 2, n - 1]
+                    for k in range(3):
+                        for j, s in enumerate(src):
+                            new[:, 4 + 8 * k + j] = ~arr[:, s] & self.data_mask
+        return new
+
+    def clock(self, enb=True, clr=False, init_i=False, init_data_i=None):
+        """
+        One rising clock edge, returns output_rand_o
+        """
+        enb_r, clr_r, init_r = self.enb_r, self.clr_r, self.init_r
+        init_load = enb_r and self.init_done_r
+        rand_regs = self.RAND_LFSRs.reg
+        in_arr = self.LFSR_RAND_in_arr
+        sel_data = self.selector_LFSR_data_in_r
+        en_vector = self.RAND_LFSR_en_vector
+
+        # LFSR_RAND_in_proc and init_ctrl_proc
+        done_03, done_12 = self.w_2_init_03_done_r, self.w_2_init_12_done_r
+        done_s1, done_s2 = self.w_4_init_s1_done_r, self.w_4_init_s2_done_r
+        init_done, enb_gen = self.init_done_r, self.enb_gen_r
+        if enb_r:
+            if init_r and not self.init_done_r:
+                self.LFSR_RAND_in_arr = self._in_arr_next()
+                self.selector_LFSR_data_in_r = (1 << self.n_select_bits) - 1
+                done_03 = True
+                if self.w_2_init_03_done_r:
+                    done_12 = True
+                    if self.w_2_init_12_done_r:
+                        done_s1 = True
+                        if self.w_4_init_s1_done_r:
+                            done_s2 = True
+            if clr_r or init_load:
+                self.selector_LFSR_data_in_r = 0
+                self.LFSR_RAND_in_arr = np.zeros_like(in_arr)
+                done_03 = done_12 = done_s1 = done_s2 = False
+            if init_r:
+                enb_gen = False
+                if self.w_4_init_s2_done_r:
+                    init_done = True
+            elif init_load:
+                init_done = False
+                enb_gen = True
+            if clr_r:
+                init_done = enb_gen = False
+
+        # enb_gen_proc
+        if enb_r:
+            if self.enb_gen_r:
+                out_r = self.output_rand_o_r
+                data_rev = reverse_bits(self.init_data_r, self.n_rand)
+                en_vector = ((~en_vector & (out_r | data_rev))
+                             | (en_vector & ~(out_r & data_rev))) & np.uint64((1 << self.n_rand) - 1)
+            if clr_r:
+                en_vector = np.zeros_like(en_vector)
+
+        # get_selected_bit
+        if enb_r:
+            sel = np.uint64(int(self.selector_LFSR.reg))
+            bits = (rand_regs >> sel) & np.uint64(1)
+            self.output_rand_o_r = np.bitwise_or.reduce(bits << self.bit_idx, axis=1)
+            if clr_r:
+                self.output_rand_o_r = np.zeros(self.n_seeds, dtype=np.uint64)
+
+        # LFSR instances
+        self.selector_LFSR.clock(init_load, sel_data, self.enb_gen_r)
+        gen_e = ((self.RAND_LFSR_en_vector[:, None] >> self.bit_idx) & np.uint64(1)).astype(bool)
+        self.RAND_LFSRs.clock(init_load, in_arr[:, :self.n_rand], gen_e)
+
+        self.w_2_init_03_done_r, self.w_2_init_12_done_r = done_03, done_12
+        self.w_4_init_s1_done_r, self.w_4_init_s2_done_r = done_s1, done_s2
+        self.init_done_r, self.enb_gen_r = init_done, enb_gen
+        self.RAND_LFSR_en_vector = en_vector
+        self.enb_r, self.clr_r, self.init_r, self.init_data_r = self._input_stage(enb, clr, init_i, init_data_i)
+        return self.output_rand_o_r
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = bit_select_rand([0x1234, 0xBEEF], n_select_bits_g=4)
+    for row in rng.generate(8):
+        print([hex(v) for v in row])
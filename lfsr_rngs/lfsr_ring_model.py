@@ -0,0 +1,130 @@
+"""
+Cycle-accurate model of lfsr_ring.vhd.
+
+Four RAND LFSRs of width w_LFSR_g are loaded with init_data_i, its
+inverse and the two half swapped mixes. Every clock one of them (3, 2, 1,
+0 in turn) is pushed into a ring of four words. output_rand_o is a bitwise
+mix of the ring, and the bits at both ends of the ring words decide which
+RAND LFSRs move on the next clock.
+"""
+import numpy as np
+from LFSR_generic_model import MAX_LENGTH, REGISTERED_FEED, LFSR_generic, lfsr_block, reverse_bits
+
+# ring_indic_r value -> RAND LFSR pushed into the ring
+RING_SOURCE = {0x8: 3, 0x4: 2, 0x2: 1, 0x1: 0}
+
+
+class lfsr_ring(lfsr_block):
+    """
+    seeds: init_data_i of each instance (one instance per seed)
+    w_LFSR_g: LFSR width, 2..64 (the tap ROM of lfsr_taps_pkg goes
+              further, the uint64 model does not)
+    """
+
+    def __init__(self, seeds, w_LFSR_g=32, registered_feed=REGISTERED_FEED):
+        if not 2 <= w_LFSR_g <= MAX_LENGTH:
+            raise ValueError(f"w_LFSR_g must be in 2..{MAX_LENGTH}, got {w_LFSR_g}")
+        self.w_lfsr = w_LFSR_g
+        self.lfsr_idx = np.arange(4, dtype=np.uint64)
+        super().__init__(seeds, w_LFSR_g, registered_feed)
+
+    def reset(self):
+        super().reset()
+        n_seeds = self.n_seeds
+        self.output_rand_o_r = np.zeros(n_seeds, dtype=np.uint64)
+        self.LFSR_RAND_in_arr = np.zeros((n_seeds, 4), dtype=np.uint64)
+        self.LFSR_ring_arr = np.zeros((n_seeds, 4), dtype=np.uint64)
+        self.ring_indic_r = 0x8
+        self.RAND_LFSRs = LFSR_generic(self.w_lfsr, (n_seeds, 4), registered_feed=self.registered_feed)
+
+    def _init_completes(self):
+        return self.enb_r and self.init_r
+
+    def out_gen(self):
+        """
+        output_vector and gen_indicator of out_gen_proc for the current
+        ring
+        """
+        w = self.w_lfsr
+        one = np.uint64(1)
+        top = np.uint64(w - 1)
+        lfsr_0, lfsr_1, lfsr_2, lfsr_3 = self.LFSR_ring_arr.T
+        cxord = reverse_bits(lfsr_2, w) ^ lfsr_3
+        output_vector = ((cxord & (lfsr_0 ^ ~(lfsr_1 | lfsr_2)))
+                         | (~cxord & (lfsr_2 ^ ~(lfsr_1 | lfsr_3)))) & self.data_mask
+        # indic_0/indic_1 keep the values of the last loop iteration
+        indic_0 = (((lfsr_0 & one) << np.uint64(3)) | ((lfsr_1 & one) << np.uint64(2))
+                   | ((lfsr_2 & one) << one) | (lfsr_3 & one))
+        indic_1 = ((((lfsr_0 >> top) & one) << np.uint64(3)) | (((lfsr_1 >> top) & one) << np.uint64(2))
+                   | (((lfsr_2 >> top) & one) << one) | ((lfsr_3 >> top) & one))
+        nand_check = ~(indic_1 & indic_0) & np.uint64(0xF)
+        # (not indic_1) nand indic_0 is 0xF whenever nand_check is 0
+        gen_indicator = np.where(nand_check == 0, np.uint64(0xF), nand_check)
+        return output_vector, gen_indicator
+
+    def clock(self, enb=True, clr=False, init_i=False, init_data_i=None):
+        """
+        One rising clock edge, returns output_rand_o
+        """
+        w = self.w_lfsr
+        enb_r, clr_r, init_r = self.enb_r, self.clr_r, self.init_r
+        init_load = enb_r and self.init_done_r
+        in_arr = self.LFSR_RAND_in_arr
+        rand_out = self.RAND_LFSRs.reg
+        output_vector, gen_indicator = self.out_gen()
+
+        # output register of input_reg_proc
+        if enb_r:
+            self.output_rand_o_r = output_vector
+            if clr_r:
+                self.output_rand_o_r = np.zeros(self.n_seeds, dtype=np.uint64)
+
+        # LFSR_RAND_in_proc
+        init_done, enb_gen = self.init_done_r, self.enb_gen_r
+        if enb_r:
+            if init_r:
+                d = self.init_data_r
+                nd = ~d & self.data_mask
+                low = np.uint64((1 << (w // 2)) - 1)
+                self.LFSR_RAND_in_arr = np.stack([d, nd, (nd & ~low) | (d & low), (d & ~low) | (nd & low)], axis=1)
+                init_done = True
+                enb_gen = False
+            elif init_load:
+                init_done = False
+                enb_gen = True
+            if clr_r:
+                self.LFSR_RAND_in_arr = np.zeros_like(in_arr)
+                init_done = enb_gen = False
+
+        # lfsr_ring_proc
+        if enb_r:
+            ring = self.LFSR_ring_arr
+            new = ring.copy()
+            if init_load:
+                new = in_arr.copy()
+            if self.enb_gen_r:
+                new[:, 3] = rand_out[:, RING_SOURCE[self.ring_indic_r]]
+                self.ring_indic_r = 0x8 if self.ring_indic_r == 0x1 else self.ring_indic_r >> 1
+                new[:, 0:3] = ring[:, 1:4]
+            if clr_r:
+                new = np.zeros_like(ring)
+                self.ring_indic_r = 0x8
+            self.LFSR_ring_arr = new
+
+        # enable_proc and the LFSR instances
+        if enb_r and self.enb_gen_r:
+            gen_e = ((gen_indicator[:, None] >> self.lfsr_idx) & np.uint64(1)).astype(bool)
+        else:
+            gen_e = False
+        self.RAND_LFSRs.clock(init_load, in_arr, gen_e)
+
+        self.init_done_r, self.enb_gen_r = init_done, enb_gen
+        self.enb_r, self.clr_r, self.init_r, self.init_data_r = self._input_stage(enb, clr, init_i, init_data_i)
+        return self.output_rand_o_r
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = lfsr_ring([0x12345678, 0xCAFEF00D], w_LFSR_g=32)
+    for row in rng.generate(8):
+        print([hex(v) for v in row])
@@ -0,0 +1,1071 @@
+--------------------------------------------------------------------------------
+-- Title       : LFSR tap ROM
+-- Project     : hdl_rand
+--------------------------------------------------------------------------------
+-- File        : lfsr_taps_pkg.vhd
+-- Standard    : VHDL-2008
+--------------------------------------------------------------------------------
+-- Description: Generated by tools/primitive_taps.py, do not edit.
+-- Entry L holds the exponents a > b > c of the primitive polynomial
+-- x^L + x^a (+ x^b + x^c) + 1, 0 where unused. xor_placment_of(L) is
+-- the XOR_placment of LFSR_generic: the polynomial shifted down by
+-- one, the x^L term giving bit L-1. Entries are proven primitive;
+-- (0, 0, 0) marks a length without one, which xor_placment_of rejects.
+--------------------------------------------------------------------------------
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+package lfsr_taps_pkg is
+  constant LFSR_MAX_LEN : natural := 1024;
+
+  type lfsr_taps_type is array(0 to 2) of natural;
+  type lfsr_taps_rom_type is array(2 to LFSR_MAX_LEN) of lfsr_taps_type;
+
+  constant LFSR_TAPS_ROM : lfsr_taps_rom_type := (
+      (1, 0, 0),  -- 2
+      (1, 0, 0),  -- 3
+      (1, 0, 0),  -- 4
+      (2, 0, 0),  -- 5
+      (1, 0, 0),  -- 6
+      (1, 0, 0),  -- 7
+      (4, 3, 2),  -- 8
+      (4, 0, 0),  -- 9
+      (3, 0, 0),  -- 10
+      (2, 0, 0),  -- 11
+      (6, 4, 1),  -- 12
+      (4, 3, 1),  -- 13
+      (5, 3, 1),  -- 14
+      (1, 0, 0),  -- 15
+      (5, 3, 2),  -- 16
+      (3, 0, 0),  -- 17
+      (7, 0, 0),  -- 18
+      (5, 2, 1),  -- 19
+      (3, 0, 0),  -- 20
+      (2, 0, 0),  -- 21
+      (1, 0, 0),  -- 22
+      (5, 0, 0),  -- 23
+      (4, 3, 1),  -- 24
+      (3, 0, 0),  -- 25
+      (6, 2, 1),  -- 26
+      (5, 2, 1),  -- 27
+      (3, 0, 0),  -- 28
+      (2, 0, 0),  -- 29
+      (6, 4, 1),  -- 30
+      (3, 0, 0),  -- 31
+      (7, 6, 2),  -- 32
+      (13, 0, 0),  -- 33
+      (8, 4, 3),  -- 34
+      (2, 0, 0),  -- 35
+      (11, 0, 0),  -- 36
+      (6, 4, 1),  -- 37
+      (6, 5, 1),  -- 38
+      (4, 0, 0),  -- 39
+      (5, 4, 3),  -- 40
+      (3, 0, 0),  -- 41
+      (7, 4, 3),  -- 42
+      (6, 4, 3),  -- 43
+      (6, 5, 2),  -- 44
+      (4, 3, 1),  -- 45
+      (8, 7, 6),  -- 46
+      (5, 0, 0),  -- 47
+      (9, 7, 4),  -- 48
+      (9, 0, 0),  -- 49
+      (4, 3, 2),  -- 50
+      (6, 3, 1),  -- 51
+      (3, 0, 0),  -- 52
+      (6, 2, 1),  -- 53
+      (8, 6, 3),  -- 54
+      (24, 0, 0),  -- 55
+      (7, 4, 2),  -- 56
+      (7, 0, 0),  -- 57
+      (19, 0, 0),  -- 58
+      (7, 4, 2),  -- 59
+      (1, 0, 0),  -- 60
+      (5, 2, 1),  -- 61
+      (6, 5, 3),  -- 62
+      (1, 0, 0),  -- 63
+      (4, 3, 1),  -- 64
+      (18, 0, 0),  -- 65
+      (9, 8, 6),  -- 66
+      (5, 2, 1),  -- 67
+      (9, 0, 0),  -- 68
+      (6, 5, 2),  -- 69
+      (5, 3, 1),  -- 70
+      (6, 0, 0),  -- 71
+      (10, 9, 3),  -- 72
+      (25, 0, 0),  -- 73
+      (7, 4, 3),  -- 74
+      (6, 3, 1),  -- 75
+      (5, 4, 2),  -- 76
+      (6, 5, 2),  -- 77
+      (7, 2, 1),  -- 78
+      (9, 0, 0),  -- 79
+      (9, 4, 2),  -- 80
+      (4, 0, 0),  -- 81
+      (9, 6, 4),  -- 82
+      (7, 4, 2),  -- 83
+      (13, 0, 0),  -- 84
+      (8, 2, 1),  -- 85
+      (6, 5, 2),  -- 86
+      (13, 0, 0),  -- 87
+      (11, 9, 8),  -- 88
+      (38, 0, 0),  -- 89
+      (5, 3, 2),  -- 90
+      (8, 5, 1),  -- 91
+      (6, 5, 2),  -- 92
+      (2, 0, 0),  -- 93
+      (21, 0, 0),  -- 94
+      (11, 0, 0),  -- 95
+      (10, 9, 6),  -- 96
+      (6, 0, 0),  -- 97
+      (11, 0, 0),  -- 98
+      (7, 5, 4),  -- 99
+      (37, 0, 0),  -- 100
+      (7, 6, 1),  -- 101
+      (6, 5, 3),  -- 102
+      (9, 0, 0),  -- 103
+      (11, 10, 1),  -- 104
+      (16, 0, 0),  -- 105
+      (15, 0, 0),  -- 106
+      (9, 7, 4),  -- 107
+      (31, 0, 0),  -- 108
+      (5, 4, 2),  -- 109
+      (6, 4, 1),  -- 110
+      (10, 0, 0),  -- 111
+      (11, 6, 4),  -- 112
+      (9, 0, 0),  -- 113
+      (11, 2, 1),  -- 114
+      (8, 7, 5),  -- 115
+      (6, 5, 2),  -- 116
+      (5, 2, 1),  -- 117
+      (33, 0, 0),  -- 118
+      (8, 0, 0),  -- 119
+      (9, 6, 2),  -- 120
+      (18, 0, 0),  -- 121
+      (6, 2, 1),  -- 122
+      (2, 0, 0),  -- 123
+      (37, 0, 0),  -- 124
+      (7, 6, 5),  -- 125
+      (7, 4, 2),  -- 126
+      (1, 0, 0),  -- 127
+      (7, 2, 1),  -- 128
+      (5, 0, 0),  -- 129
+      (3, 0, 0),  -- 130
+      (8, 3, 2),  -- 131
+      (29, 0, 0),  -- 132
+      (9, 8, 2),  -- 133
+      (57, 0, 0),  -- 134
+      (11, 0, 0),  -- 135
+      (8, 3, 2),  -- 136
+      (0, 0, 0),  -- 137  -- 2^L-1 not fully factored, no proven polynomial
+      (8, 7, 1),  -- 138
+      (8, 5, 3),  -- 139
+      (29, 0, 0),  -- 140
+      (13, 6, 1),  -- 141
+      (21, 0, 0),  -- 142
+      (5, 3, 2),  -- 143
+      (7, 4, 2),  -- 144
+      (52, 0, 0),  -- 145
+      (5, 3, 2),  -- 146
+      (11, 4, 2),  -- 147
+      (27, 0, 0),  -- 148
+      (0, 0, 0),  -- 149  -- 2^L-1 not fully factored, no proven polynomial
+      (53, 0, 0),  -- 150
+      (3, 0, 0),  -- 151
+      (6, 3, 2),  -- 152
+      (1, 0, 0),  -- 153
+      (9, 5, 1),  -- 154
+      (7, 5, 4),  -- 155
+      (9, 5, 3),  -- 156
+      (6, 5, 2),  -- 157
+      (8, 6, 5),  -- 158
+      (31, 0, 0),  -- 159
+      (5, 3, 2),  -- 160
+      (18, 0, 0),  -- 161
+      (8, 7, 4),  -- 162
+      (7, 6, 3),  -- 163
+      (12, 6, 5),  -- 164
+      (9, 8, 3),  -- 165
+      (10, 3, 2),  -- 166
+      (6, 0, 0),  -- 167
+      (16, 9, 6),  -- 168
+      (34, 0, 0),  -- 169
+      (23, 0, 0),  -- 170
+      (6, 5, 2),  -- 171
+      (7, 0, 0),  -- 172
+      (8, 5, 2),  -- 173
+      (13, 0, 0),  -- 174
+      (6, 0, 0),  -- 175
+      (12, 11, 9),  -- 176
+      (8, 0, 0),  -- 177
+      (87, 0, 0),  -- 178
+      (4, 2, 1),  -- 179
+      (12, 10, 7),  -- 180
+      (7, 6, 1),  -- 181
+      (8, 6, 1),  -- 182
+      (56, 0, 0),  -- 183
+      (9, 8, 7),  -- 184
+      (24, 0, 0),  -- 185
+      (9, 8, 6),  -- 186
+      (7, 6, 5),  -- 187
+      (6, 5, 2),  -- 188
+      (6, 5, 2),  -- 189
+      (13, 6, 2),  -- 190
+      (9, 0, 0),  -- 191
+      (15, 11, 5),  -- 192
+      (0, 0, 0),  -- 193  -- 2^L-1 not fully factored, no proven polynomial
+      (87, 0, 0),  -- 194
+      (8, 3, 2),  -- 195
+      (11, 9, 2),  -- 196
+      (9, 4, 2),  -- 197
+      (65, 0, 0),  -- 198
+      (34, 0, 0),  -- 199
+      (5, 3, 2),  -- 200
+      (14, 0, 0),  -- 201
+      (55, 0, 0),  -- 202
+      (8, 7, 1),  -- 203
+      (10, 4, 3),  -- 204
+      (9, 5, 2),  -- 205
+      (10, 9, 5),  -- 206
+      (43, 0, 0),  -- 207
+      (9, 3, 1),  -- 208
+      (6, 0, 0),  -- 209
+      (12, 4, 3),  -- 210
+      (0, 0, 0),  -- 211  -- 2^L-1 not fully factored, no proven polynomial
+      (105, 0, 0),  -- 212
+      (6, 5, 2),  -- 213
+      (5, 3, 1),  -- 214
+      (23, 0, 0),  -- 215
+      (7, 3, 1),  -- 216
+      (45, 0, 0),  -- 217
+      (11, 0, 0),  -- 218
+      (8, 4, 1),  -- 219
+      (12, 10, 9),  -- 220
+      (8, 6, 2),  -- 221
+      (8, 5, 2),  -- 222
+      (33, 0, 0),  -- 223
+      (12, 7, 2),  -- 224
+      (32, 0, 0),  -- 225
+      (10, 7, 3),  -- 226
+      (10, 9, 4),  -- 227
+      (12, 11, 2),  -- 228
+      (0, 0, 0),  -- 229  -- 2^L-1 not fully factored, no proven polynomial
+      (8, 7, 6),  -- 230
+      (26, 0, 0),  -- 231
+      (11, 9, 4),  -- 232
+      (74, 0, 0),  -- 233
+      (31, 0, 0),  -- 234
+      (9, 6, 1),  -- 235
+      (5, 0, 0),  -- 236
+      (0, 0, 0),  -- 237  -- 2^L-1 not fully factored, no proven polynomial
+      (5, 2, 1),  -- 238
+      (36, 0, 0),  -- 239
+      (8, 5, 3),  -- 240
+      (70, 0, 0),  -- 241
+      (11, 6, 1),  -- 242
+      (8, 5, 1),  -- 243
+      (9, 4, 1),  -- 244
+      (6, 4, 1),  -- 245
+      (11, 2, 1),  -- 246
+      (82, 0, 0),  -- 247
+      (15, 14, 10),  -- 248
+      (86, 0, 0),  -- 249
+      (103, 0, 0),  -- 250
+      (0, 0, 0),  -- 251  -- 2^L-1 not fully factored, no proven polynomial
+      (67, 0, 0),  -- 252
+      (0, 0, 0),  -- 253  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 2, 1),  -- 254
+      (52, 0, 0),  -- 255
+      (10, 5, 2),  -- 256
+      (0, 0, 0),  -- 257  -- 2^L-1 not fully factored, no proven polynomial
+      (83, 0, 0),  -- 258
+      (10, 6, 2),  -- 259
+      (10, 8, 7),  -- 260
+      (7, 6, 4),  -- 261
+      (9, 8, 4),  -- 262
+      (0, 0, 0),  -- 263  -- 2^L-1 not fully factored, no proven polynomial
+      (10, 9, 1),  -- 264
+      (42, 0, 0),  -- 265
+      (47, 0, 0),  -- 266
+      (8, 6, 3),  -- 267
+      (25, 0, 0),  -- 268
+      (7, 6, 1),  -- 269
+      (53, 0, 0),  -- 270
+      (58, 0, 0),  -- 271
+      (9, 6, 2),  -- 272
+      (23, 0, 0),  -- 273
+      (0, 0, 0),  -- 274  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 275  -- 2^L-1 not fully factored, no proven polynomial
+      (6, 3, 1),  -- 276
+      (0, 0, 0),  -- 277  -- 2^L-1 not fully factored, no proven polynomial
+      (5, 0, 0),  -- 278
+      (5, 0, 0),  -- 279
+      (9, 5, 2),  -- 280
+      (93, 0, 0),  -- 281
+      (35, 0, 0),  -- 282
+      (12, 7, 5),  -- 283
+      (119, 0, 0),  -- 284
+      (0, 0, 0),  -- 285  -- 2^L-1 not fully factored, no proven polynomial
+      (69, 0, 0),  -- 286
+      (71, 0, 0),  -- 287
+      (11, 10, 1),  -- 288
+      (0, 0, 0),  -- 289  -- 2^L-1 not fully factored, no proven polynomial
+      (5, 3, 2),  -- 290
+      (12, 11, 5),  -- 291
+      (97, 0, 0),  -- 292
+      (0, 0, 0),  -- 293  -- 2^L-1 not fully factored, no proven polynomial
+      (61, 0, 0),  -- 294
+      (48, 0, 0),  -- 295
+      (11, 9, 4),  -- 296
+      (5, 0, 0),  -- 297
+      (0, 0, 0),  -- 298  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 6, 4),  -- 299
+      (7, 0, 0),  -- 300
+      (0, 0, 0),  -- 301  -- 2^L-1 not fully factored, no proven polynomial
+      (41, 0, 0),  -- 302
+      (13, 12, 6),  -- 303
+      (11, 2, 1),  -- 304
+      (102, 0, 0),  -- 305
+      (7, 3, 1),  -- 306
+      (8, 4, 2),  -- 307
+      (15, 9, 2),  -- 308
+      (10, 6, 4),  -- 309
+      (8, 5, 1),  -- 310
+      (0, 0, 0),  -- 311  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 10, 5),  -- 312
+      (0, 0, 0),  -- 313  -- 2^L-1 not fully factored, no proven polynomial
+      (15, 0, 0),  -- 314
+      (10, 9, 1),  -- 315
+      (0, 0, 0),  -- 316  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 317  -- 2^L-1 not fully factored, no proven polynomial
+      (8, 6, 5),  -- 318
+      (36, 0, 0),  -- 319
+      (4, 3, 1),  -- 320
+      (31, 0, 0),  -- 321
+      (67, 0, 0),  -- 322
+      (10, 3, 1),  -- 323
+      (6, 4, 3),  -- 324
+      (10, 5, 2),  -- 325
+      (10, 3, 1),  -- 326
+      (0, 0, 0),  -- 327  -- 2^L-1 not fully factored, no proven polynomial
+      (9, 7, 5),  -- 328
+      (50, 0, 0),  -- 329
+      (8, 7, 2),  -- 330
+      (10, 6, 2),  -- 331
+      (123, 0, 0),  -- 332
+      (2, 0, 0),  -- 333
+      (7, 4, 1),  -- 334
+      (10, 7, 2),  -- 335
+      (7, 4, 1),  -- 336
+      (55, 0, 0),  -- 337
+      (0, 0, 0),  -- 338  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 339  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 4, 3),  -- 340
+      (0, 0, 0),  -- 341  -- 2^L-1 not fully factored, no proven polynomial
+      (125, 0, 0),  -- 342
+      (75, 0, 0),  -- 343
+      (11, 10, 6),  -- 344
+      (22, 0, 0),  -- 345
+      (11, 7, 2),  -- 346
+      (0, 0, 0),  -- 347  -- 2^L-1 not fully factored, no proven polynomial
+      (8, 7, 4),  -- 348
+      (0, 0, 0),  -- 349  -- 2^L-1 not fully factored, no proven polynomial
+      (53, 0, 0),  -- 350
+      (34, 0, 0),  -- 351
+      (13, 11, 6),  -- 352
+      (0, 0, 0),  -- 353  -- 2^L-1 not fully factored, no proven polynomial
+      (14, 13, 5),  -- 354
+      (6, 5, 1),  -- 355
+      (0, 0, 0),  -- 356  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 357  -- 2^L-1 not fully factored, no proven polynomial
+      (14, 8, 7),  -- 358
+      (0, 0, 0),  -- 359  -- 2^L-1 not fully factored, no proven polynomial
+      (26, 25, 1),  -- 360
+      (0, 0, 0),  -- 361  -- 2^L-1 not fully factored, no proven polynomial
+      (63, 0, 0),  -- 362
+      (8, 5, 3),  -- 363
+      (67, 0, 0),  -- 364
+      (9, 6, 5),  -- 365
+      (29, 0, 0),  -- 366
+      (0, 0, 0),  -- 367  -- 2^L-1 not fully factored, no proven polynomial
+      (17, 9, 7),  -- 368
+      (91, 0, 0),  -- 369
+      (139, 0, 0),  -- 370
+      (0, 0, 0),  -- 371  -- 2^L-1 not fully factored, no proven polynomial
+      (15, 7, 3),  -- 372
+      (8, 7, 2),  -- 373
+      (8, 6, 5),  -- 374
+      (16, 0, 0),  -- 375
+      (8, 7, 5),  -- 376
+      (41, 0, 0),  -- 377
+      (43, 0, 0),  -- 378
+      (10, 8, 5),  -- 379
+      (47, 0, 0),  -- 380
+      (5, 2, 1),  -- 381
+      (81, 0, 0),  -- 382
+      (0, 0, 0),  -- 383  -- 2^L-1 not fully factored, no proven polynomial
+      (16, 15, 6),  -- 384
+      (6, 0, 0),  -- 385
+      (0, 0, 0),  -- 386  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 387  -- 2^L-1 not fully factored, no proven polynomial
+      (14, 3, 1),  -- 388
+      (10, 9, 5),  -- 389
+      (89, 0, 0),  -- 390
+      (0, 0, 0),  -- 391  -- 2^L-1 not fully factored, no proven polynomial
+      (13, 10, 6),  -- 392
+      (7, 0, 0),  -- 393
+      (0, 0, 0),  -- 394  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 6, 5),  -- 395
+      (25, 0, 0),  -- 396
+      (0, 0, 0),  -- 397  -- 2^L-1 not fully factored, no proven polynomial
+      (14, 6, 5),  -- 398
+      (86, 0, 0),  -- 399
+      (5, 3, 2),  -- 400
+      (0, 0, 0),  -- 401  -- 2^L-1 not fully factored, no proven polynomial
+      (9, 4, 3),  -- 402
+      (9, 8, 5),  -- 403
+      (189, 0, 0),  -- 404
+      (17, 8, 7),  -- 405
+      (157, 0, 0),  -- 406
+      (0, 0, 0),  -- 407  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 5, 1),  -- 408
+      (87, 0, 0),  -- 409
+      (10, 4, 3),  -- 410
+      (0, 0, 0),  -- 411  -- 2^L-1 not fully factored, no proven polynomial
+      (147, 0, 0),  -- 412
+      (0, 0, 0),  -- 413  -- 2^L-1 not fully factored, no proven polynomial
+      (16, 13, 9),  -- 414
+      (0, 0, 0),  -- 415  -- 2^L-1 not fully factored, no proven polynomial
+      (9, 5, 2),  -- 416
+      (107, 0, 0),  -- 417
+      (0, 0, 0),  -- 418  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 419  -- 2^L-1 not fully factored, no proven polynomial
+      (13, 10, 8),  -- 420
+      (5, 4, 2),  -- 421
+      (0, 0, 0),  -- 422  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 423  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 424  -- 2^L-1 not fully factored, no proven polynomial
+      (12, 0, 0),  -- 425
+      (14, 12, 11),  -- 426
+      (11, 6, 5),  -- 427
+      (105, 0, 0),  -- 428
+      (0, 0, 0),  -- 429  -- 2^L-1 not fully factored, no proven polynomial
+      (15, 13, 11),  -- 430
+      (0, 0, 0),  -- 431  -- 2^L-1 not fully factored, no proven polynomial
+      (13, 4, 3),  -- 432
+      (0, 0, 0),  -- 433  -- 2^L-1 not fully factored, no proven polynomial
+      (12, 11, 5),  -- 434
+      (0, 0, 0),  -- 435  -- 2^L-1 not fully factored, no proven polynomial
+      (165, 0, 0),  -- 436
+      (6, 2, 1),  -- 437
+      (65, 0, 0),  -- 438
+      (49, 0, 0),  -- 439
+      (4, 3, 1),  -- 440
+      (0, 0, 0),  -- 441  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 5, 2),  -- 442
+      (10, 6, 1),  -- 443
+      (13, 12, 9),  -- 444
+      (0, 0, 0),  -- 445  -- 2^L-1 not fully factored, no proven polynomial
+      (105, 0, 0),  -- 446
+      (0, 0, 0),  -- 447  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 448  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 449  -- 2^L-1 not fully factored, no proven polynomial
+      (79, 0, 0),  -- 450
+      (16, 10, 1),  -- 451
+      (0, 0, 0),  -- 452  -- 2^L-1 not fully factored, no proven polynomial
+      (15, 6, 4),  -- 453
+      (10, 9, 5),  -- 454
+      (38, 0, 0),  -- 455
+      (23, 11, 2),  -- 456
+      (16, 0, 0),  -- 457
+      (0, 0, 0),  -- 458  -- 2^L-1 not fully factored, no proven polynomial
+      (12, 5, 2),  -- 459
+      (61, 0, 0),  -- 460
+      (7, 6, 1),  -- 461
+      (73, 0, 0),  -- 462
+      (0, 0, 0),  -- 463  -- 2^L-1 not fully factored, no proven polynomial
+      (23, 9, 4),  -- 464
+      (59, 0, 0),  -- 465
+      (14, 11, 6),  -- 466
+      (0, 0, 0),  -- 467  -- 2^L-1 not fully factored, no proven polynomial
+      (15, 9, 4),  -- 468
+      (9, 5, 2),  -- 469
+      (149, 0, 0),  -- 470
+      (1, 0, 0),  -- 471
+      (11, 3, 2),  -- 472
+      (0, 0, 0),  -- 473  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 474  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 475  -- 2^L-1 not fully factored, no proven polynomial
+      (15, 0, 0),  -- 476
+      (16, 15, 7),  -- 477
+      (0, 0, 0),  -- 478  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 479  -- 2^L-1 not fully factored, no proven polynomial
+      (16, 13, 7),  -- 480
+      (0, 0, 0),  -- 481  -- 2^L-1 not fully factored, no proven polynomial
+      (9, 6, 5),  -- 482
+      (9, 6, 4),  -- 483
+      (0, 0, 0),  -- 484  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 485  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 486  -- 2^L-1 not fully factored, no proven polynomial
+      (94, 0, 0),  -- 487
+      (0, 0, 0),  -- 488  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 489  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 490  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 491  -- 2^L-1 not fully factored, no proven polynomial
+      (8, 7, 1),  -- 492
+      (10, 5, 3),  -- 493
+      (137, 0, 0),  -- 494
+      (0, 0, 0),  -- 495  -- 2^L-1 not fully factored, no proven polynomial
+      (16, 5, 2),  -- 496
+      (78, 0, 0),  -- 497
+      (11, 9, 3),  -- 498
+      (0, 0, 0),  -- 499  -- 2^L-1 not fully factored, no proven polynomial
+      (10, 6, 1),  -- 500
+      (0, 0, 0),  -- 501  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 502  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 503  -- 2^L-1 not fully factored, no proven polynomial
+      (21, 14, 2),  -- 504
+      (156, 0, 0),  -- 505
+      (0, 0, 0),  -- 506  -- 2^L-1 not fully factored, no proven polynomial
+      (13, 6, 3),  -- 507
+      (109, 0, 0),  -- 508
+      (0, 0, 0),  -- 509  -- 2^L-1 not fully factored, no proven polynomial
+      (12, 10, 9),  -- 510
+      (0, 0, 0),  -- 511  -- 2^L-1 not fully factored, no proven polynomial
+      (8, 5, 2),  -- 512
+      (85, 0, 0),  -- 513
+      (0, 0, 0),  -- 514  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 515  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 5, 2),  -- 516
+      (0, 0, 0),  -- 517  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 518  -- 2^L-1 not fully factored, no proven polynomial
+      (79, 0, 0),  -- 519
+      (17, 13, 11),  -- 520
+      (32, 0, 0),  -- 521
+      (15, 13, 4),  -- 522
+      (0, 0, 0),  -- 523  -- 2^L-1 not fully factored, no proven polynomial
+      (167, 0, 0),  -- 524
+      (6, 4, 1),  -- 525
+      (0, 0, 0),  -- 526  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 527  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 6, 2),  -- 528
+      (0, 0, 0),  -- 529  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 530  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 531  -- 2^L-1 not fully factored, no proven polynomial
+      (1, 0, 0),  -- 532
+      (4, 3, 2),  -- 533
+      (7, 5, 1),  -- 534
+      (0, 0, 0),  -- 535  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 5, 3),  -- 536
+      (94, 0, 0),  -- 537
+      (0, 0, 0),  -- 538  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 539  -- 2^L-1 not fully factored, no proven polynomial
+      (179, 0, 0),  -- 540
+      (0, 0, 0),  -- 541  -- 2^L-1 not fully factored, no proven polynomial
+      (9, 3, 2),  -- 542
+      (0, 0, 0),  -- 543  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 544  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 545  -- 2^L-1 not fully factored, no proven polynomial
+      (8, 2, 1),  -- 546
+      (0, 0, 0),  -- 547  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 548  -- 2^L-1 not fully factored, no proven polynomial
+      (16, 4, 3),  -- 549
+      (0, 0, 0),  -- 550  -- 2^L-1 not fully factored, no proven polynomial
+      (135, 0, 0),  -- 551
+      (0, 0, 0),  -- 552  -- 2^L-1 not fully factored, no proven polynomial
+      (39, 0, 0),  -- 553
+      (0, 0, 0),  -- 554  -- 2^L-1 not fully factored, no proven polynomial
+      (10, 9, 4),  -- 555
+      (153, 0, 0),  -- 556
+      (0, 0, 0),  -- 557  -- 2^L-1 not fully factored, no proven polynomial
+      (14, 9, 5),  -- 558
+      (0, 0, 0),  -- 559  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 9, 6),  -- 560
+      (71, 0, 0),  -- 561
+      (11, 4, 2),  -- 562
+      (0, 0, 0),  -- 563  -- 2^L-1 not fully factored, no proven polynomial
+      (163, 0, 0),  -- 564
+      (0, 0, 0),  -- 565  -- 2^L-1 not fully factored, no proven polynomial
+      (153, 0, 0),  -- 566
+      (143, 0, 0),  -- 567
+      (17, 11, 10),  -- 568
+      (0, 0, 0),  -- 569  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 570  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 571  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 572  -- 2^L-1 not fully factored, no proven polynomial
+      (10, 6, 4),  -- 573
+      (13, 0, 0),  -- 574
+      (146, 0, 0),  -- 575
+      (0, 0, 0),  -- 576  -- 2^L-1 not fully factored, no proven polynomial
+      (25, 0, 0),  -- 577
+      (0, 0, 0),  -- 578  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 579  -- 2^L-1 not fully factored, no proven polynomial
+      (6, 4, 1),  -- 580
+      (0, 0, 0),  -- 581  -- 2^L-1 not fully factored, no proven polynomial
+      (85, 0, 0),  -- 582
+      (130, 0, 0),  -- 583
+      (14, 13, 3),  -- 584
+      (121, 0, 0),  -- 585
+      (0, 0, 0),  -- 586  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 587  -- 2^L-1 not fully factored, no proven polynomial
+      (151, 0, 0),  -- 588
+      (0, 0, 0),  -- 589  -- 2^L-1 not fully factored, no proven polynomial
+      (93, 0, 0),  -- 590
+      (9, 6, 4),  -- 591
+      (24, 19, 1),  -- 592
+      (0, 0, 0),  -- 593  -- 2^L-1 not fully factored, no proven polynomial
+      (19, 0, 0),  -- 594
+      (9, 2, 1),  -- 595
+      (0, 0, 0),  -- 596  -- 2^L-1 not fully factored, no proven polynomial
+      (14, 12, 9),  -- 597
+      (7, 6, 1),  -- 598
+      (0, 0, 0),  -- 599  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 10, 1),  -- 600
+      (0, 0, 0),  -- 601  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 602  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 603  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 604  -- 2^L-1 not fully factored, no proven polynomial
+      (10, 7, 5),  -- 605
+      (15, 7, 4),  -- 606
+      (105, 0, 0),  -- 607
+      (23, 6, 2),  -- 608
+      (0, 0, 0),  -- 609  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 610  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 611  -- 2^L-1 not fully factored, no proven polynomial
+      (14, 10, 5),  -- 612
+      (0, 0, 0),  -- 613  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 2, 1),  -- 614
+      (0, 0, 0),  -- 615  -- 2^L-1 not fully factored, no proven polynomial
+      (19, 10, 3),  -- 616
+      (0, 0, 0),  -- 617  -- 2^L-1 not fully factored, no proven polynomial
+      (20, 13, 5),  -- 618
+      (0, 0, 0),  -- 619  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 620  -- 2^L-1 not fully factored, no proven polynomial
+      (12, 6, 5),  -- 621
+      (0, 0, 0),  -- 622  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 623  -- 2^L-1 not fully factored, no proven polynomial
+      (12, 9, 7),  -- 624
+      (0, 0, 0),  -- 625  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 626  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 627  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 628  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 629  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 4, 2),  -- 630
+      (0, 0, 0),  -- 631  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 632  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 633  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 634  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 635  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 636  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 637  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 638  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 639  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 640  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 641  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 642  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 643  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 644  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 645  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 646  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 647  -- 2^L-1 not fully factored, no proven polynomial
+      (23, 22, 1),  -- 648
+      (0, 0, 0),  -- 649  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 650  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 651  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 652  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 653  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 654  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 655  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 656  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 657  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 658  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 659  -- 2^L-1 not fully factored, no proven polynomial
+      (12, 4, 3),  -- 660
+      (0, 0, 0),  -- 661  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 662  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 663  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 664  -- 2^L-1 not fully factored, no proven polynomial
+      (33, 0, 0),  -- 665
+      (0, 0, 0),  -- 666  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 667  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 668  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 669  -- 2^L-1 not fully factored, no proven polynomial
+      (153, 0, 0),  -- 670
+      (0, 0, 0),  -- 671  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 6, 5),  -- 672
+      (0, 0, 0),  -- 673  -- 2^L-1 not fully factored, no proven polynomial
+      (14, 9, 3),  -- 674
+      (0, 0, 0),  -- 675  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 676  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 677  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 678  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 679  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 680  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 681  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 682  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 683  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 684  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 685  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 686  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 687  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 688  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 689  -- 2^L-1 not fully factored, no proven polynomial
+      (10, 7, 3),  -- 690
+      (0, 0, 0),  -- 691  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 692  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 693  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 694  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 695  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 696  -- 2^L-1 not fully factored, no proven polynomial
+      (267, 0, 0),  -- 697
+      (0, 0, 0),  -- 698  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 699  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 700  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 701  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 702  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 703  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 704  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 705  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 706  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 707  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 708  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 709  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 710  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 711  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 712  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 713  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 714  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 715  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 716  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 717  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 718  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 719  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 8, 2),  -- 720
+      (9, 0, 0),  -- 721
+      (0, 0, 0),  -- 722  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 723  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 724  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 725  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 726  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 727  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 728  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 729  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 730  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 731  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 732  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 733  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 734  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 735  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 736  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 737  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 738  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 739  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 740  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 741  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 742  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 743  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 744  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 745  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 746  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 747  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 748  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 749  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 750  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 751  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 752  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 753  -- 2^L-1 not fully factored, no proven polynomial
+      (19, 0, 0),  -- 754
+      (12, 10, 1),  -- 755
+      (0, 0, 0),  -- 756  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 757  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 758  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 759  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 760  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 761  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 762  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 763  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 764  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 765  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 766  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 767  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 768  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 769  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 770  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 771  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 772  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 773  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 774  -- 2^L-1 not fully factored, no proven polynomial
+      (367, 0, 0),  -- 775
+      (17, 12, 3),  -- 776
+      (0, 0, 0),  -- 777  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 778  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 779  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 780  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 781  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 782  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 783  -- 2^L-1 not fully factored, no proven polynomial
+      (13, 9, 6),  -- 784
+      (0, 0, 0),  -- 785  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 786  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 787  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 788  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 789  -- 2^L-1 not fully factored, no proven polynomial
+      (9, 7, 3),  -- 790
+      (0, 0, 0),  -- 791  -- 2^L-1 not fully factored, no proven polynomial
+      (23, 17, 13),  -- 792
+      (0, 0, 0),  -- 793  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 794  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 795  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 796  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 797  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 798  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 799  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 800  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 801  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 802  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 803  -- 2^L-1 not fully factored, no proven polynomial
+      (295, 0, 0),  -- 804
+      (0, 0, 0),  -- 805  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 806  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 0, 0),  -- 807
+      (0, 0, 0),  -- 808  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 809  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 810  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 811  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 812  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 813  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 814  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 815  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 816  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 817  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 818  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 819  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 820  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 821  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 822  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 823  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 824  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 825  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 826  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 827  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 828  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 829  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 830  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 831  -- 2^L-1 not fully factored, no proven polynomial
+      (13, 5, 2),  -- 832
+      (0, 0, 0),  -- 833  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 834  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 835  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 836  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 837  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 838  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 839  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 5, 1),  -- 840
+      (0, 0, 0),  -- 841  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 842  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 10, 7),  -- 843
+      (0, 0, 0),  -- 844  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 845  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 846  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 847  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 848  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 849  -- 2^L-1 not fully factored, no proven polynomial
+      (111, 0, 0),  -- 850
+      (0, 0, 0),  -- 851  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 852  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 853  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 854  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 855  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 856  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 857  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 858  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 859  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 860  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 861  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 862  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 863  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 864  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 865  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 866  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 867  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 868  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 869  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 870  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 871  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 872  -- 2^L-1 not fully factored, no proven polynomial
+      (7, 3, 1),  -- 873
+      (0, 0, 0),  -- 874  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 875  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 876  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 877  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 878  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 879  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 880  -- 2^L-1 not fully factored, no proven polynomial
+      (78, 0, 0),  -- 881
+      (0, 0, 0),  -- 882  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 883  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 884  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 885  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 886  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 887  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 888  -- 2^L-1 not fully factored, no proven polynomial
+      (169, 0, 0),  -- 889
+      (0, 0, 0),  -- 890  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 891  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 892  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 893  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 894  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 895  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 896  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 897  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 898  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 899  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 900  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 901  -- 2^L-1 not fully factored, no proven polynomial
+      (20, 16, 9),  -- 902
+      (0, 0, 0),  -- 903  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 904  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 905  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 906  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 907  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 908  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 909  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 910  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 911  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 912  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 913  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 914  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 915  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 916  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 917  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 918  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 919  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 920  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 921  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 922  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 923  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 924  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 925  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 926  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 927  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 928  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 929  -- 2^L-1 not fully factored, no proven polynomial
+      (18, 14, 11),  -- 930
+      (0, 0, 0),  -- 931  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 932  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 933  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 934  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 935  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 936  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 937  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 938  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 939  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 940  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 941  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 942  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 943  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 944  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 945  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 946  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 947  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 948  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 949  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 950  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 951  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 952  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 953  -- 2^L-1 not fully factored, no proven polynomial
+      (11, 8, 6),  -- 954
+      (0, 0, 0),  -- 955  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 956  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 957  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 958  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 959  -- 2^L-1 not fully factored, no proven polynomial
+      (13, 9, 6),  -- 960
+      (0, 0, 0),  -- 961  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 962  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 963  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 964  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 965  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 966  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 967  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 968  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 969  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 970  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 971  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 972  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 973  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 974  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 975  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 976  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 977  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 978  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 979  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 980  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 981  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 982  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 983  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 984  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 985  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 986  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 987  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 988  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 989  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 990  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 991  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 992  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 993  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 994  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 995  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 996  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 997  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 998  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 999  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1000  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1001  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1002  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1003  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1004  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1005  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1006  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1007  -- 2^L-1 not fully factored, no proven polynomial
+      (27, 13, 10),  -- 1008
+      (0, 0, 0),  -- 1009  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1010  -- 2^L-1 not fully factored, no proven polynomial
+      (10, 7, 4),  -- 1011
+      (0, 0, 0),  -- 1012  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1013  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1014  -- 2^L-1 not fully factored, no proven polynomial
+      (186, 0, 0),  -- 1015
+      (0, 0, 0),  -- 1016  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1017  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1018  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1019  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1020  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1021  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1022  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0),  -- 1023  -- 2^L-1 not fully factored, no proven polynomial
+      (0, 0, 0)  -- 1024  -- 2^L-1 not fully factored, no proven polynomial
+    );
+
+  function xor_placment_of(len : natural) return std_logic_vector;
+end package lfsr_taps_pkg;
+
+package body lfsr_taps_pkg is
+
+  function xor_placment_of(len : natural) return std_logic_vector is
+    variable placment : std_logic_vector(len-1 downto 0) := (others => '0');
+  begin
+    assert LFSR_TAPS_ROM(len)(0) > 0
+      report "no proven primitive polynomial for LFSR_len " & natural'image(len)
+      severity failure;
+    placment(len-1) := '1';
+    for i in 0 to 2 loop
+      if LFSR_TAPS_ROM(len)(i) > 0 then
+        placment(LFSR_TAPS_ROM(len)(i)-1) := '1';
+      end if;
+    end loop;
+    return placment;
+  end function xor_placment_of;
+
+end package body lfsr_taps_pkg;
@@ -0,0 +1,155 @@
+"""
+Cycle-accurate model of select_slide_rand.vhd.
+
+2**w_slider RAND LFSRs of width w_LFSR are loaded with words derived from
+init_data_i and all move every clock once generation starts. The selector
+LFSR (loaded with init_data_i) is copied into a row of w_slider bit
+sliders every clock, and slide_sel walks down that row. output_rand_o is
+the RAND LFSR picked by the current slider.
+"""
+import numpy as np
+from LFSR_generic_model import REGISTERED_FEED, LFSR_generic, lfsr_block, reverse_bits
+
+
+class select_slide_rand(lfsr_block):
+    """
+    seeds: init_data_i of each instance (one instance per seed)
+    w_LFSR_g: LFSR width, 32 when outside 2..32, must be even
+    w_slider_g: slider width, 2 when below 4, otherwise 4
+    """
+
+    def __init__(self, seeds, w_LFSR_g=32, w_slider_g=4, registered_feed=REGISTERED_FEED):
+        self.w_slider = 2 if w_slider_g < 4 else 4
+        self.w_lfsr = w_LFSR_g if 2 <= w_LFSR_g <= 32 else 32
+        if self.w_lfsr % 2:
+            raise ValueError(f"w_LFSR_g must be even, got {w_LFSR_g}")
+        self.n_sliders = self.w_lfsr // self.w_slider
+        if self.n_sliders == 0:
+            raise ValueError("w_LFSR_g must be at least the slider width")
+        self.n_rand = 2**self.w_slider
+        super().__init__(seeds, self.w_lfsr, registered_feed)
+
+    def reset(self):
+        super().reset()
+        n_seeds = self.n_seeds
+        zeros = np.zeros(n_seeds, dtype=np.uint64)
+        self.selector_LFSR_data_in_r = zeros
+        self.LFSR_RAND_in_arr = np.zeros((n_seeds, self.n_rand), dtype=np.uint64)
+        self.w_2_init_03_done_r = False
+        self.w_2_init_12_done_r = False
+        self.w_4_init_s1_done_r = False
+        self.w_4_init_s2_done_r = False
+        # sliders_arr_r kept as one word, slider k in bits k*w_slider and up
+        self.sliders_arr_r = zeros
+        self.slide_sel = self.n_sliders - 1
+        self.output_rand_o_r = zeros
+        self.selector_LFSR = LFSR_generic(self.w_lfsr, (n_seeds,), registered_feed=self.registered_feed)
+        self.RAND_LFSRs = LFSR_generic(self.w_lfsr, (n_seeds, self.n_rand), registered_feed=self.registered_feed)
+
+    def _init_completes(self):
+        if self.w_slider == 2:
+            return self.enb_r and self.init_r and self.w_2_init_12_done_r
+        return self.enb_r and self.init_r and self.w_4_init_s2_done_r
+
+    @property
+    def slider_r(self):
+        shift = np.uint64(self.slide_sel * self.w_slider)
+        return (self.sliders_arr_r >> shift) & np.uint64(self.n_rand - 1)
+
+    def clock(self, enb=True, clr=False, init_i=False, init_data_i=None):
+        """
+        One rising clock edge, returns output_rand_o
+        """
+        w, s = self.w_lfsr, self.n_rand
+        half = np.uint64(w // 2)
+        low = np.uint64((1 << (w // 2)) - 1)
+        enb_r, clr_r, init_r = self.enb_r, self.clr_r, self.init_r
+        init_load = enb_r and self.init_done_r
+        arr = self.LFSR_RAND_in_arr
+        new = arr.copy()
+        sel_data = self.selector_LFSR_data_in_r
+        done_03, done_12 = self.w_2_init_03_done_r, self.w_2_init_12_done_r
+        done_s1, done_s2 = self.w_4_init_s1_done_r, self.w_4_init_s2_done_r
+
+        # LFSR_RAND_in_proc of w_slider_is_2 (always generated)
+        if enb_r:
+            if init_r:
+                self.selector_LFSR_data_in_r = self.init_data_r
+                new[:, 0] = ~self.init_data_r & self.data_mask
+                new[:, s - 1] = self.init_data_r
+                done_03 = True
+                if self.w_2_init_03_done_r:
+                    new[:, 1] = ((arr[:, 0] >> half) << half) | (arr[:, s - 1] >> half)
+                    new[:, s - 2] = ((arr[:, 0] & low) << half) | (arr[:, s - 1] & low)
+                    done_12 = True
+            if init_load:
+                done_03 = done_12 = False
+            if clr_r:
+                self.selector_LFSR_data_in_r = np.zeros(self.n_seeds, dtype=np.uint64)
+                new[:, [0, 1, s - 2, s - 1]] = 0
+                done_03 = done_12 = False
+
+        # LFSR_RAND_in_proc of w_slider_is_4
+        if enb_r and self.w_slider == 4:
+            if init_r and self.w_2_init_12_done_r:
+                new[:, 2] = reverse_bits(arr[:, 0], w)
+                new[:, 3] = reverse_bits(arr[:, 1], w)
+                new[:, s - 4] = reverse_bits(arr[:, s - 2], w)
+                new[:, s - 3] = reverse_bits(arr[:, s - 1], w)
+                done_s1 = True
+                if self.w_4_init_s1_done_r:
+                    for j, src in enumerate([0, 1, 2, 3, s - 4, s - 3, s - 2, s - 1]):
+                        new[:, 4 + j] = ~arr[:, src] & self.data_mask
+                    done_s2 = True
+            if init_load:
+                done_s1 = done_s2 = False
+            if clr_r:
+                new[:, 2:s - 2] = 0
+                done_s1 = done_s2 = False
+
+        # init_ctrl_proc
+        init_done, enb_gen = self.init_done_r, self.enb_gen_r
+        if enb_r:
+            if init_r:
+                enb_gen = False
+                if self._init_completes():
+                    init_done = True
+            elif init_load:
+                init_done = False
+                enb_gen = True
+            if clr_r:
+                init_done = enb_gen = False
+
+        # select_rand_o_proc
+        if enb_r:
+            if self.enb_gen_r:
+                sel = self.slider_r.astype(np.intp)
+                self.output_rand_o_r = np.take_along_axis(self.RAND_LFSRs.reg, sel[:, None], axis=1)[:, 0]
+            if clr_r:
+                self.output_rand_o_r = np.zeros(self.n_seeds, dtype=np.uint64)
+
+        # slider_r_proc, clocked by enb_gen_r alone
+        if self.enb_gen_r:
+            self.sliders_arr_r = self.selector_LFSR.reg & np.uint64((1 << (self.n_sliders * self.w_slider)) - 1)
+            self.slide_sel = self.n_sliders - 1 if self.slide_sel == 0 else self.slide_sel - 1
+            if clr_r:
+                self.slide_sel = self.n_sliders - 1
+                self.sliders_arr_r = np.zeros(self.n_seeds, dtype=np.uint64)
+
+        # LFSR instances
+        self.selector_LFSR.clock(init_load, sel_data, self.enb_gen_r)
+        self.RAND_LFSRs.clock(init_load, arr, self.enb_gen_r)
+
+        self.LFSR_RAND_in_arr = new
+        self.w_2_init_03_done_r, self.w_2_init_12_done_r = done_03, done_12
+        self.w_4_init_s1_done_r, self.w_4_init_s2_done_r = done_s1, done_s2
+        self.init_done_r, self.enb_gen_r = init_done, enb_gen
+        self.enb_r, self.clr_r, self.init_r, self.init_data_r = self._input_stage(enb, clr, init_i, init_data_i)
+        return self.output_rand_o_r
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = select_slide_rand([0x12345678, 0xCAFEF00D], w_LFSR_g=32, w_slider_g=4)
+    for row in rng.generate(8):
+        print([hex(v) for v in row])
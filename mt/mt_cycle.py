@@ -0,0 +1,196 @@
+"""
+Cycle model of mt.vhd.
+
+A word-by-word port of ctrl_proc, init_proc, twist_proc and gen_proc:
+every register of the VHDL is kept under its own name, the processes
+read the register values before the edge and all registers change
+together, a later assignment in a process winning over an earlier one.
+It is slow and only meant as the reference that mt_model.mt is checked
+against (see check()).
+
+  cyc = mt_cycle()
+  cyc.seed(0x1234)
+  words = cyc.words(1000)
+
+words() collects gen_word_r after each edge where gen_r was high, which
+is what mt_32_o shows, from the first word on: generation starts about
+half way through the seed init. mt_32_o holds its word for one clock in
+every n + 1, while twist_proc wraps twist_counter_r.
+"""
+from mt_model import PARAMS, find_config
+
+# port values when a port is not driven
+PORT_DEFAULTS = {'clr': 0, 'enb': 1, 'init_i': 0, 'seed_i': 0}
+
+
+class mt_cycle:
+    """
+    Registers of one mt_32 core. p, w and m select the configuration
+    like mt_model.mt (mt.vhd: p=3217, w=32, m=51).
+    """
+
+    def __init__(self, p=3217, w=32, m=None):
+        row = find_config(p, w)
+        self.n, self.w, self.r_split = row['n'], row['w'], row['r']
+        self.m = (self.n + 1) // 2 if m is None else m
+        for name, value in PARAMS[w].items():
+            setattr(self, name, value)
+        self.mask = (1 << w) - 1
+        self.lower_mask = (1 << (self.r_split + 1)) - 1
+        self.upper_mask = self.mask ^ self.lower_mask
+        self.mod_reg_arr = [i % self.n for i in range(self.n + self.m)]
+        self.cycle = 0
+        self.reset()
+
+    def reset(self):
+        """
+        rst = '0'
+        """
+        n = self.n
+        self.r = dict(clr_r=0, enb_r=0, init_r=0, twist_r=0, gen_r=0,
+                      mod_reg_arr_r=[0] * (n + self.m), mt_arr_r=[0] * n,
+                      init_mt_arr_r=[0] * n, init_counter_r=1, init_in_progress_r=0,
+                      init_done_r=0, init_err_r=0, start_twist_r=0,
+                      twist_counter_r=0, start_gen_r=0, twisted_word_r=0,
+                      gen_counter_r=0, gen_word_r=0)
+        # words loaded while seed() ran, handed out first by words()
+        self.pending = []
+
+    def clock(self, **ports):
+        """
+        One rising edge with the given port values (PORT_DEFAULTS for the
+        rest). Returns (init_done_o, mt_32_o, whether gen_word_r was
+        loaded) after the edge.
+        """
+        p = dict(PORT_DEFAULTS, **ports)
+        r = self.r
+        n = dict(r)
+        self._ctrl_proc(r, n, p)
+        if r['enb_r']:
+            self._init_proc(r, n, p)
+            self._twist_proc(r, n)
+            self._gen_proc(r, n)
+        self.r = n
+        self.cycle += 1
+        return n['init_done_r'], n['gen_word_r'], r['enb_r'] and r['gen_r']
+
+    def _ctrl_proc(self, r, n, p):
+        n['clr_r'], n['enb_r'], n['init_r'] = p['clr'], p['enb'], p['init_i']
+        if r['init_r']:
+            n['mod_reg_arr_r'] = self.mod_reg_arr
+        if not r['enb_r']:
+            return
+        mt_arr = n['mt_arr_r'] = list(r['mt_arr_r'])
+        if r['init_r'] and r['init_counter_r'] <= self.n:
+            k = r['init_counter_r'] - 1
+            mt_arr[k] = r['init_mt_arr_r'][k]
+        if r['gen_r']:
+            # the word generated on the previous edge, at the index it was generated
+            mt_arr[r['gen_counter_r']] = r['gen_word_r']
+        n['twist_r'] = r['start_twist_r']
+        n['gen_r'] = r['start_gen_r']
+        if r['clr_r']:
+            n['mt_arr_r'] = [0] * self.n
+            n['twist_r'] = n['gen_r'] = 0
+
+    def _init_proc(self, r, n, p):
+        counter = r['init_counter_r']
+        if r['init_r'] and counter < self.n:
+            init_arr = n['init_mt_arr_r'] = list(r['init_mt_arr_r'])
+            init_arr[0] = p['seed_i'] & self.mask
+            n['init_in_progress_r'] = 1
+            n['init_done_r'] = 0
+            if r['init_in_progress_r']:
+                word = r['init_mt_arr_r'][counter - 1]
+                init_arr[counter] = (self.f * (word ^ (word >> (self.w - 2))) + counter) & self.mask
+                n['init_counter_r'] = counter + 1
+        if counter == self.m + 1:
+            n['start_twist_r'] = 1
+        if counter == self.n:
+            n['init_done_r'] = 1
+            n['init_in_progress_r'] = 0
+        n['init_err_r'] = int(r['init_in_progress_r'] and not r['init_done_r'] and not r['init_r'])
+        if r['clr_r']:
+            n.update(init_mt_arr_r=[0] * self.n, init_counter_r=1, init_in_progress_r=0,
+                     init_done_r=0, init_err_r=0, start_twist_r=0)
+
+    def _twist_proc(self, r, n):
+        if r['start_twist_r']:
+            counter = r['twist_counter_r']
+            if counter < self.n:
+                mod_arr, mt_arr = r['mod_reg_arr_r'], r['mt_arr_r']
+                masked = (mt_arr[counter] & self.upper_mask) | (mt_arr[mod_arr[counter + 1]] & self.lower_mask)
+                shifted = (masked >> 1) ^ (self.a if masked & 1 else 0)
+                n['twisted_word_r'] = shifted ^ mt_arr[mod_arr[counter + self.m]]
+                n['twist_counter_r'] = counter + 1
+                n['start_gen_r'] = 1
+            else:
+                n['twist_counter_r'] = 0
+                n['start_gen_r'] = 0
+        if r['clr_r']:
+            n['twist_counter_r'] = 0
+            n['start_gen_r'] = 0
+
+    def _gen_proc(self, r, n):
+        if r['gen_r']:
+            y = r['twisted_word_r']
+            y ^= (y << self.u) & self.d
+            y ^= (y >> self.s) & self.b
+            y ^= (y >> self.t) & self.c
+            y ^= y << self.l
+            n['gen_word_r'] = y & self.mask
+            n['gen_counter_r'] = 0 if r['gen_counter_r'] == self.n - 1 else r['gen_counter_r'] + 1
+        if r['clr_r']:
+            n['gen_counter_r'] = 0
+            n['gen_word_r'] = 0
+
+    def seed(self, seed):
+        """
+        Hold init_i high with seed_i until init_done_o, then lower it.
+        Returns the clocks taken.
+        """
+        start = self.cycle
+        if not self.r['enb_r']:
+            self.clock()
+        while True:
+            done, word, loaded = self.clock(init_i=1, seed_i=seed)
+            if loaded:
+                self.pending.append(word)
+            if done:
+                return self.cycle - start
+
+    def words(self, count):
+        """
+        The next count words loaded into gen_word_r (mt_32_o), the
+        first ones coming out while seed() still runs
+        """
+        out, self.pending = self.pending[:count], self.pending[count:]
+        while len(out) < count:
+            _, word, loaded = self.clock()
+            if loaded:
+                out.append(word)
+        return out
+
+
+def check(seed=5489, count=1000, **config):
+    """
+    Index of the first word where mt_model.mt and mt_cycle differ after
+    seeding both with seed, None when count words agree
+    """
+    from mt_model import mt
+    cyc = mt_cycle(**config)
+    cyc.seed(seed)
+    ref = cyc.words(count)
+    model = mt(seed, **config).generate(count).tolist()
+    for i, (a, b) in enumerate(zip(ref, model)):
+        if a != b:
+            return i
+    return None
+
+
+# Example usage
+if __name__ == "__main__":
+    cyc = mt_cycle()
+    print(cyc.seed(0x1234), "clocks to seed")
+    print([hex(v) for v in cyc.words(8)])
+    print("first difference to mt_model:", check(0x1234))
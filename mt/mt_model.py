@@ -0,0 +1,180 @@
+"""
+Python model of the Mersenne Twister in mt.vhd, for any configuration
+listed in config_table.txt (32-bit and 64-bit tables).
+
+The arithmetic follows the VHDL datapath:
+  - seed init: mt[i] = f * (mt[i-1] xor (mt[i-1] >> (w-2))) + i
+  - twist: the lower mask is (r_split_idx_c downto 0 => '1'), i.e. r+1 bits
+  - tempering: the shift directions of gen_proc, which are the mirror of
+    the textbook ones (u and l shift left, s and t shift right)
+
+It also follows the schedule of the core, which is not textbook MT:
+  - ctrl_proc writes the *tempered* gen_word_r back into mt_arr_r, so
+    the twists read tempered words
+  - twisting starts while init is still running (init_counter_r = m+1)
+    and each round of n twists is followed by a clock where
+    twist_counter_r wraps. The first twist of every round is never
+    output, the last one is output twice, and the array slot of the
+    first twist is filled with that repeated word (with 0, the reset
+    value of gen_word_r, in the first round).
+
+As one sequence x, starting with the n init words:
+  x[k] = x[k-1]                                   k = n (mod n), k > n
+  x[k] = temper(twist(x[k-n], x[k-n+1]) ^ x[k-n+m])  otherwise
+with x[n] = 0, and the core outputs x[n+1], x[n+2], ... (mt_32_o after
+every clock with gen_r high, seeding with init_i held until
+init_done_o). mt_cycle.py is a register-level port of the VHDL this is
+checked against.
+
+Words in a run of n-m only depend on words before the run, so whole
+runs are twisted and tempered at once with NumPy.
+"""
+import os
+import numpy as np
+
+CONFIG_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config_table.txt')
+
+# twist coefficient, tempering shifts/masks and init multiplier per word width.
+# 32 bits are the constants of mt.vhd, 64 bits the MT19937-64 ones
+PARAMS = {
+    32: dict(a=0x9908B0DF, u=11, d=0xFFFFFFFF, s=7, b=0x9D2C5680,
+             t=15, c=0xEFC60000, l=18, f=0x6C078965),
+    64: dict(a=0xB5026F5AA96619E9, u=29, d=0x5555555555555555, s=17, b=0x71D67FFFEDA60000,
+             t=37, c=0xFFF7EEE000000000, l=43, f=6364136223846793005),
+}
+
+DTYPES = {32: np.uint32, 64: np.uint64}
+
+
+def load_config_table(path=CONFIG_TABLE):
+    """
+    Rows of config_table.txt as dicts with keys p, n, w and r
+    """
+    rows = []
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) >= 4 and all(v.isdigit() for v in fields[:4]):
+                p, n, w, r = (int(v) for v in fields[:4])
+                rows.append(dict(p=p, n=n, w=w, r=r))
+    return rows
+
+
+def find_config(p, w=32, path=CONFIG_TABLE):
+    """
+    The row of config_table.txt for mersenne prime p and word width w
+    """
+    for row in load_config_table(path):
+        if row['p'] == p and row['w'] == w:
+            return row
+    raise ValueError(f"No configuration for p={p}, w={w} in {path}")
+
+
+def init_state(seed, n, w, f):
+    """
+    mt array after the seed init of init_proc
+    """
+    mask = (1 << w) - 1
+    mt = [seed & mask]
+    for i in range(1, n):
+        prev = mt[-1]
+        mt.append((f * (prev ^ (prev >> (w - 2))) + i) & mask)
+    return np.array(mt, dtype=DTYPES[w])
+
+
+class mt:
+    """
+    Mersenne Twister of mt.vhd.
+
+    seed: seed_i
+    p, w: row of config_table.txt giving n and r
+    m: middle word, mt.vhd uses 51 for n = 101, which is the default
+       (n+1)//2 here
+    Any of a, u, d, s, b, t, c, l, f overrides the constant of PARAMS.
+    """
+
+    def __init__(self, seed=5489, p=3217, w=32, m=None, **constants):
+        row = find_config(p, w)
+        self.p, self.n, self.w, self.r = row['p'], row['n'], row['w'], row['r']
+        self.m = (self.n + 1) // 2 if m is None else m
+        if not 1 <= self.m < self.n:
+            raise ValueError(f"m must be in [1, {self.n}), got {self.m}")
+        unknown = set(constants) - set(PARAMS[w])
+        if unknown:
+            raise ValueError(f"Unknown constants {sorted(unknown)}")
+        params = dict(PARAMS[w], **constants)
+        self.dtype = DTYPES[w]
+        for name, value in params.items():
+            setattr(self, name, self.dtype(value))
+        self.lower_mask = self.dtype((1 << (self.r + 1)) - 1)
+        self.upper_mask = ~self.lower_mask
+        # x[n] = 0 is not output, the window starts after it
+        self.state = np.append(init_state(seed, self.n, w, params['f'])[1:], self.dtype(0))
+        self.phase = 1
+
+    def _raw(self, count):
+        """
+        Next count words of x; the last n are kept as the new state.
+        phase is the position of the next word in its round of n.
+        """
+        n, m = self.n, self.m
+        x = np.empty(n + count, dtype=self.dtype)
+        x[:n] = self.state
+        one = self.dtype(1)
+        k, phase = n, self.phase
+        while k < n + count:
+            if phase == 0:
+                # the repeated last word of the previous round
+                x[k] = x[k - 1]
+                k += 1
+                phase = 1
+                continue
+            end = min(k + n - m, k + n - phase, n + count)
+            lo = k - n
+            hi = end - n
+            y = (x[lo:hi] & self.upper_mask) | (x[lo + 1:hi + 1] & self.lower_mask)
+            x[k:end] = self.temper(x[lo + m:hi + m] ^ (y >> one) ^ ((y & one) * self.a))
+            phase = (phase + end - k) % n
+            k = end
+        self.state = x[-n:].copy()
+        self.phase = phase
+        return x[n:]
+
+    def twist(self):
+        """
+        Move on by n words, returns the last n words
+        """
+        self._raw(self.n)
+        return self.state
+
+    def temper(self, words):
+        """
+        gen_proc tempering of an array of twisted words
+        """
+        y = words ^ ((words << self.u) & self.d)
+        y ^= (y >> self.s) & self.b
+        y ^= (y >> self.t) & self.c
+        y ^= y << self.l
+        return y
+
+    def generate(self, count):
+        """
+        Next count output words (mt_32_o) as a NumPy array. Calls
+        continue from the current state, so long runs can be taken in
+        chunks.
+        """
+        return self._raw(count)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    gen = mt(seed=0x1234)
+    print([hex(v) for v in gen.generate(8)])
+
+    count = 10_000_000
+    start = time.perf_counter()
+    gen.generate(count)
+    elapsed = time.perf_counter() - start
+    print(f"{count / elapsed / 1e6:.1f} M words/s")
@@ -0,0 +1,110 @@
+"""
+Command line front end for the PCG models.
+
+  python -m pcg_cli pcg_xsh_rr_64 --seed 0x4d595df4d0f33173 --count 1000
+  python -m pcg_cli xsl_rr_128 --count 1000000 --format raw --out golden.bin
+  python -m pcg_cli rxs_m_xs_32 --count 300 --plot
+
+Run from this folder (or with it on PYTHONPATH). Only the model that is
+asked for is imported, and matplotlib only with --plot.
+"""
+import argparse
+import importlib
+import sys
+from array import array
+
+VARIANTS = ('pcg_rxs_m_xs_32', 'pcg_xsh_rr_64', 'pcg_xsh_rs_64', 'pcg_xsl_rr_128')
+
+# array typecode holding one output word of each width
+_TYPECODES = {16: 'H', 32: 'I', 64: 'Q'}
+
+
+def variant_name(name):
+    """
+    Accept 'pcg_xsh_rr_64' as well as the short 'xsh_rr_64'
+    """
+    if not name.startswith('pcg_'):
+        name = 'pcg_' + name
+    if name not in VARIANTS:
+        raise ValueError(f"Unknown PCG variant {name}, expected one of {VARIANTS}")
+    return name
+
+
+def load_variant(name):
+    """
+    Generator class of a variant, importing only its model module
+    """
+    name = variant_name(name)
+    return getattr(importlib.import_module(name + '_model'), name)
+
+
+def write_words(gen, count, fmt, f, chunk=1 << 16):
+    """
+    Write count words of gen to the file f, chunk words at a time.
+    fmt is 'hex', 'dec' or 'raw' (little-endian words of the output
+    width, f must then be opened in binary mode).
+    """
+    typecode = _TYPECODES[gen.out_bits]
+    while count > 0:
+        n = min(chunk, count)
+        words = gen.fill(n)
+        if fmt == 'raw':
+            out = array(typecode, words)
+            if sys.byteorder != 'little':
+                out.byteswap()
+            f.write(out.tobytes())
+        elif fmt == 'hex':
+            f.write(''.join(f'{hex(w)}\n' for w in words))
+        else:
+            f.write(''.join(f'{w}\n' for w in words))
+        count -= n
+
+
+def plot_words(words, out_bits):
+    """
+    Plot words scaled to [0, 1), as the model scripts always did
+    """
+    import matplotlib.pyplot as plt
+    plt.plot(range(len(words)), [w / (2**out_bits) for w in words])
+    # naming the x axis
+    plt.xlabel('x - axis')
+    # naming the y axis
+    plt.ylabel('y - axis')
+    plt.title('My first graph!')
+    plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pcg_cli', description=__doc__.split('\n\n')[0])
+    parser.add_argument('variant', help='pcg_rxs_m_xs_32, pcg_xsh_rr_64, pcg_xsh_rs_64 or pcg_xsl_rr_128')
+    parser.add_argument('--seed', type=lambda v: int(v, 0), help='seed_r (default: the model default)')
+    parser.add_argument('--count', type=int, default=10, help='number of output words')
+    parser.add_argument('--skip', type=int, default=0, help='words to jump over before output')
+    parser.add_argument('--format', choices=('hex', 'dec', 'raw'), default='hex')
+    parser.add_argument('--out', help='output file (default: stdout)')
+    parser.add_argument('--plot', action='store_true', help='plot the words instead of writing them')
+    args = parser.parse_args(argv)
+
+    try:
+        cls = load_variant(args.variant)
+    except ValueError as e:
+        parser.error(str(e))
+    gen = cls() if args.seed is None else cls(args.seed)
+    if args.skip:
+        gen.advance(args.skip)
+
+    if args.plot:
+        plot_words(list(gen.fill(args.count)), gen.out_bits)
+        return
+
+    mode = 'wb' if args.format == 'raw' else 'w'
+    if args.out:
+        with open(args.out, mode) as f:
+            write_words(gen, args.count, args.format, f)
+    else:
+        f = sys.stdout.buffer if args.format == 'raw' else sys.stdout
+        write_words(gen, args.count, args.format, f)
+
+
+if __name__ == "__main__":
+    main()
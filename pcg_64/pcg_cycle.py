@@ -0,0 +1,528 @@
+"""
+Cycle models of the PCG cores.
+
+The *_model.py generators give one output word per call. The classes here
+keep every register of the VHDL instead, with the same names, and clock
+them like the RTL does: ctrl_proc, init_proc and gen_proc are evaluated
+on the register values before the edge and all registers change
+together, a later assignment in a process winning over an earlier one.
+So enb/clr/init reach the pipeline one clock late (through enb_r, clr_r,
+init_r), the seed reaches state_r on the third edge after init_i, and a
+word comes out of gen_word_r every second enabled clock (gen_1_r/gen_2_r).
+
+With reseed_i held low state_r is not advanced and the core repeats
+its word, as in the RTL.
+
+Fmax is set by the state feedback loop: state_r -> multiplier -> adder
+-> state_r (-> xorshift -> multiplier -> state_r in RXS-M-XS). To try
+a retimed core before changing the VHDL:
+  mult_stages  registers inside the multiplier (state_mult_p_r<i>)
+  add_stages   registers inside the +incr_r adder (state_add_p_r<i>),
+               on the cores that have one
+Both lengthen the loop: stage 2 then follows stage 1 after
+loop_clocks = 2 + mult_stages + add_stages clocks (counted by the
+model register gen_wait_r) and a word comes out every loop_clocks
+clocks, words_per_clock = 1 / loop_clocks. The words themselves do not
+change. With no stages the registers and traces are those of the RTL.
+out_stages adds that many registers behind the output word
+(gen_word_p_r), which adds latency but leaves the loop alone; word_vld
+is a model-only flag following the word through them.
+
+  cyc = pcg_xsh_rr_64_cycle(tracer=file_trace(open('cyc.txt', 'w')))
+  cyc.seed(0x4d595df4d0f33173, mult=6364136223846793005, incr=1442695040888963407)
+  words = cyc.words(1000)
+
+Each clock is recorded as stage 'cycle' through the tracer interface of
+pcg_trace.py. check_trace() replays an RTL trace in that format (ports
+before the edge, registers after it) and returns the first cycle where a
+register differs.
+"""
+from abc import ABC, abstractmethod
+from pcg_engine import rxs_incr_r, rxs_mult_factor_c, rxs_shift_added_value_c
+from pcg_trace import file_trace, ring_trace
+
+# port values when a port is not driven
+PORT_DEFAULTS = {'clr': 0, 'enb': 1, 'init_i': 0, 'seed_i': 0, 'mult_i': 0, 'incr_i': 0,
+                 'reseed_i': 1}
+
+CTRL_REGS = ('clr_r', 'enb_r', 'init_r', 'reseed_r')
+
+
+def _held(value):
+    """
+    Whether a run() port value is held for all clocks (a scalar,
+    numpy ones included) rather than given per clock
+    """
+    try:
+        len(value)
+    except TypeError:
+        return True
+    return False
+
+
+class pcg_cycle(ABC):
+    """
+    Registers of one PCG core. A variant lists its init and gen
+    registers (reset value 0) and implements _init_proc/_gen_proc,
+    reading r (before the edge) and assigning n (after it). A variant
+    with a multiplier pipeline implements _mult_in (the multiplier
+    product of the registers before the edge) and names the register
+    after it in mult_reg; one with an adder implements _add_in.
+    """
+    name = None
+    init_regs = ()
+    gen_regs = ()
+    word_reg = 'gen_word_r'
+    mult_reg = 'state_mult_r'
+    has_adder = False
+    out_bits = None
+
+    def __init__(self, out_stages=0, tracer=None, mult_stages=0, add_stages=0):
+        if add_stages and not self.has_adder:
+            raise ValueError(f"{self.name} has no adder in its state loop")
+        if mult_stages < 0 or add_stages < 0:
+            raise ValueError("Pipeline stages cannot be negative")
+        self.out_stages = out_stages
+        self.mult_stages = mult_stages
+        self.add_stages = add_stages
+        self.mult_pipe = tuple(f'state_mult_p_r{i}' for i in range(mult_stages))
+        self.add_pipe = tuple(f'state_add_p_r{i}' for i in range(add_stages))
+        if mult_stages or add_stages:
+            self.gen_regs = self.gen_regs + ('gen_wait_r',) + self.mult_pipe + self.add_pipe
+        self.tracer = tracer
+        self.cycle = 0
+        self.reset()
+
+    @property
+    def loop_clocks(self):
+        """
+        Clocks around the state feedback loop, the clocks per word
+        """
+        return 2 + self.mult_stages + self.add_stages
+
+    @property
+    def words_per_clock(self):
+        return 1 / self.loop_clocks
+
+    def reset(self):
+        """
+        rst = '0': every register back to 0
+        """
+        self.r = dict.fromkeys(CTRL_REGS + self.init_regs + self.gen_regs, 0)
+        self.r['word_vld'] = 0
+        self.pipe = [(0, 0)] * self.out_stages
+
+    def clock(self, **ports):
+        """
+        One rising edge with the given port values (PORT_DEFAULTS for the
+        rest). Returns (init_done_o, output word, word_vld) after the edge.
+        """
+        p = dict(PORT_DEFAULTS, **ports)
+        r = self.r
+        n = dict(r)
+        # ctrl_proc
+        n['clr_r'], n['enb_r'], n['init_r'], n['reseed_r'] = p['clr'], p['enb'], p['init_i'], p['reseed_i']
+        n['word_vld'] = 0
+        if r['enb_r']:
+            self._init_proc(r, n, p)
+            if r['clr_r']:
+                for name in self.init_regs:
+                    n[name] = 0
+            self._gen_proc(r, n)
+            if self.mult_pipe or self.add_pipe:
+                self._pipe_proc(r, n)
+            n['word_vld'] = r['gen_2_r']
+            if r['clr_r']:
+                for name in self.gen_regs:
+                    n[name] = 0
+                n['word_vld'] = 0
+        if self.out_stages:
+            # retiming registers behind gen_word_r, not gated by enb_r
+            self.pipe = [(r[self.word_reg], r['word_vld'])] + self.pipe[:-1]
+        self.r = n
+        self.cycle += 1
+        if self.tracer is not None:
+            self.tracer.record('cycle', self.fields(p))
+        return self.outputs()
+
+    def outputs(self):
+        if self.out_stages:
+            word, vld = self.pipe[-1]
+        else:
+            word, vld = self.r[self.word_reg], self.r['word_vld']
+        return self.r['seeded_r'], word, vld
+
+    def fields(self, ports=None):
+        """
+        Ports (when given) and registers of the current cycle, for a tracer
+        """
+        fields = {'cycle': self.cycle}
+        if ports is not None:
+            fields.update((k, ports[k]) for k in self.ports)
+        fields.update(self.r)
+        for i, (word, vld) in enumerate(self.pipe):
+            fields[f'gen_word_p_r{i}'] = word
+        return fields
+
+    def run(self, cycles, **ports):
+        """
+        cycles clocks in one batch. A port value is either held for all
+        clocks or given as a sequence with one value per clock. Returns
+        the lists init_done_o, word and word_vld, one entry per clock.
+        """
+        held = {k: v for k, v in ports.items() if _held(v)}
+        varying = {k: v for k, v in ports.items() if not _held(v)}
+        init_done, words, vld = [], [], []
+        clock = self.clock
+        for i in range(cycles):
+            out = clock(**held, **{k: v[i] for k, v in varying.items()})
+            init_done.append(out[0])
+            words.append(out[1])
+            vld.append(out[2])
+        return init_done, words, vld
+
+    def seed_ports(self, seed, mult=0, incr=0):
+        """
+        Port values of the clocks that seed the core. init_proc samples
+        seed_i one clock after init_i (when init_r is high), so the
+        seed is held for a clock after init_i drops.
+        """
+        ports = dict(seed_i=seed, mult_i=mult, incr_i=incr)
+        return [dict(ports, init_i=1), dict(ports, init_i=0)]
+
+    def seed(self, seed, mult=0, incr=0):
+        """
+        Drive init_i for a seed, then lower it. Returns the clocks taken
+        until init_done_o has come and gone (state_r then holds the
+        seeded state).
+        """
+        start = self.cycle
+        if not self.r['enb_r']:
+            # enb only reaches init_proc through enb_r
+            self.clock()
+        seeded = 0
+        for ports in self.seed_ports(seed, mult, incr):
+            seeded |= self.clock(**ports)[0]
+        while not seeded:
+            seeded = self.clock()[0]
+        if self.r['seeded_r']:
+            self.clock()
+        return self.cycle - start
+
+    def words(self, count, reseed=1):
+        """
+        Next count valid output words, clocking with enb held high
+        """
+        out = []
+        clock = self.clock
+        while len(out) < count:
+            _, word, vld = clock(reseed_i=reseed)
+            if vld:
+                out.append(word)
+        return out
+
+    def _init_proc(self, r, n, p):
+        if r['init_r']:
+            for name in self.init_regs[:-1]:
+                n[name] = p[name[:-2] + '_i']
+            n['seeded_r'] = 1
+        else:
+            n['seeded_r'] = 0
+
+    @abstractmethod
+    def _gen_proc(self, r, n):
+        """
+        gen_proc of the core
+        """
+
+    def _mult_in(self, r):
+        raise ValueError(f"{self.name} has no multiplier model")
+
+    def _add_in(self, r):
+        raise ValueError(f"{self.name} has no adder")
+
+    def _pipe_proc(self, r, n):
+        """
+        The pipeline registers of mult_stages/add_stages, clocked every
+        enabled edge, and the wait between stage 1 and stage 2
+        """
+        if self.mult_pipe:
+            n[self.mult_pipe[0]] = self._mult_in(r)
+            for prev, name in zip(self.mult_pipe, self.mult_pipe[1:]):
+                n[name] = r[prev]
+            if self.mult_reg:
+                n[self.mult_reg] = r[self.mult_pipe[-1]]
+        if self.add_pipe:
+            n[self.add_pipe[0]] = self._add_in(r)
+            for prev, name in zip(self.add_pipe, self.add_pipe[1:]):
+                n[name] = r[prev]
+        if r['seeded_r']:
+            n['gen_wait_r'] = 0
+        elif r['gen_wait_r']:
+            n['gen_wait_r'] = r['gen_wait_r'] - 1
+            if r['gen_wait_r'] == 1:
+                n['gen_2_r'] = 1
+
+    def _stage_1_done(self, n):
+        """
+        Hand over from stage 1 to stage 2, loop_clocks - 2 clocks later
+        """
+        n['gen_1_r'] = 0
+        wait = self.mult_stages + self.add_stages
+        if wait:
+            n['gen_wait_r'] = wait
+        else:
+            n['gen_2_r'] = 1
+
+    def _product(self, r):
+        """
+        Multiplier output at stage 2 when the multiplier is pipelined
+        """
+        return r[self.mult_pipe[-1]]
+
+    def _sum(self, r, value):
+        """
+        state_r input at stage 2: value computed now, or the sum at the
+        end of the adder pipeline
+        """
+        return r[self.add_pipe[-1]] if self.add_pipe else value
+
+
+class pcg_xsh_rr_64_cycle(pcg_cycle):
+    """
+    pcg_xsh_rr_64.vhd
+    """
+    name = 'pcg_xsh_rr_64'
+    ports = ('clr', 'enb', 'init_i', 'seed_i', 'mult_i', 'incr_i', 'reseed_i')
+    init_regs = ('seed_r', 'mult_r', 'incr_r', 'seeded_r')
+    gen_regs = ('state_r', 'gen_1_r', 'gen_2_r', 'state_mult_r', 'right_shfts_r',
+                'left_shfts_r', 'gen_stage_2_r', 'gen_word_r')
+    has_adder = True
+    out_bits = 32
+
+    def _mult_in(self, r):
+        return r['state_r'] * r['mult_r']
+
+    def _add_in(self, r):
+        return (r['state_mult_r'] + r['incr_r']) & 0xFFFFFFFFFFFFFFFF
+
+    def _gen_proc(self, r, n):
+        if r['seeded_r']:
+            n['state_r'] = (r['seed_r'] + r['incr_r']) & 0xFFFFFFFFFFFFFFFF
+            n['gen_1_r'], n['gen_2_r'] = 1, 0
+        # Gen Stage 1
+        if r['gen_1_r'] and not r['seeded_r']:
+            stage_0_v = r['state_r']
+            if not self.mult_stages:
+                n['state_mult_r'] = stage_0_v * r['mult_r']
+            stage_1_v = stage_0_v ^ ((stage_0_v << 18) & 0xFFFFFFFFFFFFFFFF)
+            right_shfts_v = stage_0_v >> 59
+            n['gen_stage_2_r'] = stage_1_v >> 27
+            n['right_shfts_r'] = right_shfts_v
+            n['left_shfts_r'] = -right_shfts_v & 31
+            self._stage_1_done(n)
+        # Gen Stage 2
+        if r['gen_2_r']:
+            gen_stage_2_r = r['gen_stage_2_r']
+            if r['reseed_r']:
+                n['state_r'] = self._sum(r, self._add_in(r))
+            gen_word_v = (gen_stage_2_r >> r['right_shfts_r']) | (gen_stage_2_r << r['left_shfts_r'])
+            n['gen_word_r'] = gen_word_v & 0xFFFFFFFF
+            n['gen_1_r'], n['gen_2_r'] = 1, 0
+
+
+class pcg_xsh_rs_64_cycle(pcg_cycle):
+    """
+    pcg_xsh_rs_64.vhd
+    """
+    name = 'pcg_xsh_rs_64'
+    ports = ('clr', 'enb', 'init_i', 'seed_i', 'mult_i', 'reseed_i')
+    init_regs = ('seed_r', 'mult_r', 'seeded_r')
+    gen_regs = ('state_r', 'gen_1_r', 'gen_2_r', 'state_mult_r', 'stage_1_r',
+                'right_shfts_r', 'gen_word_r')
+    out_bits = 32
+
+    def _mult_in(self, r):
+        return (r['state_r'] * r['mult_r']) & 0xFFFFFFFFFFFFFFFF
+
+    def _gen_proc(self, r, n):
+        if r['seeded_r']:
+            n['state_r'] = (2 * r['seed_r'] + 1) & 0xFFFFFFFFFFFFFFFF
+            n['gen_1_r'], n['gen_2_r'] = 1, 0
+        # Gen Stage 1
+        if r['gen_1_r'] and not r['seeded_r']:
+            stage_0_v = r['state_r']
+            if not self.mult_stages:
+                n['state_mult_r'] = (stage_0_v * r['mult_r']) & 0xFFFFFFFFFFFFFFFF
+            n['stage_1_r'] = stage_0_v ^ ((stage_0_v << 22) & 0xFFFFFFFFFFFFFFFF)
+            n['right_shfts_r'] = (stage_0_v >> 61) + 22
+            self._stage_1_done(n)
+        # Gen Stage 2
+        if r['gen_2_r']:
+            if r['reseed_r']:
+                n['state_r'] = r['state_mult_r']
+            n['gen_word_r'] = (r['stage_1_r'] >> r['right_shfts_r']) & 0xFFFFFFFF
+            n['gen_1_r'], n['gen_2_r'] = 1, 0
+
+
+class pcg_rxs_m_xs_32_cycle(pcg_cycle):
+    """
+    pcg_rxs_m_xs_32.vhd (without the *_v_r copies of its variables)
+    """
+    name = 'pcg_rxs_m_xs_32'
+    ports = ('clr', 'enb', 'init_i', 'seed_i', 'incr_i', 'reseed_i')
+    init_regs = ('seed_r', 'incr_r', 'seeded_r')
+    gen_regs = ('state_r', 'gen_1_r', 'gen_2_r', 'stage_1_r', 'gen_word_r')
+    # the multiplier is in stage 2, its product is not registered
+    mult_reg = None
+    out_bits = 16
+
+    def _mult_in(self, r):
+        return r['stage_1_r'] * rxs_mult_factor_c
+
+    def _gen_proc(self, r, n):
+        if r['seeded_r']:
+            n['state_r'] = (r['seed_r'] + r['incr_r']) & 0xFFFFFFFF
+            n['gen_1_r'], n['gen_2_r'] = 1, 0
+        # Gen Stage 1
+        if r['gen_1_r'] and not r['seeded_r']:
+            stage_0_v = r['state_r']
+            right_shfts_v = (stage_0_v >> 28) + rxs_shift_added_value_c
+            n['stage_1_r'] = stage_0_v ^ (stage_0_v >> right_shfts_v)
+            self._stage_1_done(n)
+        # Gen Stage 2
+        if r['gen_2_r']:
+            if self.mult_stages:
+                stage_2_mult_v = self._product(r)
+            else:
+                stage_2_mult_v = r['stage_1_r'] * rxs_mult_factor_c
+            stage_2_22_r_shfts_v = stage_2_mult_v >> 22
+            if r['reseed_r']:
+                n['state_r'] = stage_2_22_r_shfts_v & 0xFFFFFFFF
+            gen_word_v = stage_2_mult_v ^ stage_2_22_r_shfts_v
+            n['gen_word_r'] = (gen_word_v >> (48 - rxs_shift_added_value_c)) & 0xFFFF
+            n['gen_1_r'], n['gen_2_r'] = 1, 0
+
+    def seed(self, seed, mult=0, incr=rxs_incr_r):
+        return super().seed(seed, mult, incr)
+
+
+class pcg_xsl_rr_128_cycle(pcg_cycle):
+    """
+    pcg_xsl_rr_128.vhd. The 128-bit seed is shifted in through the 64-bit
+    seed_i, upper half first, so init_i is held for three clocks.
+    """
+    name = 'pcg_xsl_rr_128'
+    ports = ('clr', 'enb', 'init_i', 'seed_i', 'mult_i', 'incr_i', 'reseed_i')
+    init_regs = ('seed_init_128_r', 'seed_128_r', 'mult_r', 'incr_r', 'seeded_r',
+                 'seed_128_0_r', 'seed_128_1_r')
+    gen_regs = ('state_128_r', 'gen_1_r', 'gen_2_r', 'state_128_mult_r', 'right_128_shfts_r',
+                'left_128_shfts_r', 'gen_128_stage_2_r', 'gen_128_word_r')
+    word_reg = 'gen_128_word_r'
+    mult_reg = 'state_128_mult_r'
+    has_adder = True
+    out_bits = 64
+
+    def _mult_in(self, r):
+        return r['state_128_r'] * r['mult_r']
+
+    def _add_in(self, r):
+        return (r['state_128_mult_r'] + r['incr_r']) & ((1 << 128) - 1)
+
+    def _init_proc(self, r, n, p):
+        if r['init_r']:
+            n['mult_r'], n['incr_r'] = p['mult_i'], p['incr_i']
+            if not r['seed_128_1_r']:
+                low = p['seed_i'] & 0xFFFFFFFFFFFFFFFF
+                n['seed_init_128_r'] = (r['seed_init_128_r'] & ~0xFFFFFFFFFFFFFFFF) | low
+                n['seed_128_0_r'] = 1
+                if r['seed_128_0_r']:
+                    n['seed_init_128_r'] = ((r['seed_init_128_r'] & 0xFFFFFFFFFFFFFFFF) << 64) | low
+                    n['seed_128_1_r'] = 1
+                    n['seed_128_0_r'] = 0
+            else:
+                n['seeded_r'] = 1
+                n['seed_128_r'] = r['seed_init_128_r']
+        else:
+            n['seeded_r'] = 0
+            n['seed_128_1_r'] = 0
+            n['seed_128_0_r'] = 0
+
+    def _gen_proc(self, r, n):
+        mask_128 = (1 << 128) - 1
+        if r['seeded_r']:
+            n['state_128_r'] = (r['seed_128_r'] + r['incr_r']) & mask_128
+            n['gen_1_r'], n['gen_2_r'] = 1, 0
+        # Gen Stage 1
+        if r['gen_1_r'] and not r['seeded_r']:
+            stage_128_0_v = r['state_128_r']
+            right_128_shfts_v = stage_128_0_v >> 122
+            if not self.mult_stages:
+                n['state_128_mult_r'] = stage_128_0_v * r['mult_r']
+            n['gen_128_stage_2_r'] = stage_128_0_v ^ ((stage_128_0_v << 64) & mask_128)
+            n['right_128_shfts_r'] = right_128_shfts_v
+            n['left_128_shfts_r'] = -right_128_shfts_v & 63
+            self._stage_1_done(n)
+        # Gen Stage 2
+        if r['gen_2_r']:
+            gen_128_stage_2_r = r['gen_128_stage_2_r']
+            if r['reseed_r']:
+                n['state_128_r'] = self._sum(r, self._add_in(r))
+            gen_128_word_v = ((gen_128_stage_2_r >> r['right_128_shfts_r']) |
+                              (gen_128_stage_2_r << r['left_128_shfts_r']))
+            n['gen_128_word_r'] = gen_128_word_v & 0xFFFFFFFFFFFFFFFF
+            n['gen_1_r'], n['gen_2_r'] = 1, 0
+
+    def seed_ports(self, seed, mult=0, incr=0):
+        ports = dict(init_i=1, mult_i=mult, incr_i=incr)
+        high, low = seed >> 64, seed & 0xFFFFFFFFFFFFFFFF
+        return [dict(ports, seed_i=high), dict(ports, seed_i=high), dict(ports, seed_i=low),
+                dict(ports, seed_i=low, init_i=0)]
+
+
+CYCLE_MODELS = {c.name: c for c in (pcg_rxs_m_xs_32_cycle, pcg_xsh_rr_64_cycle,
+                                    pcg_xsh_rs_64_cycle, pcg_xsl_rr_128_cycle)}
+
+
+def read_trace(f):
+    """
+    Records of a trace file in the file_trace format, as (stage, fields)
+    with the values as ints
+    """
+    for line in f:
+        stage, *pairs = line.split()
+        fields = {}
+        for pair in pairs:
+            name, value = pair.split('=', 1)
+            fields[name] = int(value, 0)
+        yield stage, fields
+
+
+def check_trace(model, records):
+    """
+    Clock model with the ports of each 'cycle' record and compare the
+    registers both have. Returns None when all match, else (cycle,
+    {name: (model value, trace value)}) of the first difference.
+    """
+    for stage, fields in records:
+        if stage != 'cycle':
+            continue
+        model.clock(**{k: fields[k] for k in model.ports if k in fields})
+        mine = model.fields()
+        diff = {k: (mine[k], v) for k, v in fields.items()
+                if k in mine and k not in ('cycle',) + model.ports and mine[k] != v}
+        if diff:
+            return fields.get('cycle', model.cycle), diff
+    return None
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+    cyc = pcg_xsh_rr_64_cycle(tracer=ring_trace(depth=16))
+    print("seeded after", cyc.seed(0x4d595df4d0f33173, 6364136223846793005, 1442695040888963407), "clocks")
+    for word in cyc.words(8):
+        print(hex(word))
+    tracer = file_trace(sys.stdout)
+    for fields in cyc.tracer.rows('cycle')[-4:]:
+        tracer.record('cycle', fields)
@@ -0,0 +1,308 @@
+"""
+Shared state engine for the PCG reference models.
+
+pcg_xsh_rr_64, pcg_xsh_rs_64 and pcg_xsl_rr_128 move their state with an
+LCG (the XSH-RS core has no increment, so it is an MCG), which can be
+jumped any number of steps in O(log delta) multiplies using the
+method from F. Brown, "Random Number Generation with Arbitrary
+Stride" (1994).
+
+pcg_rxs_m_xs_32 (the model and the VHDL) feeds the next state back from
+the RXS-M output path, so it is not an LCG. Its 32-bit state walks a
+rho shaped path (tail then cycle), found once with Brent's algorithm,
+after which any jump is reduced to at most tail + cycle steps.
+"""
+from abc import ABC, abstractmethod
+from array import array
+
+# LCG parameters of each variant, as used by run_pcg() in the models
+LCG_PARAMS = {
+    'pcg_xsh_rr_64':  dict(mult=6364136223846793005, incr=1442695040888963407, bits=64),
+    'pcg_xsh_rs_64':  dict(mult=6364136223846793005, incr=0, bits=64),
+    'pcg_xsl_rr_128': dict(mult=6364136223846793005, incr=1442695040888963407, bits=128),
+}
+
+rxs_shift_added_value_c = 4
+rxs_mult_factor_c = 1857494364
+rxs_incr_r = 3614764435
+
+
+def lcg_advance(state, delta, mult, incr, bits):
+    """
+    Jump an LCG state by delta steps (negative delta goes backwards).
+    """
+    mask = (1 << bits) - 1
+    delta &= mask
+    acc_mult, acc_plus = 1, 0
+    cur_mult, cur_plus = mult & mask, incr & mask
+    while delta:
+        if delta & 1:
+            acc_mult = (acc_mult * cur_mult) & mask
+            acc_plus = (acc_plus * cur_mult + cur_plus) & mask
+        cur_plus = ((cur_mult + 1) * cur_plus) & mask
+        cur_mult = (cur_mult * cur_mult) & mask
+        delta >>= 1
+    return (acc_mult * state + acc_plus) & mask
+
+
+def lcg_distance(from_state, to_state, mult, incr, bits):
+    """
+    Number of steps from from_state to to_state of a full period LCG
+    (odd mult, odd incr), found bit by bit in O(bits) multiplies.
+    """
+    mask = (1 << bits) - 1
+    cur_mult, cur_plus = mult & mask, incr & mask
+    cur_state = from_state & mask
+    to_state &= mask
+    distance = 0
+    bit = 1
+    while cur_state != to_state:
+        if bit > mask:
+            raise ValueError("to_state is not on the stream of from_state")
+        if (cur_state & bit) != (to_state & bit):
+            cur_state = (cur_state * cur_mult + cur_plus) & mask
+            distance |= bit
+        cur_plus = ((cur_mult + 1) * cur_plus) & mask
+        cur_mult = (cur_mult * cur_mult) & mask
+        bit <<= 1
+    return distance
+
+
+def rxs_m_xs_32_next_state(state_r):
+    """
+    State feedback of pcg_rxs_m_xs_32: bits 53..22 of the RXS-M product.
+    """
+    right_shfts_v = (state_r >> 28) + rxs_shift_added_value_c
+    stage_1_v = state_r ^ (state_r >> right_shfts_v)
+    return ((stage_1_v * rxs_mult_factor_c) >> 22) & 0xFFFFFFFF
+
+
+def find_rho(state, next_state):
+    """
+    Brent's cycle detection. Returns (tail, cycle) lengths of the path
+    of next_state starting at state.
+    """
+    power = cycle = 1
+    tortoise = state
+    hare = next_state(state)
+    while tortoise != hare:
+        if power == cycle:
+            tortoise = hare
+            power *= 2
+            cycle = 0
+        hare = next_state(hare)
+        cycle += 1
+    tortoise = hare = state
+    for _ in range(cycle):
+        hare = next_state(hare)
+    tail = 0
+    while tortoise != hare:
+        tortoise = next_state(tortoise)
+        hare = next_state(hare)
+        tail += 1
+    return tail, cycle
+
+
+class lcg:
+    """
+    LCG state of a PCG variant with O(log delta) jump-ahead.
+    """
+    __slots__ = ('state', 'mult', 'incr', 'bits', 'mask')
+
+    def __init__(self, state, mult, incr, bits):
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.state = state & self.mask
+        self.mult = mult
+        self.incr = incr
+
+    @classmethod
+    def variant(cls, name, state):
+        return cls(state, **LCG_PARAMS[name])
+
+    def step(self):
+        self.state = (self.state * self.mult + self.incr) & self.mask
+        return self.state
+
+    def advance(self, delta):
+        self.state = lcg_advance(self.state, delta, self.mult, self.incr, self.bits)
+        return self.state
+
+    def period(self):
+        """
+        2^bits for an LCG with odd increment, 2^(bits-2) for the MCG
+        """
+        if self.incr & 1:
+            return self.mask + 1
+        return (self.mask + 1) >> 2
+
+    def copy(self):
+        return lcg(self.state, self.mult, self.incr, self.bits)
+
+    def substreams(self, count, stride=None):
+        """
+        count copies of the stream, copy i starting stride * i steps
+        ahead. The default stride splits the whole period evenly so the
+        substreams never overlap.
+        """
+        if stride is None:
+            stride = self.period() // count
+        streams = []
+        for i in range(count):
+            sub = self.copy()
+            sub.advance(stride * i)
+            streams.append(sub)
+        return streams
+
+
+class rxs_m_xs_32_state:
+    """
+    State of pcg_rxs_m_xs_32 with the same interface as lcg. Jumps
+    first walk the tail, then wrap the rest around the cycle.
+    """
+    __slots__ = ('state', 'tail', 'cycle')
+
+    def __init__(self, state):
+        self.state = state & 0xFFFFFFFF
+        self.tail = None
+        self.cycle = None
+
+    def step(self):
+        self.state = rxs_m_xs_32_next_state(self.state)
+        return self.state
+
+    def advance(self, delta):
+        if delta < 0:
+            raise ValueError("rxs_m_xs_32 state feedback cannot be reversed")
+        if self.cycle is None:
+            self.tail, self.cycle = find_rho(self.state, rxs_m_xs_32_next_state)
+        if delta > self.tail:
+            delta = self.tail + (delta - self.tail) % self.cycle
+        state = self.state
+        for _ in range(delta):
+            state = rxs_m_xs_32_next_state(state)
+        self.state = state
+        # what is left of the tail from the new state
+        self.tail = max(self.tail - delta, 0)
+        return state
+
+    def copy(self):
+        sub = rxs_m_xs_32_state(self.state)
+        sub.tail, sub.cycle = self.tail, self.cycle
+        return sub
+
+    def substreams(self, count, stride=None):
+        """
+        count copies of the stream, copy i starting stride * i steps
+        ahead. Copies only stay disjoint while stride * count fits in
+        the cycle; the default stride is the cycle split evenly.
+        """
+        if self.cycle is None:
+            self.tail, self.cycle = find_rho(self.state, rxs_m_xs_32_next_state)
+        if stride is None:
+            stride = max(self.cycle // count, 1)
+        streams = []
+        for i in range(count):
+            sub = self.copy()
+            sub.advance(stride * i)
+            streams.append(sub)
+        return streams
+
+
+def pcg_state(name, state):
+    """
+    Stepping/jumping state object for a variant, state being the value
+    held in state_r (after the seed init).
+    """
+    if name == 'pcg_rxs_m_xs_32':
+        return rxs_m_xs_32_state(state)
+    return lcg.variant(name, state)
+
+
+def init_state(name, seed_r):
+    """
+    Value of state_r after the seed init of a variant, i.e. the state
+    the first output word is generated from.
+    """
+    if name == 'pcg_rxs_m_xs_32':
+        return (seed_r + rxs_incr_r) & 0xFFFFFFFF
+    params = LCG_PARAMS[name]
+    mask = (1 << params['bits']) - 1
+    if name == 'pcg_xsh_rs_64':
+        return (2 * seed_r + 1) & mask
+    return (seed_r + params['incr']) & mask
+
+
+def state_at(name, seed_r, k):
+    """
+    state_r that output word k (0 being the first word after init) is
+    generated from, without stepping through the first k words.
+    """
+    state = pcg_state(name, init_state(name, seed_r))
+    state.advance(k)
+    return state.state
+
+
+class pcg_base(ABC):
+    """
+    Common part of the per-variant PCG generator classes. A variant
+    sets name/bits (state width)/out_bits (output word width) and
+    implements next(), which returns one output word and moves the
+    state on.
+    """
+    __slots__ = ('state', 'mult', 'incr')
+    name = None
+    bits = None
+    out_bits = None
+
+    @abstractmethod
+    def next(self):
+        """
+        One output word, moving the state on
+        """
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def fill(self, n, out=None):
+        """
+        Next n output words in an array('Q')
+        """
+        if out is None:
+            out = array('Q', bytes(8 * n))
+        next_word = self.next
+        for i in range(n):
+            out[i] = next_word()
+        return out
+
+    def _state(self):
+        return lcg(self.state, self.mult, self.incr, self.bits)
+
+    def advance(self, delta):
+        """
+        Skip delta output words without generating them
+        """
+        state = self._state()
+        state.advance(delta)
+        self.state = state.state
+        return self
+
+    def copy(self):
+        new = object.__new__(type(self))
+        new.state, new.mult, new.incr = self.state, self.mult, self.incr
+        return new
+
+    def substreams(self, count, stride=None):
+        """
+        count generators, generator i starting stride * i words ahead
+        (see lcg.substreams for the default stride)
+        """
+        streams = []
+        for state in self._state().substreams(count, stride):
+            sub = self.copy()
+            sub.state = state.state
+            streams.append(sub)
+        return streams
@@ -1,6 +1,8 @@
 
-from tabulate import tabulate
-import matplotlib.pyplot as plt
+from pcg_engine import pcg_base, rxs_m_xs_32_state
+
+mask_16_c=0xFFFF
+mask_32_c=0xFFFFFFFF
 
 def twos_comp(val, bits):
     """compute the 2's complement of int value val"""
@@ -9,31 +11,30 @@ def twos_comp(val, bits):
     return val
 
 def tranc(num, length=64,dir=0):
-    hex_num=hex(num)
+    """
+    Keep the length least significant bits of num (dir=0), or the
+    length most significant bits counted from its top hex digit (dir=1)
+    """
     num_bytes=round(length/4)
-    
-    if dir == 0 :
-        hex_trancated=hex_num[len(hex_num)-num_bytes:len(hex_num)]
-    elif dir==1 :
-        hex_trancated=hex_num[2:num_bytes+2]
-    else:
-        hex_trancated=hex_num[len(hex_num)-num_bytes:len(hex_num)]
-    new_int=int("0x"+hex_trancated,16)
-    return(new_int)
+    if dir==1 :
+        num_digits=max((num.bit_length()+3)//4,1)
+        return num>>(4*max(num_digits-num_bytes,0))
+    return num&((1<<(4*num_bytes))-1)
 
 shift_added_value_c=4
 mult_factor_c=1857494364
 incr_r=3614764435
 def pcg32_init(seed_r,incr_r): # initiate the pcg and return first random number
     #print("seed int = " + str(int(seed_r)))
-    state_r = int(seed_r)+incr_r
-    if len(bin(state_r)) > 34:
-        state_r=int("0b"+bin(state_r)[-32:],2)
+    state_r = (int(seed_r)+incr_r) & mask_32_c
     #print("init seed = " + hex(state_r))
     res_pcg,new_state=RXS_M_XS(state_r)
     return res_pcg,new_state
-stage_1_tab=[]
-stage_2_tab=[]
+# opt-in per-stage trace hook (see pcg_trace.py), nothing is recorded when None
+tracer=None
+def set_tracer(new_tracer):
+    global tracer
+    tracer=new_tracer
 
 def RXS_M_XS(state_r): 
     ### stage 1
@@ -50,6 +51,12 @@ def RXS_M_XS(state_r):
     # XOR initial state with shifted state
     stage_1_v = stage_0_v ^ stage_1_shifted_v
     stage_1_r =stage_1_v
+    if tracer is not None:
+        tracer.record('stage_1', {'stage_0_v': stage_0_v,
+                                  'stage_1_r_shfts_v': stage_1_r_shfts_v,
+                                  'right_shfts_v': right_shfts_v,
+                                  'stage_1_shifted_v': stage_1_shifted_v,
+                                  'stage_1_r': stage_1_r})
 
     ### stage 2
     stage_2_mult_v = stage_1_r * mult_factor_c
@@ -57,58 +64,66 @@ def RXS_M_XS(state_r):
     stage_2_22_r_shfts_v = stage_2_mult_v>>22
     
     gen_word_v = stage_2_mult_v ^ stage_2_22_r_shfts_v
-    gen_word_v_64="0b"+("0"*(64-len(bin(gen_word_v))+2))+bin(gen_word_v)[2:]
-    gen_word_v_64_d=gen_word_v_64[2:] 
-    gen_word_r="0b"+gen_word_v_64_d[shift_added_value_c:16+shift_added_value_c]
-    gen_word_r=int(gen_word_r,2)
+    # output is bits 63-shift_added_value_c downto 48-shift_added_value_c
+    gen_word_r=(gen_word_v>>(48-shift_added_value_c)) & mask_16_c
 
-    new_state_v_64="0b"+("0"*(64-len(bin(stage_2_22_r_shfts_v))+2))+bin(stage_2_22_r_shfts_v)[2:]
-    state_v=int("0b"+new_state_v_64[-32:],2)
+    state_v=stage_2_22_r_shfts_v & mask_32_c
+    if tracer is not None:
+        tracer.record('stage_2', {'stage_2_mult_v': stage_2_mult_v,
+                                  'stage_2_22_r_shfts_v': stage_2_22_r_shfts_v,
+                                  'gen_word_v': gen_word_v,
+                                  'gen_word_r': gen_word_r,
+                                  'state_r': state_v})
 
     pcg_32=gen_word_r
     new_state=state_v
     return pcg_32, new_state
 
+class pcg_rxs_m_xs_32(pcg_base):
+    """
+    PCG-RXS-M-XS with 32-bit state and 16-bit output, giving the same
+    words as run_pcg() and the pcg_rxs_m_xs_32 core, using integer ops only
+    """
+    __slots__ = ()
+    name = 'pcg_rxs_m_xs_32'
+    bits = 32
+    out_bits = 16
+
+    def __init__(self, seed_r=0xd0f33173, incr_r=3614764435):
+        self.mult = mult_factor_c
+        self.incr = incr_r
+        self.state = (seed_r + incr_r) & mask_32_c
+
+    def next(self):
+        state_r = self.state
+        stage_1_r = state_r ^ (state_r >> ((state_r >> 28) + shift_added_value_c))
+        stage_2_mult_v = stage_1_r * self.mult
+        stage_2_22_r_shfts_v = stage_2_mult_v >> 22
+        self.state = stage_2_22_r_shfts_v & mask_32_c
+        return ((stage_2_mult_v ^ stage_2_22_r_shfts_v) >> (48 - shift_added_value_c)) & mask_16_c
+
+    def _state(self):
+        # the state is fed back from the RXS-M output path, not an LCG
+        return rxs_m_xs_32_state(self.state)
+
 def run_pcg(runs):
     pcg_r=[]
     state_r      = 0xd0f33173		# Or something seed_r-dependent
     incr_r=3614764435
     
     pcg_32_res,new_state = pcg32_init(state_r,incr_r)
-    
-    pcg_full_64="0b"+('0'*(64-len(bin(pcg_32_res))))+bin(pcg_32_res)[2:]
-    pcg_full_32=pcg_full_64[32:]
-    pcg_r.append(int("0b"+pcg_full_32,2))
+    pcg_r.append(pcg_32_res)
     for i in range(0,runs):
         pcg_32_res,new_state = RXS_M_XS(new_state)
-        prw=[hex(pcg_32_res),hex(new_state)]
-        #pcg_para_tabl.append(prw)
-        pcg_full_64="0b"+('0'*(64-len(bin(pcg_32_res))))+bin(pcg_32_res)[2:]
-        pcg_full_32=pcg_full_64[32:]
-        pcg_r.append(int("0b"+pcg_full_32,2))
-    #print(tabulate(stage_1_tab,headers=['stage_0_v','r_shifts','2s complement','gen_stage_2_r', 'right_shfts_r', 'left_shfts_r']))
-    #print(tabulate(stage_2_tab,headers=['gen_word_r','state_r']))
+        pcg_r.append(pcg_32_res)
+    #print(tracer.table('stage_1'))
+    #print(tracer.table('stage_2'))
     return pcg_r
-n=300
-pcg_x=[]
-pcg_y = []
-pcg_o = run_pcg(n)
-for i in range(0,n):
-    pcg_x.append(i)
-    pcg_y.append(pcg_o[i]/(2**16))
-    print(hex(pcg_o[i]))
-    
-    #print(hex(pcg_y[i]))
-plt.plot(pcg_x, pcg_y)
-
-# naming the x axis
-plt.xlabel('x - axis') 
-# naming the y axis
-plt.ylabel('y - axis')
-        
-# giving a_coeffints_c title to my graph
-plt.title('My first graph!')
-        
-# function to show the plot
-plt.show()
-
+if __name__ == "__main__":
+    # matplotlib is only needed here, importing the model stays light
+    from pcg_cli import plot_words
+    n=300
+    pcg_o = run_pcg(n)
+    for i in range(0,n):
+        print(hex(pcg_o[i]))
+    plot_words(pcg_o[:n], 16)
@@ -0,0 +1,64 @@
+"""
+Opt-in per-stage tracing for the PCG models.
+
+The step functions of the models (pcg32(), XSH_RS(), RXS_M_XS()) call
+tracer.record(stage, fields) when a tracer is set on the model module,
+e.g.
+
+  import pcg_xsh_rr_64_model as model
+  model.set_tracer(ring_trace(depth=256))
+
+stage is 'stage_1' or 'stage_2' (the two pipeline stages of the VHDL)
+and fields maps the VHDL signal/variable names to their int values.
+With no tracer set nothing is recorded or formatted.
+"""
+from collections import deque
+
+
+def format_fields(fields):
+    """
+    Render the values of one record as hex, as shown in a wave viewer
+    """
+    return [hex(v) for v in fields.values()]
+
+
+class ring_trace:
+    """
+    Keep the last depth records of each stage in memory
+    """
+
+    def __init__(self, depth=1024):
+        self.depth = depth
+        self.stages = {}
+
+    def record(self, stage, fields):
+        if stage not in self.stages:
+            self.stages[stage] = deque(maxlen=self.depth)
+        self.stages[stage].append(fields)
+
+    def rows(self, stage):
+        return list(self.stages.get(stage, ()))
+
+    def table(self, stage):
+        """
+        The kept records of a stage as a text table
+        """
+        from tabulate import tabulate
+        rows = self.rows(stage)
+        if not rows:
+            return ''
+        return tabulate([format_fields(r) for r in rows], headers=list(rows[0]))
+
+
+class file_trace:
+    """
+    Stream every record to an open text file, one line per record:
+    stage name=value name=value ...
+    """
+
+    def __init__(self, f):
+        self.f = f
+
+    def record(self, stage, fields):
+        values = format_fields(fields)
+        self.f.write(stage + ' ' + ' '.join(f'{k}={v}' for k, v in zip(fields, values)) + '\n')
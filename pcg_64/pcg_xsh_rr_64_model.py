@@ -1,6 +1,8 @@
 # adopted from cpp code found in https://en.wikipedia.org/wiki/Permuted_congruential_generator
-from tabulate import tabulate
-import matplotlib.pyplot as plt
+from pcg_engine import pcg_base
+
+mask_32_c=0xFFFFFFFF
+mask_64_c=0xFFFFFFFFFFFFFFFF
 
 def twos_comp(val, bits):
     """compute the 2's complement of int value val"""
@@ -9,17 +11,15 @@ def twos_comp(val, bits):
     return val
 
 def tranc(num, length=64,dir=0):
-    hex_num=hex(num)
-    num_bytes=length/4
-    
-    if dir == 0 :
-        hex_trancated=hex_num[len(hex_num)-round(num_bytes):len(hex_num)]
-    elif dir==1 :
-        hex_trancated=hex_num[2:round(num_bytes)+2]
-    else:
-        hex_trancated=hex_num[len(hex_num)-round(num_bytes):len(hex_num)]
-    new_int=int("0x"+hex_trancated,16)
-    return(new_int)
+    """
+    Keep the length least significant bits of num (dir=0), or the
+    length most significant bits counted from its top hex digit (dir=1)
+    """
+    num_bytes=round(length/4)
+    if dir==1 :
+        num_digits=max((num.bit_length()+3)//4,1)
+        return num>>(4*max(num_digits-num_bytes,0))
+    return num&((1<<(4*num_bytes))-1)
 
 def pcg32_init(seed_r,mult_r,incr_r): # initiate the pcg and return first random number
     print("seed int = " + str(int(seed_r)))
@@ -28,8 +28,11 @@ def pcg32_init(seed_r,mult_r,incr_r): # initiate the pcg and return first random
     print("init seed = " + hex(state_r))
     res_pcg,new_state=pcg32(state_r,mult_r,incr_r)
     return res_pcg,new_state
-stage_1_tab=[]
-stage_2_tab=[]
+# opt-in per-stage trace hook (see pcg_trace.py), nothing is recorded when None
+tracer=None
+def set_tracer(new_tracer):
+    global tracer
+    tracer=new_tracer
 
 def pcg32(state_r,mult_r,incr_r): # generate pcg from a specific state of the generator
     # names of variables are same as their counter parts in the pcg_64.vhd file
@@ -50,8 +53,13 @@ def pcg32(state_r,mult_r,incr_r): # generate pcg from a specific state of the ge
     gen_stage_2_r = stage_2_v
     right_shfts_r= right_shfts_v
     left_shfts_r=left_shfts_v
-    stage_1_arr=[hex(stage_0_v) ,hex(stage_0_59_r_shfts_v) ,hex(right_shfts_2scomplement_v),hex(gen_stage_2_r), str(right_shfts_r), str(left_shfts_r)]
-    stage_1_tab.append(stage_1_arr)
+    if tracer is not None:
+        tracer.record('stage_1', {'stage_0_v': stage_0_v,
+                                  'stage_0_59_r_shfts_v': stage_0_59_r_shfts_v,
+                                  'right_shfts_2scomplement_v': right_shfts_2scomplement_v & 63,
+                                  'gen_stage_2_r': gen_stage_2_r,
+                                  'right_shfts_r': right_shfts_r,
+                                  'left_shfts_r': left_shfts_r})
     
     ### stage 2
     # shift the data using the shifting values from stage 1
@@ -64,57 +72,56 @@ def pcg32(state_r,mult_r,incr_r): # generate pcg from a specific state of the ge
     # or the results of the shifting to generate the output 
     gen_word_r = stage_2_rot_r_v | stage_2_rot_l_v
     # only take the least significant 32 bits as output
-    gen_word_full_64="0b"+('0'*(64-len(bin(gen_word_r))))+bin(gen_word_r)[2:]
-    gen_word_full_32=gen_word_full_64[32:]
-    gen_word_r=int("0b"+gen_word_full_32,0)
-    stage_2_arr=[hex(gen_word_r),hex(state_r)]
-    stage_2_tab.append(stage_2_arr)
+    gen_word_r = gen_word_r & mask_32_c
+    if tracer is not None:
+        tracer.record('stage_2', {'gen_word_r': gen_word_r, 'state_r': state_r})
     pcg_32=gen_word_r
     new_state=state_r
     return pcg_32, new_state
 
+class pcg_xsh_rr_64(pcg_base):
+    """
+    PCG-XSH-RR with 64-bit state and 32-bit output, giving the same words
+    as run_pcg() and the pcg_xsh_rr_64 core, using integer ops only
+    """
+    __slots__ = ()
+    name = 'pcg_xsh_rr_64'
+    bits = 64
+    out_bits = 32
+
+    def __init__(self, seed_r=0x4d595df4d0f33173, mult_r=6364136223846793005,
+                 incr_r=1442695040888963407):
+        self.mult = mult_r
+        self.incr = incr_r
+        self.state = (seed_r + incr_r) & mask_64_c
+
+    def next(self):
+        state_r = self.state
+        gen_stage_2_r = (state_r ^ ((state_r << 18) & mask_64_c)) >> 27
+        right_shfts_r = state_r >> 59
+        left_shfts_r = -right_shfts_r & 31
+        self.state = (state_r * self.mult + self.incr) & mask_64_c
+        return ((gen_stage_2_r >> right_shfts_r) | (gen_stage_2_r << left_shfts_r)) & mask_32_c
+
 def run_pcg(runs):
-    pcg_para_tabl=[]
     pcg_r=[]
     state_r      = 0x4d595df4d0f33173		# Or something seed_r-dependent
     mult_r = 6364136223846793005
     incr_r  = 1442695040888963407	# Or an arbitrary odd constant
 
     pcg_32_res,new_state = pcg32_init(state_r,mult_r,incr_r)
-    
-    pcg_full_64="0b"+('0'*(64-len(bin(pcg_32_res))))+bin(pcg_32_res)[2:]
-    pcg_full_32=pcg_full_64[32:]
-    pcg_r.append(int("0b"+pcg_full_32,2))
+    pcg_r.append(pcg_32_res)
     for i in range(0,runs):
         pcg_32_res,new_state = pcg32(new_state,mult_r,incr_r)
-        prw=[hex(pcg_32_res),hex(new_state)]
-        pcg_para_tabl.append(prw)
-        pcg_full_64="0b"+('0'*(64-len(bin(pcg_32_res))))+bin(pcg_32_res)[2:]
-        pcg_full_32=pcg_full_64[32:]
-        pcg_r.append(int("0b"+pcg_full_32,2))
-    #print(tabulate(stage_1_tab,headers=['stage_0_v','r_shifts','2s complement','gen_stage_2_r', 'right_shfts_r', 'left_shfts_r']))
-    #print(tabulate(stage_2_tab,headers=['gen_word_r','state_r']))
+        pcg_r.append(pcg_32_res)
+    #print(tracer.table('stage_1'))
+    #print(tracer.table('stage_2'))
     return pcg_r
-n=50
-pcg_x=[]
-pcg_y = []
-pcg_o = run_pcg(n)
-for i in range(0,n):
-    pcg_x.append(i)
-    pcg_y.append(pcg_o[i]/(2**32))
-    print(hex(pcg_o[i]))
-    
-    #print(hex(pcg_y[i]))
-plt.plot(pcg_x, pcg_y)
-
-# naming the x axis
-plt.xlabel('x - axis') 
-# naming the y axis
-plt.ylabel('y - axis')
-        
-# giving a_coeffints_c title to my graph
-plt.title('My first graph!')
-        
-# function to show the plot
-plt.show()
-
+if __name__ == "__main__":
+    # matplotlib is only needed here, importing the model stays light
+    from pcg_cli import plot_words
+    n=50
+    pcg_o = run_pcg(n)
+    for i in range(0,n):
+        print(hex(pcg_o[i]))
+    plot_words(pcg_o[:n], 32)
@@ -1,7 +1,9 @@
 # adopted from cpp code found in https://en.wikipedia.org/wiki/Permuted_congruential_generator
 # THIS IS FOR PCG-XSH-RS variant
-from tabulate import tabulate
-import matplotlib.pyplot as plt
+from pcg_engine import pcg_base
+
+mask_32_c=0xFFFFFFFF
+mask_64_c=0xFFFFFFFFFFFFFFFF
 
 def twos_comp(val, bits):
     """compute the 2's complement of int value val"""
@@ -10,17 +12,15 @@ def twos_comp(val, bits):
     return val
 
 def tranc(num, length=64,dir=0):
-    hex_num=hex(num)
-    num_bytes=length/4
-    
-    if dir == 0 :
-        hex_trancated=hex_num[len(hex_num)-round(num_bytes):len(hex_num)]
-    elif dir==1 :
-        hex_trancated=hex_num[2:round(num_bytes)+2]
-    else:
-        hex_trancated=hex_num[len(hex_num)-round(num_bytes):len(hex_num)]
-    new_int=int("0x"+hex_trancated,16)
-    return(new_int)
+    """
+    Keep the length least significant bits of num (dir=0), or the
+    length most significant bits counted from its top hex digit (dir=1)
+    """
+    num_bytes=round(length/4)
+    if dir==1 :
+        num_digits=max((num.bit_length()+3)//4,1)
+        return num>>(4*max(num_digits-num_bytes,0))
+    return num&((1<<(4*num_bytes))-1)
 
 def XSH_RS_init(seed_r,mult_r): # initiate the pcg and return first random number
     print("seed int = " + str(int(seed_r)))
@@ -29,8 +29,11 @@ def XSH_RS_init(seed_r,mult_r): # initiate the pcg and return first random numbe
     print("init seed = " + hex(state_r))
     res_pcg,new_state=XSH_RS(state_r,mult_r)
     return res_pcg,new_state
-stage_1_tab=[]
-stage_2_tab=[]
+# opt-in per-stage trace hook (see pcg_trace.py), nothing is recorded when None
+tracer=None
+def set_tracer(new_tracer):
+    global tracer
+    tracer=new_tracer
 
 def XSH_RS(state_r,mult_r): # generate pcg from a specific state of the generator
     # names of variables are same as their counter parts in the pcg_64.vhd file
@@ -49,60 +52,63 @@ def XSH_RS(state_r,mult_r): # generate pcg from a specific state of the generato
     # the multiplication and addition result to 64 bit long int
     state_mult_add_v = stage_0_v * mult_r 
     state_r = tranc(state_mult_add_v)
+    if tracer is not None:
+        tracer.record('stage_1', {'stage_0_v': stage_0_v,
+                                  'stage_0_61_r_shfts_v': stage_0_61_shfts_v,
+                                  'stage_1_r': stage_1_v,
+                                  'right_shfts_r': right_shfts_v,
+                                  'state_mult_r': state_r})
     # or the results of the shifting to generate the output 
     gen_word_r = stage_1_shifted_out
     # only take the least significant 32 bits as output
-    gen_word_full_64="0b"+('0'*(64-len(bin(gen_word_r))))+bin(gen_word_r)[2:]
-    gen_word_full_32=gen_word_full_64[32:]
-    gen_word_r=int("0b"+gen_word_full_32,0)
-    stage_2_arr=[hex(gen_word_r),hex(state_r)]
-    stage_2_tab.append(stage_2_arr)
+    gen_word_r = gen_word_r & mask_32_c
+    if tracer is not None:
+        tracer.record('stage_2', {'gen_word_r': gen_word_r, 'state_r': state_r})
     pcg_32=gen_word_r
     new_state=state_r
     return pcg_32, new_state
 
+class pcg_xsh_rs_64(pcg_base):
+    """
+    PCG-XSH-RS with 64-bit MCG state and 32-bit output, giving the same
+    words as run_pcg() and the pcg_xsh_rs_64 core, using integer ops only
+    """
+    __slots__ = ()
+    name = 'pcg_xsh_rs_64'
+    bits = 64
+    out_bits = 32
+
+    def __init__(self, seed_r=0xcafef00dd15ea5e5, mult_r=6364136223846793005):
+        self.mult = mult_r
+        self.incr = 0
+        self.state = (2 * seed_r + 1) & mask_64_c
+
+    def next(self):
+        state_r = self.state
+        stage_1_r = state_r ^ ((state_r << 22) & mask_64_c)
+        right_shfts_r = (state_r >> 61) + 22
+        self.state = (state_r * self.mult) & mask_64_c
+        return (stage_1_r >> right_shfts_r) & mask_32_c
+
 def run_pcg(runs):
-    pcg_para_tabl=[]
     pcg_r=[]
     state_r      = 0xcafef00dd15ea5e5		# Or something seed_r-dependent
     mult_r = 6364136223846793005
     incr_r  = 1442695040888963407	# Or an arbitrary odd constant
 
     pcg_32_res,new_state = XSH_RS_init(state_r,mult_r)
-    
-    pcg_full_64="0b"+('0'*(64-len(bin(pcg_32_res))))+bin(pcg_32_res)[2:]
-    pcg_full_32=pcg_full_64[32:]
-    pcg_r.append(int("0b"+pcg_full_32,2))
+    pcg_r.append(pcg_32_res)
     for i in range(0,runs):
         pcg_32_res,new_state = XSH_RS(new_state,mult_r)
-        prw=[hex(pcg_32_res),hex(new_state)]
-        pcg_para_tabl.append(prw)
-        pcg_full_64="0b"+('0'*(64-len(bin(pcg_32_res))))+bin(pcg_32_res)[2:]
-        pcg_full_32=pcg_full_64[32:]
-        pcg_r.append(int("0b"+pcg_full_32,2))
-    #print(tabulate(stage_1_tab,headers=['stage_0_v','r_shifts','2s complement','gen_stage_2_r', 'right_shfts_r', 'left_shfts_r']))
-    #print(tabulate(stage_2_tab,headers=['gen_word_r','state_r']))
+        pcg_r.append(pcg_32_res)
+    #print(tracer.table('stage_1'))
+    #print(tracer.table('stage_2'))
     return pcg_r
-n=200
-pcg_x=[]
-pcg_y = []
-pcg_o = run_pcg(n)
-for i in range(0,n):
-    pcg_x.append(i)
-    pcg_y.append(pcg_o[i]/(2**32))
-    print(hex(pcg_o[i]))
-    
-    #print(hex(pcg_y[i]))
-plt.plot(pcg_x, pcg_y)
-
-# naming the x axis
-plt.xlabel('x - axis') 
-# naming the y axis
-plt.ylabel('y - axis')
-        
-# giving a_coeffints_c title to my graph
-plt.title('My first graph!')
-        
-# function to show the plot
-plt.show()
-
+if __name__ == "__main__":
+    # matplotlib is only needed here, importing the model stays light
+    from pcg_cli import plot_words
+    n=200
+    pcg_o = run_pcg(n)
+    for i in range(0,n):
+        print(hex(pcg_o[i]))
+    plot_words(pcg_o[:n], 32)
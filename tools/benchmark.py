@@ -0,0 +1,355 @@
+"""
+Throughput of the Python models next to the synthesized cores.
+
+Every case runs one generator at one width, seed count and backend:
+
+  list    the per-cell/per-word reference code (casr step_cells(),
+          the pcg32() style step functions of the PCG models)
+  packed  the bit-packed int models (casr generate() in 'p' mode, the
+          PCG generator classes)
+  cycle   the register-accurate PCG models of pcg_cycle.py
+  batch   the NumPy models clocking all seeds together (casr_batch,
+          mt, the lfsr_rngs blocks)
+
+and reports output words/s and bits/s summed over the seeds. The
+hardware column is one core of synth_freq.txt: Fmax times the output
+width times the words per clock (1/2 for the PCG cores, which take a
+stage 1 and a stage 2 clock per word). Cores missing from synth_freq.txt
+(CASR, lfsr_ring, LFSR_generic) have none.
+
+Each case is calibrated to run for at least --min-time and the best of
+--repeat runs is kept. Results are saved as JSON with the commit, and
+--compare lists the cases that got slower than an earlier file:
+
+  python benchmark.py --out bench_before.json
+  python benchmark.py --quick --compare bench_before.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import numpy as np
+from model_streams import ROOT
+
+SYNTH_FREQ = os.path.join(ROOT, 'synth_freq.txt')
+
+# output words per clock of the cores in synth_freq.txt
+WORDS_PER_CLOCK = {'pcg_rxs_m_xs_32': 0.5, 'pcg_xsh_rr_64': 0.5, 'pcg_xsh_rs_64': 0.5,
+                   'pcg_xsl_rr_128': 0.5}
+
+PCG = ('pcg_rxs_m_xs_32', 'pcg_xsh_rr_64', 'pcg_xsh_rs_64', 'pcg_xsl_rr_128')
+CASR_WIDTHS = (24, 64, 512)
+BATCH_SEEDS = (64, 1024)
+
+
+def synth_freq(path=SYNTH_FREQ):
+    """
+    {block: Fmax in Hz} of synth_freq.txt
+    """
+    freqs = {}
+    with open(path) as f:
+        for line in f:
+            m = re.match(r'\s*(\w+)\s*--\s*([\d.]+)\s*MHz', line)
+            if m:
+                freqs[m.group(1)] = float(m.group(2)) * 1e6
+    return freqs
+
+
+def _bits(rng, n):
+    return [int(b) for b in rng.integers(0, 2, n)]
+
+
+def _casr_case(rule, width, backend, seeds=1):
+    """
+    (make, run) of a CASR case; run(gen, count) returns the words made
+    """
+    from casr_30 import casr_30
+    from casr_90 import casr_90
+    from casr_150 import casr_150
+    from casr_90150h import casr_90150h
+    from casr_nl import casr_nl
+    from casr_batch import casr_batch
+    rng = np.random.default_rng(1)
+    rules = {'90150h': _bits(rng, width), 'nl': [int(r) for r in rng.integers(0, 3, width)]}.get(rule)
+
+    if backend == 'batch':
+        def make():
+            return casr_batch(rng.integers(0, 2, (seeds, width), dtype=np.uint8), rule, rules)
+
+        def run(gen, count):
+            if rule == 'nl':
+                gen.generate(count)
+            else:
+                # states stay bit-sliced, as clocked
+                for _ in range(count):
+                    gen.step()
+            return count * seeds
+        return make, run
+
+    classes = {'30': casr_30, '90': casr_90, '150': casr_150}
+
+    def make():
+        seed = _bits(rng, width)
+        if rule == 'nl':
+            return casr_nl(seed, rules)
+        if rule == '90150h':
+            return casr_90150h(seed, rules, 'p')
+        return classes[rule](seed, 'p')
+
+    def run(gen, count):
+        if backend == 'list':
+            step = gen.step_cells
+            for _ in range(count):
+                step()
+                if rule == 'nl':
+                    gen.nonlinear_output()
+        else:
+            gen.generate(count)
+        return count
+    return make, run
+
+
+# step function of the reference model script and its arguments after the state
+PCG_STEPS = {'pcg_rxs_m_xs_32': ('RXS_M_XS', ()), 'pcg_xsh_rr_64': ('pcg32', ('mult', 'incr')),
+             'pcg_xsh_rs_64': ('XSH_RS', ('mult',)), 'pcg_xsl_rr_128': ('pcg32', ('mult', 'incr'))}
+
+
+def _pcg_case(name, backend):
+    from pcg_cli import load_variant
+    cls = load_variant(name)
+
+    if backend == 'cycle':
+        from pcg_cycle import CYCLE_MODELS
+
+        def make():
+            ref = cls()
+            gen = CYCLE_MODELS[name]()
+            gen.seed(ref.state, ref.mult, ref.incr)
+            return gen
+
+        def run(gen, count):
+            gen.words(count)
+            return count
+        return make, run
+
+    if backend == 'list':
+        import importlib
+        step_name, arg_names = PCG_STEPS[name]
+        step = getattr(importlib.import_module(name + '_model'), step_name)
+
+        def make():
+            return cls()
+
+        def run(gen, count):
+            state = gen.state
+            args = [getattr(gen, a) for a in arg_names]
+            out = []
+            for _ in range(count):
+                word, state = step(state, *args)
+                out.append(word)
+            return count
+        return make, run
+
+    def make():
+        return cls()
+
+    def run(gen, count):
+        gen.fill(count)
+        return count
+    return make, run
+
+
+def _batch_case(name, seeds, **generics):
+    def make():
+        import importlib
+        if name == 'mt':
+            from mt_model import mt
+            return mt(5489, **generics)
+        cls = getattr(importlib.import_module(name + '_model'), name)
+        seed_words = [0x12345678 + 0x9E3779B9 * i for i in range(seeds)]
+        if name == 'LFSR_generic':
+            return cls(generics['length'], (seeds,))
+        gen = cls(seed_words, **generics)
+        gen.init()
+        return gen
+
+    def run(gen, count):
+        gen.generate(count)
+        return count * seeds
+    return make, run
+
+
+def cases(quick=False):
+    """
+    (generator, width, seeds, backend, generics, make/run factory) of
+    every case
+    """
+    widths = CASR_WIDTHS[:2] if quick else CASR_WIDTHS
+    batch_seeds = BATCH_SEEDS[:1] if quick else BATCH_SEEDS
+    out = []
+    for rule in ('30', '90', '150', '90150h', 'nl'):
+        name = 'casr_' + rule
+        for width in widths:
+            out_width = 1 if rule == 'nl' else width
+            for backend in ('list', 'packed'):
+                out.append((name, out_width, 1, backend, {'width': width},
+                            lambda r=rule, w=width, b=backend: _casr_case(r, w, b)))
+            for seeds in batch_seeds:
+                out.append((name, out_width, seeds, 'batch', {'width': width},
+                            lambda r=rule, w=width, s=seeds: _casr_case(r, w, 'batch', s)))
+    out_bits = {'pcg_rxs_m_xs_32': 16, 'pcg_xsh_rr_64': 32, 'pcg_xsh_rs_64': 32, 'pcg_xsl_rr_128': 64}
+    for name in PCG:
+        for backend in ('list', 'packed', 'cycle'):
+            out.append((name, out_bits[name], 1, backend, {},
+                        lambda n=name, b=backend: _pcg_case(n, b)))
+    out.append(('mt', 32, 1, 'batch', {'p': 3217, 'w': 32}, lambda: _batch_case('mt', 1, p=3217, w=32)))
+    lfsr = [('bit_select_rand', 16, {'n_select_bits_g': 4}),
+            ('select_slide_rand', 32, {'w_LFSR_g': 32, 'w_slider_g': 4}),
+            ('lfsr_ring', 32, {'w_LFSR_g': 32}),
+            ('LFSR_generic', 32, {'length': 32})]
+    for name, width, generics in lfsr:
+        for seeds in (1,) + batch_seeds:
+            out.append((name, width, seeds, 'batch', generics,
+                        lambda n=name, s=seeds, g=generics: _batch_case(n, s, **g)))
+    return out
+
+
+def measure(make, run, min_time=0.2, repeat=3):
+    """
+    Best words/s of repeat timed runs, each long enough to take min_time
+    """
+    count = 16
+    while True:
+        gen = make()
+        start = time.perf_counter()
+        made = run(gen, count)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        count *= 2 if elapsed < min_time / 8 else max(2, int(min_time / max(elapsed, 1e-9)) + 1)
+    best = made / elapsed
+    for _ in range(repeat - 1):
+        gen = make()
+        start = time.perf_counter()
+        made = run(gen, count)
+        best = max(best, made / (time.perf_counter() - start))
+    return best
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(selected=None, quick=False, min_time=0.2, repeat=3, log=None):
+    """
+    Results dict of the benchmark run (see save/compare)
+    """
+    freqs = synth_freq()
+    results = []
+    for name, width, seeds, backend, generics, factory in cases(quick):
+        if selected and name not in selected and backend not in selected:
+            continue
+        case = factory()
+        if case is None:
+            continue
+        words = measure(*case, min_time=min_time, repeat=repeat)
+        hw = None
+        if name in freqs:
+            hw = freqs[name] * WORDS_PER_CLOCK.get(name, 1) * width
+        row = {'generator': name, 'width': width, 'seeds': seeds, 'backend': backend,
+               'generics': generics, 'words_per_s': words, 'bits_per_s': words * width,
+               'hw_bits_per_s': hw}
+        results.append(row)
+        if log:
+            log(format_row(row))
+    return {'commit': _commit(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(), 'numpy': np.__version__,
+            'machine': platform.machine(), 'processor': platform.processor(),
+            'min_time': min_time, 'repeat': repeat, 'results': results}
+
+
+def _generics(row):
+    return ','.join(f'{k}={v}' for k, v in sorted(row['generics'].items()))
+
+
+def case_key(row):
+    return f"{row['generator']}[{_generics(row)}] x{row['seeds']} {row['backend']}"
+
+
+HEADER = (f"{'generator':<18} {'width':>5} {'seeds':>5} {'backend':<7} {'words/s':>10} {'bits/s':>10} "
+          f"{'hw bits/s':>10} {'model/hw':>9}  generics")
+
+
+def _si(value):
+    if value is None:
+        return 'n/a'
+    for scale, suffix in ((1e9, 'G'), (1e6, 'M'), (1e3, 'k')):
+        if value >= scale:
+            return f"{value / scale:.2f}{suffix}"
+    return f"{value:.1f}"
+
+
+def format_row(row):
+    hw = row['hw_bits_per_s']
+    ratio = f"{row['bits_per_s'] / hw:.2e}" if hw else 'n/a'
+    return (f"{row['generator']:<18} {row['width']:>5} {row['seeds']:>5} {row['backend']:<7} "
+            f"{_si(row['words_per_s']):>10} {_si(row['bits_per_s']):>10} {_si(hw):>10} {ratio:>9}  {_generics(row)}".rstrip())
+
+
+def compare(old, new, tolerance=0.1):
+    """
+    Lines for the cases of new that are more than tolerance slower than
+    in old, and whether there were any
+    """
+    before = {case_key(r): r for r in old['results']}
+    lines = []
+    for row in new['results']:
+        prev = before.get(case_key(row))
+        if prev is None:
+            continue
+        ratio = row['words_per_s'] / prev['words_per_s']
+        if ratio < 1 - tolerance:
+            lines.append(f"{case_key(row)}: {_si(prev['words_per_s'])} -> {_si(row['words_per_s'])} "
+                         f"words/s ({ratio:.2f}x)")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Model throughput next to the synthesized cores")
+    parser.add_argument('only', nargs='*', help='generators or backends to run (default: all)')
+    parser.add_argument('--quick', action='store_true', help='fewer widths and seed counts')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per timed run')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case, the best is kept')
+    parser.add_argument('-o', '--out', help='JSON file for the results')
+    parser.add_argument('--compare', help='earlier JSON results to check for slowdowns')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='slowdown reported by --compare')
+    args = parser.parse_args(argv)
+
+    print(HEADER)
+    results = run_suite(args.only, args.quick, args.min_time, args.repeat, log=print)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        slower = compare(old, results, args.tolerance)
+        print(f"\n{len(slower)} cases slower than {args.compare} ({old.get('commit')}) "
+              f"by more than {args.tolerance:.0%}")
+        for line in slower:
+            print(line)
+        if slower:
+            sys.exit(1)
+
+
+# Example usage
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Berlekamp-Massey linear complexity of the serial model outputs.
+
+The connection polynomial C(x) is held as an int, bit i being the
+coefficient of x^i, and the last bits of the sequence as a second int
+whose bit j is s[n-j], so each step is one AND and a popcount over
+words. The window keeps twice the bits the current complexity needs and
+is rebuilt from the sequence only when the complexity outgrows it.
+
+A serial stream is one bit of every output word of a model_streams
+stream: the cell of a CASR state ('s' mode output_cell of generate()),
+the single nonlinear_output bit of casr_nl, or a bit of an LFSR block
+output.
+
+  python berlekamp_massey.py casr_90150h,width=64 -n 100000 --cell -1
+  python berlekamp_massey.py casr_nl,width=64,m30=0xF -n 20000 --profile nl.npy
+"""
+import argparse
+import numpy as np
+
+# maps the 0/1 bytes of a bit sequence to the ascii '0'/'1'
+_ASCII_TABLE = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def berlekamp_massey(bits):
+    """
+    Linear complexity of a sequence of 0/1 values. Returns a dict with
+    n, length, poly (C(x) as an int, C(0) = 1) and changes, the (k, L)
+    points where the complexity of the first k bits became L.
+    """
+    s = np.asarray(bits, dtype=np.uint8).tobytes()
+    c = b = 1
+    length = 0
+    shift = 1
+    window = 0
+    keep = 64
+    window_mask = (1 << keep) - 1
+    changes = []
+    for n, bit in enumerate(s):
+        window = ((window << 1) | bit) & window_mask
+        if not (c & window).bit_count() & 1:
+            shift += 1
+            continue
+        if 2 * length > n:
+            c ^= b << shift
+            shift += 1
+            continue
+        b, c = c, c ^ (b << shift)
+        length = n + 1 - length
+        shift = 1
+        changes.append((n + 1, length))
+        if length + 1 > keep:
+            keep = 2 * (length + 1)
+            window_mask = (1 << keep) - 1
+            window = int(s[max(0, n + 1 - keep):n + 1].translate(_ASCII_TABLE), 2)
+    return {'n': len(s), 'length': length, 'poly': c, 'changes': changes}
+
+
+def linear_complexity(x, m):
+    """
+    Linear complexity of the m bits of x (bit i = s_i), for the short
+    blocks of the statistical tests
+    """
+    c = b = 1
+    length = 0
+    shift = 1
+    window = 0
+    for n in range(m):
+        window = (window << 1) | ((x >> n) & 1)
+        if (c & window).bit_count() & 1:
+            t = c
+            c ^= b << shift
+            if 2 * length <= n:
+                length = n + 1 - length
+                b = t
+                shift = 0
+        shift += 1
+    return length
+
+
+def profile_array(result):
+    """
+    Linear complexity of the first k bits, k = 1..n
+    """
+    profile = np.zeros(result['n'], dtype=np.int64)
+    for k, length in result['changes']:
+        profile[k - 1:] = length
+    return profile
+
+
+def poly_taps(poly):
+    """
+    Exponents of the nonzero terms of a polynomial, highest first
+    """
+    return [i for i in range(poly.bit_length() - 1, -1, -1) if poly >> i & 1]
+
+
+def poly_str(poly, max_terms=16):
+    terms = [("1" if i == 0 else "x" if i == 1 else f"x^{i}") for i in poly_taps(poly)]
+    if len(terms) > max_terms:
+        terms = terms[:max_terms - 1] + ["...", terms[-1]]
+    return " + ".join(terms)
+
+
+def generates(poly, length, bits):
+    """
+    Whether the LFSR of connection polynomial poly and the given length
+    reproduces bits from its first length bits
+    """
+    s = np.asarray(bits, dtype=np.uint8)
+    taps = [i for i in poly_taps(poly) if 0 < i <= length]
+    for n in range(length, len(s)):
+        feedback = int(np.bitwise_xor.reduce(s[[n - i for i in taps]])) if taps else 0
+        if feedback != s[n]:
+            return False
+    return True
+
+
+def serial_bits(stream, count, bit=-1):
+    """
+    Bit number bit (-1 is the MSB) of the next count words of a
+    model_streams stream, as a uint8 array
+    """
+    from helper import ints_to_bits
+    return ints_to_bits(stream.words(count), stream.width)[:, range(stream.width)[bit]].copy()
+
+
+def main(argv=None):
+    from model_streams import open_stream
+    from stat_tests import parse_spec
+    parser = argparse.ArgumentParser(description="Berlekamp-Massey linear complexity of a model output bit")
+    parser.add_argument('generator', help="model_streams name, optionally 'name,key=value,...'")
+    parser.add_argument('-n', '--bits', type=int, default=10000, help='sequence length')
+    parser.add_argument('--cell', type=int, default=-1, help="output bit of each word ('s' mode output_cell)")
+    parser.add_argument('--profile', help='save the complexity profile to this .npy file')
+    args = parser.parse_args(argv)
+
+    name, kwargs = parse_spec(args.generator)
+    try:
+        stream = open_stream(name, **kwargs)
+    except (ValueError, TypeError, ImportError) as e:
+        parser.error(str(e))
+    result = berlekamp_massey(serial_bits(stream, args.bits, args.cell))
+    print(f"{name}: linear complexity {result['length']} over {result['n']} bits")
+    print(f"connection polynomial ({len(poly_taps(result['poly']))} terms): {poly_str(result['poly'])}")
+    if args.profile:
+        np.save(args.profile, profile_array(result))
+
+
+if __name__ == "__main__":
+    main()
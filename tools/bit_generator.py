@@ -0,0 +1,198 @@
+"""
+numpy.random bit generator over the model streams.
+
+model_bit_generator turns the output of any model_streams stream into
+raw 32 or 64-bit words, in bulk with random_raw(), and carries the C
+bit generator interface (capsule, lock) that numpy.random.Generator
+takes, so every numpy distribution runs on exactly the stream the core
+produces:
+
+  rng = generator('pcg_xsh_rr_64')
+  rng.random(10**6); rng.integers(0, 100, 1000); rng.standard_normal(5)
+
+The model words are taken as one bit stream, each word LSB first, and
+cut into raw words: two 32-bit PCG words make one 64-bit raw word (the
+first in the low half), a 24-bit CASR state is spread over raw words
+as it comes. The calls numpy makes follow its own bit generators:
+
+  bits=64 (PCG64 style)    next_uint64: one raw word
+                           next_uint32: low half, then high half
+                           next_double: (raw >> 11) * 2^-53
+  bits=32 (MT19937 style)  next_uint32: one raw word
+                           next_uint64: (first << 32) | second
+                           next_double: 53 bits from two raw words
+
+numpy calls back into Python once per draw (about 0.3 us); random_raw()
+and random() stay in NumPy throughout.
+"""
+import ctypes
+import threading
+import numpy as np
+from model_streams import CHUNK, open_stream
+
+_NEXT_UINT64 = ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)
+_NEXT_UINT32 = ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p)
+_NEXT_DOUBLE = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p)
+
+
+class _bitgen_t(ctypes.Structure):
+    """
+    bitgen_t of numpy/random/bitgen.h
+    """
+    _fields_ = [('state', ctypes.c_void_p),
+                ('next_uint64', _NEXT_UINT64),
+                ('next_uint32', _NEXT_UINT32),
+                ('next_double', _NEXT_DOUBLE),
+                ('next_raw', _NEXT_UINT64)]
+
+
+_capsule_new = ctypes.pythonapi.PyCapsule_New
+_capsule_new.restype = ctypes.py_object
+_capsule_new.argtypes = (ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p)
+_CAPSULE_NAME = b"BitGenerator"
+
+
+class model_bit_generator:
+    """
+    Raw words of a model stream, bits = 32 or 64 (default: 32 for
+    models with words of up to 32 bits). stream is a model_streams
+    stream or a name for open_stream(), with its arguments in kwargs.
+    """
+
+    def __init__(self, stream, bits=None, **kwargs):
+        if isinstance(stream, str):
+            stream = open_stream(stream, **kwargs)
+        self.stream = stream
+        self.bits = bits or (32 if stream.width <= 32 else 64)
+        if self.bits not in (32, 64):
+            raise ValueError(f"Raw words are 32 or 64 bits, got {self.bits}")
+        self.dtype = np.dtype(f'<u{self.bits // 8}')
+        self.lock = threading.Lock()
+        # model bits not yet in a raw word, and raw words not yet handed out
+        self._carry = np.zeros(0, dtype=np.uint8)
+        self._buffer = []
+        self._pos = 0
+        self._half = None
+        self._make_capsule()
+
+    def _model_bits(self, count):
+        """
+        The next count bits of the model stream, as a uint8 array
+        """
+        width = self.stream.width
+        need = count - len(self._carry)
+        words = self.stream.chunk(-(-need // width)) if need > 0 else None
+        if words is None:
+            bits = self._carry
+        else:
+            as_bytes = np.ascontiguousarray(words, dtype=words.dtype.newbyteorder('<')).view(np.uint8)
+            rows = as_bytes.reshape(len(words), -1)
+            fresh = np.unpackbits(rows, axis=1, count=width, bitorder='little').ravel()
+            bits = np.concatenate((self._carry, fresh))
+        self._carry = bits[count:]
+        return bits[:count]
+
+    def _fresh(self, count):
+        """
+        count new raw words straight from the stream
+        """
+        width = self.stream.width
+        if len(self._carry) == 0 and width in (8, 16, 32, 64) and width <= self.bits:
+            # whole model words fill a raw word, no bit shuffling needed
+            words = self.stream.chunk(count * (self.bits // width))
+            return np.ascontiguousarray(words, dtype=words.dtype.newbyteorder('<')).view(self.dtype)
+        bits = self._model_bits(count * self.bits)
+        return np.packbits(bits, bitorder='little').view(self.dtype)
+
+    def random_raw(self, size=None, output=True):
+        """
+        Raw words as a uint32/uint64 array of shape size (one word for
+        size None), the same words numpy draws from
+        """
+        count = 1 if size is None else int(np.prod(size))
+        with self.lock:
+            words = self._take(count)
+        if not output:
+            return None
+        if size is None:
+            return words[0]
+        return words.reshape(size)
+
+    def _take(self, count):
+        left = self._buffer[self._pos:self._pos + count]
+        self._pos += len(left)
+        if len(left) == count:
+            return np.array(left, dtype=self.dtype)
+        fresh = self._fresh(count - len(left))
+        if not left:
+            return fresh
+        return np.concatenate((np.array(left, dtype=self.dtype), fresh))
+
+    def _next(self):
+        if self._pos == len(self._buffer):
+            self._buffer = self._fresh(CHUNK).tolist()
+            self._pos = 0
+        word = self._buffer[self._pos]
+        self._pos += 1
+        return word
+
+    def next_uint64(self):
+        if self.bits == 64:
+            return self._next()
+        return (self._next() << 32) | self._next()
+
+    def next_uint32(self):
+        if self.bits == 32:
+            return self._next()
+        if self._half is not None:
+            word, self._half = self._half, None
+            return word
+        word = self._next()
+        self._half = word >> 32
+        return word & 0xFFFFFFFF
+
+    def next_double(self):
+        if self.bits == 64:
+            return (self._next() >> 11) * (1.0 / 9007199254740992.0)
+        a, b = self._next() >> 5, self._next() >> 6
+        return (a * 67108864.0 + b) / 9007199254740992.0
+
+    def random(self, size=None):
+        """
+        Generator.random() without the per-draw calls: the same doubles,
+        computed on whole arrays
+        """
+        count = 1 if size is None else int(np.prod(size))
+        with self.lock:
+            if self.bits == 64:
+                out = (self._take(count) >> np.uint64(11)).astype(np.float64)
+            else:
+                pairs = self._take(2 * count).reshape(-1, 2)
+                out = (pairs[:, 0] >> 5).astype(np.float64) * 67108864.0 + (pairs[:, 1] >> 6)
+        out *= 1.0 / 9007199254740992.0
+        return out[0] if size is None else out.reshape(size)
+
+    def _make_capsule(self):
+        # the callbacks have to stay referenced as long as numpy may call them
+        self._callbacks = (_NEXT_UINT64(lambda _: self.next_uint64()),
+                           _NEXT_UINT32(lambda _: self.next_uint32()),
+                           _NEXT_DOUBLE(lambda _: self.next_double()),
+                           _NEXT_UINT64(lambda _: self._next()))
+        self._bitgen = _bitgen_t(None, *self._callbacks)
+        self.capsule = _capsule_new(ctypes.addressof(self._bitgen), _CAPSULE_NAME, None)
+
+
+def generator(stream, bits=None, **kwargs):
+    """
+    numpy.random.Generator drawing from a model stream
+    """
+    return np.random.Generator(model_bit_generator(stream, bits, **kwargs))
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = generator('pcg_xsh_rr_64')
+    print(rng.random(4), rng.integers(0, 100, 8), rng.standard_normal(3))
+    # the raw words are the model words, two per 64-bit raw word
+    bitgen = model_bit_generator('pcg_xsh_rr_64', bits=32)
+    print([hex(w) for w in bitgen.random_raw(4)])
@@ -0,0 +1,336 @@
+"""
+Compare a simulator dump with the Python models.
+
+The dump is either text, one hex word per line (0x prefixes, x"..."
+literals, trailing commas, blank lines and '#'/'--' comment lines are
+accepted), or a golden_vectors binary file. It is read a chunk at a time
+and checked against a model_streams stream, word i of the dump against
+model word start + i.
+
+Lock-step mode steps the model with the dump and reports the first
+diverging word. Checkpoint mode (needs a model with jump-ahead) only
+samples every checkpoint-th word, jumping the model there; when a
+checkpoint fails, the model resyncs at the last matching checkpoint and
+every word from there on is compared in lock-step, giving the first
+mismatch after that checkpoint. Words between matching checkpoints are
+not compared, so a transient fault there (a single corrupted output
+word) goes unseen: use lock-step mode to prove a dump clean. Text dumps
+with equal length lines and binary dumps are read at the checkpoints
+only.
+
+  python compare_dump.py sim_h.txt casr_90150h --width 512 --seed 285f... --rules 3c4d...
+  python compare_dump.py casr_seed1_vectors_h.bin        # model from the header
+  python compare_dump.py pcg.txt pcg_xsh_rr_64 --checkpoint 1000000
+  python compare_dump.py mt.txt mt --seed 0x1234 -g p=3217 -g w=32
+"""
+import argparse
+import os
+import sys
+from itertools import islice
+from model_streams import CASR, open_stream
+from golden_vectors import MAGIC, vector_file
+
+# words compared per chunk in lock-step mode
+CHUNK = 1 << 14
+
+
+def parse_word(line):
+    """
+    Value of one dump line, None for blank and comment lines
+    """
+    token = line.strip().rstrip(',')
+    if not token or token.startswith(('#', '--')):
+        return None
+    if token[:2] in ('x"', 'X"'):
+        token = token[2:-1]
+    return int(token, 16)
+
+
+class text_dump:
+    """
+    Hex words one per line. Random access when all lines have the same
+    length, which is what $fwrite/write_line loops produce.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.f = open(path, 'rb')
+        size = os.fstat(self.f.fileno()).st_size
+        first = self.f.readline()
+        self.stride = None
+        self.count = None
+        if first.endswith(b'\n') and size % len(first) == 0 and parse_word(first.decode()) is not None:
+            self.f.seek(size - len(first))
+            if len(self.f.readline()) == len(first):
+                self.stride = len(first)
+                self.count = size // self.stride
+        self.random_access = self.stride is not None
+
+    def __len__(self):
+        if self.count is None:
+            raise TypeError("Text dump with lines of different lengths has no length")
+        return self.count
+
+    def __getitem__(self, k):
+        if not self.random_access:
+            raise TypeError("Text dump with lines of different lengths has no random access")
+        if not 0 <= k < self.count:
+            raise IndexError(k)
+        start = k * self.stride
+        self.f.seek(start - 1 if k else 0)
+        raw = self.f.read(self.stride + (1 if k else 0))
+        if not raw.endswith(b'\n') or (k and raw[0] != ord('\n')):
+            raise ValueError(f"{self.path}: line {k + 1} is not {self.stride} bytes long")
+        return parse_word(raw.decode())
+
+    def iter_words(self, start=0):
+        if self.random_access:
+            self.f.seek(start * self.stride)
+            start = 0
+        else:
+            self.f.seek(0)
+        for line in self.f:
+            word = parse_word(line.decode())
+            if word is None:
+                continue
+            if start:
+                start -= 1
+                continue
+            yield word
+
+    def close(self):
+        self.f.close()
+
+
+class binary_dump:
+    """
+    golden_vectors file as a dump
+    """
+    random_access = True
+
+    def __init__(self, path):
+        self.vf = vector_file(path)
+        self.count = self.vf.count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, k):
+        return self.vf[k]
+
+    def iter_words(self, start=0):
+        return self.vf.iter_ints(start)
+
+    def close(self):
+        self.vf.close()
+
+
+def open_dump(path):
+    with open(path, 'rb') as f:
+        is_binary = f.read(len(MAGIC)) == MAGIC
+    return binary_dump(path) if is_binary else text_dump(path)
+
+
+def _result(mode, checked, first=None, rows=(), synced=None, interval=None):
+    """
+    synced: in checkpoint mode, the last matching checkpoint before the
+    mismatch (-1 for the start); words up to it were only sampled
+    """
+    return {'mode': mode, 'checked': checked, 'first': first, 'context': list(rows),
+            'synced': synced, 'interval': interval}
+
+
+def compare_lockstep(dump, stream, start=0, count=None, context=4):
+    """
+    Step the model alongside the dump. Returns a dict with the number of
+    words checked, the index of the first mismatching dump word (None when
+    all match) and (index, expected, got) rows around it.
+    """
+    stream.seek(start)
+    words = dump.iter_words()
+    if count is not None:
+        words = islice(words, count)
+    checked = 0
+    before = []
+    while True:
+        got = list(islice(words, CHUNK))
+        if not got:
+            return _result('lock-step', checked)
+        expected = stream.words(len(got))
+        if got != expected:
+            first = checked + next(j for j, (g, e) in enumerate(zip(got, expected)) if g != e)
+            extra = list(islice(words, context))
+            got += extra
+            expected += stream.words(len(extra))
+            rows = before + [(checked + i, e, g) for i, (e, g) in enumerate(zip(expected, got))]
+            return _result('lock-step', first + 1, first, [r for r in rows if abs(r[0] - first) <= context])
+        if context:
+            before = [(checked + i, expected[i], got[i]) for i in range(max(0, len(got) - context), len(got))]
+        checked += len(got)
+
+
+def _first_difference(words, stream, start, lo):
+    """
+    Step the model from word lo alongside words (the dump from lo on)
+    and return the index of the first difference (None if there is
+    none) and the number of words compared
+    """
+    stream.seek(start + lo)
+    words = iter(words)
+    compared = 0
+    while True:
+        got = list(islice(words, CHUNK))
+        if not got:
+            return None, compared
+        expected = stream.words(len(got))
+        if got != expected:
+            j = next(j for j, (g, e) in enumerate(zip(got, expected)) if g != e)
+            return lo + compared + j, compared + j + 1
+        compared += len(got)
+
+
+def _checkpoints(n, interval):
+    """
+    Checkpoint indices of a dump of n words, the last word included
+    """
+    k = interval - 1
+    while k < n - 1:
+        yield k
+        k += interval
+    if n:
+        yield n - 1
+
+
+def compare_checkpoints(dump, stream, interval, start=0, count=None, context=4):
+    """
+    Compare every interval-th word using jump-ahead. At the first failing
+    checkpoint, resync at the last matching one and compare the words
+    after it in lock-step. Returns the same dict as compare_lockstep, with
+    'synced' set to that checkpoint; checked counts the compared words.
+    """
+    if not stream.jumps:
+        raise ValueError(f"{type(stream).__name__} has no jump-ahead, use lock-step mode")
+    checked = 0
+    good = -1
+    if dump.random_access:
+        n = len(dump) if count is None else min(count, len(dump))
+        for k in _checkpoints(n, interval):
+            checked += 1
+            if dump[k] == stream.at(start + k):
+                good = k
+                continue
+            first, compared = _first_difference(islice(dump.iter_words(good + 1), k - good), stream,
+                                                 start, good + 1)
+            if first is None:
+                raise ValueError(f"Dump word {k} differs when read alone but not in sequence, "
+                                 f"are all lines the same length?")
+            span = range(max(0, first - context), min(n, first + context + 1))
+            rows = [(i, stream.at(start + i), dump[i]) for i in span]
+            return _result('checkpoint', checked + compared, first, rows, good, interval)
+        return _result('checkpoint', checked, interval=interval)
+
+    # no random access: keep the current interval and the context before it
+    words = dump.iter_words()
+    if count is not None:
+        words = islice(words, count)
+    lo = 0
+    tail = []
+    while True:
+        block = list(islice(words, interval))
+        if not block:
+            return _result('checkpoint', checked, interval=interval)
+        k = lo + len(block) - 1
+        checked += 1
+        if block[-1] == stream.at(start + k):
+            good = k
+            lo = k + 1
+            tail = block[-context:] if context else []
+            continue
+        first, compared = _first_difference(block, stream, start, lo)
+        buffer = tail + block + list(islice(words, context))
+        base = lo - len(tail)
+        span = range(max(base, first - context), min(base + len(buffer), first + context + 1))
+        rows = [(i, stream.at(start + i), buffer[i - base]) for i in span]
+        return _result('checkpoint', checked + compared, first, rows, good, interval)
+
+
+def format_report(result, width, start=0):
+    """
+    Text report of a compare result, with the XOR of every context row
+    and the differing bits (bit i = cell i) of the first mismatch
+    """
+    sampled = result['mode'] == 'checkpoint'
+    if result['first'] is None:
+        if sampled:
+            return (f"{result['checked']} checkpoints checked (every {result['interval']}-th word), "
+                    f"no mismatch at the checkpoints; the words between them were not compared")
+        return f"{result['checked']} words checked ({result['mode']}), no mismatch"
+    hex_width = (width + 3) // 4
+    first = result['first']
+    if sampled:
+        head = f"first mismatch at dump word {first} (model word {start + first})"
+        if result['synced'] >= 0:
+            head = (f"first mismatch after the matching checkpoint at dump word {result['synced']}: "
+                    f"dump word {first} (model word {start + first}); the words before it were only "
+                    f"sampled every {result['interval']}-th word")
+    else:
+        head = f"first mismatch at dump word {first} (model word {start + first})"
+    lines = [f"{head}, {result['checked']} words checked ({result['mode']})",
+             f"  {'word':>12}  {'expected':<{hex_width}}  {'got':<{hex_width}}  xor"]
+    for i, expected, got in result['context']:
+        mark = '>' if i == first else ' '
+        lines.append(f"{mark} {i:>12}  {expected:0{hex_width}X}  {got:0{hex_width}X}  {expected ^ got:0{hex_width}X}")
+    diff = next(e ^ g for i, e, g in result['context'] if i == first)
+    bits = [b for b in range(diff.bit_length()) if diff >> b & 1]
+    shown = ", ".join(map(str, bits[:32])) + (", ..." if len(bits) > 32 else "")
+    lines.append(f"{len(bits)} of {width} bits differ: {shown}")
+    return "\n".join(lines)
+
+
+def _generic(text):
+    key, _, value = text.partition('=')
+    return key, int(value, 0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare a simulator dump with the Python models")
+    parser.add_argument('dump', help='hex text dump or golden_vectors .bin file')
+    parser.add_argument('model', nargs='?', help='model_streams name (default: from a .bin header)')
+    parser.add_argument('--seed', help='seed in hex')
+    parser.add_argument('--width', type=int, help='CASR width')
+    parser.add_argument('--rules', default='0', help='casr_90150h rule vector in hex')
+    parser.add_argument('-g', '--generic', type=_generic, action='append', default=[],
+                        help='extra model argument, e.g. -g w_LFSR_g=32 (repeatable)')
+    parser.add_argument('--start', type=int, default=0, help='model word of the first dump word')
+    parser.add_argument('--count', type=int, help='compare at most this many dump words')
+    parser.add_argument('--checkpoint', type=int, help='sample every N-th word with jump-ahead, scanning the failing interval word by word')
+    parser.add_argument('--context', type=int, default=4, help='words shown around the mismatch')
+    args = parser.parse_args(argv)
+
+    dump = open_dump(args.dump)
+    model, seed, width, rules = args.model, args.seed, args.width, args.rules
+    if isinstance(dump, binary_dump) and model is None:
+        vf = dump.vf
+        if vf.generator not in CASR.values():
+            parser.error(f"{args.dump} does not name a CASR generator, give the model")
+        model, seed, width, rules = vf.generator, vf.seed, vf.width, vf.rules
+    if model is None:
+        parser.error("the model is required for text dumps")
+    try:
+        stream = open_stream(model, seed, width, rules, **dict(args.generic))
+    except (ValueError, TypeError, ImportError) as e:
+        parser.error(str(e))
+    if args.checkpoint and not stream.jumps:
+        parser.error(f"{model} has no jump-ahead, drop --checkpoint")
+
+    if args.checkpoint:
+        result = compare_checkpoints(dump, stream, args.checkpoint, args.start, args.count, args.context)
+    else:
+        result = compare_lockstep(dump, stream, args.start, args.count, args.context)
+    dump.close()
+    print(format_report(result, stream.width, args.start))
+    return 0 if result['first'] is None else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+"""
+Distributions from raw hardware words.
+
+The functions take arrays of raw words (uint32 or uint64, as
+bit_generator.model_bit_generator.random_raw() or any model gives them)
+and return samples, all vectorized. sampler wraps a bit generator, draws
+more words for the rejection methods and counts the raw bits used, to
+budget hardware words per sample.
+
+Raw bits per sample, as 32-bit / 64-bit raw words:
+
+  uniform(float64)    2 / 1            53 bits fill the mantissa, [0, 1): the
+                                       top 27 + 26 bits of two 32-bit words
+                                       or the top 53 of a 64-bit word
+  uniform(float32)    1 / 0.5          top 24 bits of a 32-bit word
+  integers(n)         1 + p / 0.5 + p  Lemire multiply-shift with rejection
+                                       on 32-bit words, p = ((2^32 - n) mod
+                                       n) / 2^32 the rejection rate; for
+                                       n > 2^32 one 64-bit word per try
+  standard_normal     2.044 / 1.022    256-layer ziggurat, 1.5% of the tries
+                                       miss the rectangles and take one more
+                                       word (wedge) or two per tail try
+  bernoulli(p)        2 / 1            compare with round(p 2^64)
+  bernoulli(0.5)      1/32 / 1/64      every raw bit is a sample
+
+Dividing a word by 2^N, as the model scripts did, is not uniform on the
+doubles: 64-bit words round up to 1.0 and the low bits below the
+mantissa are lost or biased. uniform() keeps exactly 53 (24) bits, the
+way numpy's bit generators do (MT19937 for 32-bit words, PCG64 for
+64-bit words), so a sampler and a numpy.random.Generator on the same
+model_bit_generator give the same doubles.
+"""
+import math
+import numpy as np
+
+_M32 = np.uint64(0xFFFFFFFF)
+
+
+def as_uint64(words):
+    """
+    uint64 words from 32-bit raw words, two per word, the first in the
+    upper half (numpy's MT19937 next_uint64)
+    """
+    words = np.asarray(words)
+    if words.dtype.itemsize == 8:
+        return words.astype(np.uint64, copy=False)
+    pairs = words.astype(np.uint64).reshape(-1, 2)
+    return (pairs[:, 0] << np.uint64(32)) | pairs[:, 1]
+
+
+def as_uint32(words):
+    """
+    uint32 halves of 64-bit raw words, low half first
+    """
+    words = np.ascontiguousarray(words)
+    if words.dtype.itemsize == 4:
+        return words.astype(np.uint32, copy=False)
+    return words.astype('<u8', copy=False).view('<u4').astype(np.uint32, copy=False)
+
+
+def uniform(words, dtype=np.float64):
+    """
+    Uniform floats in [0, 1): float64 from one 64-bit word or two 32-bit
+    words (53 bits, numpy's next_double), float32 from 32-bit words (24
+    bits)
+    """
+    words = np.asarray(words)
+    if np.dtype(dtype) == np.float32:
+        return (as_uint32(words) >> np.uint32(8)).astype(np.float32) * np.float32(2.0 ** -24)
+    if words.dtype.itemsize == 4:
+        pairs = words.reshape(-1, 2)
+        high = (pairs[:, 0] >> np.uint32(5)).astype(np.float64)
+        return (high * 67108864.0 + (pairs[:, 1] >> np.uint32(6))) * (2.0 ** -53)
+    return (words.astype(np.uint64, copy=False) >> np.uint64(11)).astype(np.float64) * (2.0 ** -53)
+
+
+def _mulhilo64(a, b):
+    """
+    High and low 64 bits of the 128-bit products a * b of uint64 arrays
+    """
+    a_lo, a_hi = a & _M32, a >> np.uint64(32)
+    b_lo, b_hi = b & _M32, b >> np.uint64(32)
+    ll = a_lo * b_lo
+    lh = a_lo * b_hi
+    hl = a_hi * b_lo
+    mid = (ll >> np.uint64(32)) + (lh & _M32) + (hl & _M32)
+    hi = a_hi * b_hi + (lh >> np.uint64(32)) + (hl >> np.uint64(32)) + (mid >> np.uint64(32))
+    return hi, a * b
+
+
+def lemire(words, bound):
+    """
+    Lemire's multiply-shift bounded integers in [0, bound): the values
+    and the mask of accepted words (the rest must be redrawn). 32-bit
+    words take bound <= 2^32, 64-bit words bound <= 2^64.
+    """
+    words = np.asarray(words)
+    bits = 8 * words.dtype.itemsize
+    if not 0 < bound <= 1 << bits:
+        raise ValueError(f"bound must be in 1..2^{bits}, got {bound}")
+    if bound == 1 << bits:
+        return words.copy(), np.ones(len(words), dtype=bool)
+    # products whose low part falls below this are the biased ones
+    threshold = ((1 << bits) - bound) % bound
+    if bits == 32:
+        m = words.astype(np.uint64) * np.uint64(bound)
+        values, low = m >> np.uint64(32), m & _M32
+    else:
+        values, low = _mulhilo64(words.astype(np.uint64), np.uint64(bound))
+    return values, low >= np.uint64(threshold)
+
+
+def _ziggurat_tables(layers=256, r=3.6541528853610088, v=0.00492867323399):
+    """
+    Marsaglia and Tsang's tables for 52-bit magnitudes: ki (accept
+    thresholds), wi (scale) and fi (density at the layer edges)
+    """
+    m = 2.0 ** 52
+    ki = np.zeros(layers, dtype=np.uint64)
+    wi = np.zeros(layers)
+    fi = np.zeros(layers)
+    dn = tn = r
+    q = v / math.exp(-0.5 * dn * dn)
+    ki[0] = int(dn / q * m)
+    wi[0] = q / m
+    wi[-1] = dn / m
+    fi[0] = 1.0
+    fi[-1] = math.exp(-0.5 * dn * dn)
+    for i in range(layers - 2, 0, -1):
+        dn = math.sqrt(-2.0 * math.log(v / dn + math.exp(-0.5 * dn * dn)))
+        ki[i + 1] = int(dn / tn * m)
+        tn = dn
+        fi[i] = math.exp(-0.5 * dn * dn)
+        wi[i] = dn / m
+    return ki, wi, fi, r
+
+
+ZIGGURAT_KI, ZIGGURAT_WI, ZIGGURAT_FI, ZIGGURAT_R = _ziggurat_tables()
+
+
+def ziggurat(words):
+    """
+    First ziggurat try of 64-bit words: the normals and the mask of
+    those accepted in the rectangles. Bits 0-7 pick the layer, bit 8
+    the sign, bits 9-60 the magnitude. The others need ziggurat_slow().
+    """
+    words = as_uint64(words)
+    layer = (words & np.uint64(0xFF)).astype(np.intp)
+    sign = (words >> np.uint64(8)) & np.uint64(1)
+    rabs = (words >> np.uint64(9)) & np.uint64((1 << 52) - 1)
+    x = rabs.astype(np.float64) * ZIGGURAT_WI[layer]
+    x = np.where(sign == 1, -x, x)
+    return x, rabs < ZIGGURAT_KI[layer], layer
+
+
+def ziggurat_slow(x, layer, u1, u2):
+    """
+    Second stage of rejected tries, u1/u2 being uniforms in [0, 1):
+    the tail (layer 0) uses both, a wedge only u1 (u2 may be None
+    without tail tries). Returns the normals and the mask of those
+    accepted. A rejected wedge starts a new try, a rejected tail try
+    keeps its sign and draws new uniforms.
+    """
+    tail = layer == 0
+    out = x.copy()
+    ok = np.zeros(len(x), dtype=bool)
+    if tail.any():
+        xx = -np.log1p(-u1[tail]) / ZIGGURAT_R
+        yy = -np.log1p(-u2[tail])
+        out[tail] = np.copysign(ZIGGURAT_R + xx, x[tail])
+        ok[tail] = yy + yy > xx * xx
+    wedge = ~tail
+    if wedge.any():
+        i = layer[wedge]
+        y = (ZIGGURAT_FI[i - 1] - ZIGGURAT_FI[i]) * u1[wedge] + ZIGGURAT_FI[i]
+        ok[wedge] = y < np.exp(-0.5 * x[wedge] * x[wedge])
+    return out, ok
+
+
+class sampler:
+    """
+    Distributions drawn from a bit generator (anything with bits and
+    random_raw(size), like model_bit_generator). raw_bits counts the
+    raw bits taken so far.
+    """
+
+    def __init__(self, bitgen):
+        self.bitgen = bitgen
+        self.raw_bits = 0
+
+    def words(self, count, bits=64):
+        """
+        count raw words of 32 or 64 bits. 64-bit words are split into
+        32-bit halves, the unused half of an odd count is dropped.
+        """
+        native = self.bitgen.bits
+        n = count * bits // native if bits >= native else -(-count // 2)
+        raw = self.bitgen.random_raw(n)
+        self.raw_bits += n * native
+        if bits == native:
+            return raw
+        if bits == 64:
+            return as_uint64(raw)
+        return as_uint32(raw)[:count]
+
+    def words_used(self, bits=64):
+        return self.raw_bits / bits
+
+    def doubles(self, count):
+        """
+        count uniform float64 in [0, 1) as numpy's next_double makes
+        them from the bit generator's raw words
+        """
+        native = self.bitgen.bits
+        return uniform(self.words(count * 64 // native, native))
+
+    def random(self, size=None, dtype=np.float64):
+        count = 1 if size is None else int(np.prod(size))
+        if np.dtype(dtype) == np.float32:
+            out = uniform(self.words(count, 32), dtype)
+        else:
+            out = self.doubles(count)
+        return out[0] if size is None else out.reshape(size)
+
+    def integers(self, low, high=None, size=None):
+        """
+        Unbiased integers in [low, high) (in [0, low) without high)
+        """
+        if high is None:
+            low, high = 0, low
+        bound = high - low
+        count = 1 if size is None else int(np.prod(size))
+        bits = 32 if bound <= 1 << 32 else 64
+        if bound > 1 << 64:
+            raise ValueError("integers() takes ranges of up to 2^64")
+        out = np.empty(count, dtype=np.uint64)
+        done = 0
+        while done < count:
+            # the rejected ones are drawn again in the next round
+            values, ok = lemire(self.words(count - done, bits), bound)
+            values = values[ok]
+            out[done:done + len(values)] = values
+            done += len(values)
+        if high <= 1 << 63:
+            result = out.astype(np.int64) + np.int64(low)
+        elif low >= 0:
+            result = out + np.uint64(low)
+        else:
+            result = out.astype(object) + low
+        return result[0] if size is None else result.reshape(size)
+
+    def standard_normal(self, size=None):
+        count = 1 if size is None else int(np.prod(size))
+        out = np.empty(count)
+        pending = np.arange(count)
+        while len(pending):
+            x, ok, layer = ziggurat(self.words(len(pending)))
+            out[pending[ok]] = x[ok]
+            pending, x, layer = pending[~ok], x[~ok], layer[~ok]
+            # a wedge that rejects starts over, the tail is sampled until it accepts
+            tail = layer == 0
+            wedge = ~tail
+            if wedge.any():
+                x_w, ok = ziggurat_slow(x[wedge], layer[wedge], self.doubles(int(wedge.sum())), None)
+                out[pending[wedge][ok]] = x_w[ok]
+                retry = pending[wedge][~ok]
+            else:
+                retry = pending[:0]
+            tail_at, sign = pending[tail], x[tail]
+            while len(tail_at):
+                u1 = self.doubles(len(tail_at))
+                u2 = self.doubles(len(tail_at))
+                x_t, ok = ziggurat_slow(sign, np.zeros(len(sign), dtype=np.intp), u1, u2)
+                out[tail_at[ok]] = x_t[ok]
+                tail_at, sign = tail_at[~ok], sign[~ok]
+            pending = retry
+        return out[0] if size is None else out.reshape(size)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return loc + scale * self.standard_normal(size)
+
+    def bernoulli(self, p, size=None):
+        """
+        0/1 samples (uint8) with P(1) = p, to 2^-64
+        """
+        count = 1 if size is None else int(np.prod(size))
+        if p == 0.5:
+            raw = self.words(-(-count // 64))
+            out = np.unpackbits(raw.astype('<u8').view(np.uint8), bitorder='little')[:count]
+        else:
+            threshold = round(p * 2.0 ** 64)
+            words = self.words(count)
+            if threshold >= 1 << 64:
+                out = np.ones(count, dtype=np.uint8)
+            else:
+                out = (words < np.uint64(threshold)).astype(np.uint8)
+        return out[0] if size is None else out.reshape(size)
+
+
+# Example usage
+if __name__ == "__main__":
+    from bit_generator import model_bit_generator
+    s = sampler(model_bit_generator('pcg_xsh_rs_64'))
+    x = s.standard_normal(100000)
+    print(f"normal mean {x.mean():.4f} std {x.std():.4f}, "
+          f"{s.words_used(32) / len(x):.3f} 32-bit core words per sample")
+    print(s.integers(0, 6, 10), s.random(3), s.bernoulli(0.25, 16))
@@ -0,0 +1,358 @@
+"""
+One interface over the Python models of every folder, for tools that
+compare or analyse their output.
+
+A stream yields the output words of one generator instance as ints:
+  s.words(count)  next count words, as a list
+  s.seek(k)       continue from word k (0 is the first word after seed)
+  s.at(k)         word k, without moving; needs s.jumps
+  s.width         output word width in bits
+  s.jumps         whether seek/at use jump-ahead instead of stepping
+
+and, with memory that stays flat however long the stream is:
+  s.chunk(count)               next count words as a NumPy array
+  s.iter_chunks(size, count)   chunks of size words, endless without count
+  s.stream_to(f, count)        write the words raw to a file, path or pipe
+
+which main() does from the command line.
+
+The arrays use the smallest unsigned dtype holding a word (uint8 ..
+uint64); words wider than 64 bits (CASR rings) are rows of little-endian
+uint64 words, bit i of a row being cell i. stream_to() writes them as
+they sit in memory, little-endian.
+
+open_stream() builds one by name:
+  casr_30, casr_90, casr_150, casr_90150h  packed 'p' mode states
+                                           (width, seed, rules)
+  casr_nl                                  1-bit nonlinear_output words
+                                           (width, seed, m150, m30)
+  pcg_rxs_m_xs_32, pcg_xsh_rr_64, ...      output words (seed)
+  mt                                       mt_32_o (seed, p, w)
+  bit_select_rand, select_slide_rand,      output_rand_o (seed and the
+  lfsr_ring                                model generics)
+"""
+import argparse
+import importlib
+import os
+import sys
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _folder in ('casr/models', 'pcg_64', 'mt', 'lfsr_rngs'):
+    _path = os.path.join(ROOT, *_folder.split('/'))
+    if _path not in sys.path:
+        sys.path.append(_path)
+
+CASR = {'casr_30': '30', 'casr_90': '90', 'casr_150': '150', 'casr_90150h': 'h'}
+LFSR = ('bit_select_rand', 'select_slide_rand', 'lfsr_ring')
+
+
+# words per chunk of iter_chunks/stream_to
+CHUNK = 1 << 16
+
+
+def _as_int(value):
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def word_dtype(width):
+    """
+    NumPy dtype of one word of a stream, uint64 for the rows of words
+    wider than 64 bits
+    """
+    for bits, dtype in ((8, np.uint8), (16, np.uint16), (32, np.uint32)):
+        if width <= bits:
+            return np.dtype(dtype)
+    return np.dtype('<u8')
+
+
+def _pack_rows(values, width):
+    """
+    ints as a chunk array of words of width bits
+    """
+    if width <= 64:
+        return np.array(values, dtype=np.uint64).astype(word_dtype(width), copy=False)
+    n_bytes = 8 * ((width + 63) // 64)
+    data = b"".join(v.to_bytes(n_bytes, "little") for v in values)
+    return np.frombuffer(data, dtype='<u8').reshape(-1, n_bytes // 8)
+
+
+class word_stream:
+    """
+    Base stream, a subclass implements _restart(), _next(count) and, when
+    jumps is set, _jump(k) (state before word k) and at(k).
+    """
+    jumps = False
+    width = None
+
+    def __init__(self):
+        self.pos = 0
+        self._restart()
+
+    def words(self, count):
+        out = self._next(count)
+        self.pos += count
+        return out
+
+    def chunk(self, count):
+        """
+        Next count words as an array of word_dtype(width)
+        """
+        out = self._next_array(count)
+        self.pos += count
+        return out
+
+    def _next_array(self, count):
+        return _pack_rows(self._next(count), self.width)
+
+    def iter_chunks(self, chunk_size=CHUNK, count=None):
+        """
+        Arrays of chunk_size words (the last one shorter when count is
+        not a multiple), until count words or endless
+        """
+        while count is None or count > 0:
+            n = chunk_size if count is None else min(chunk_size, count)
+            yield self.chunk(n)
+            if count is not None:
+                count -= n
+
+    def stream_to(self, f, count=None, chunk_size=CHUNK):
+        """
+        Write count words (endless without count) raw to f: a path, or a
+        binary file or pipe. Returns the number of bytes written.
+        """
+        if isinstance(f, (str, os.PathLike)):
+            with open(f, 'wb') as out:
+                return self.stream_to(out, count, chunk_size)
+        written = 0
+        big_endian = sys.byteorder != 'little'
+        for chunk in self.iter_chunks(chunk_size, count):
+            if big_endian:
+                chunk = chunk.astype(chunk.dtype.newbyteorder('<'))
+            view = memoryview(np.ascontiguousarray(chunk)).cast('B')
+            f.write(view)
+            written += view.nbytes
+        return written
+
+    def seek(self, k):
+        if self.jumps:
+            self._jump(k)
+        else:
+            if k < self.pos:
+                self._restart()
+                self.pos = 0
+            while self.pos < k:
+                self.words(min(1 << 16, k - self.pos))
+        self.pos = k
+        return self
+
+    def at(self, k):
+        raise ValueError(f"{type(self).__name__} has no jump-ahead")
+
+
+class casr_stream(word_stream):
+    """
+    Packed states of a CASR ring (bit i = cell i), the same words as
+    gen_tst_vectors. Rule 90/150 rings jump with casr_jump.
+    """
+
+    def __init__(self, generator, width, seed, rules=0):
+        from gen_tst_vectors import STEP_FNS
+        self.generator = CASR.get(generator, generator)
+        self.step = STEP_FNS[self.generator]
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.seed = _as_int(seed) & self.mask
+        m150 = {'90': 0, '150': self.mask, 'h': _as_int(rules) & self.mask}.get(self.generator)
+        self.masks = (m150,) if self.generator == 'h' else ()
+        self.m150 = m150
+        self.jumps = m150 is not None
+        super().__init__()
+
+    def _restart(self):
+        self.x = self.seed
+
+    def _next(self, count):
+        x, n, mask, masks, step = self.x, self.width, self.mask, self.masks, self.step
+        out = []
+        for _ in range(count):
+            x = step(x, n, mask, *masks)
+            out.append(x)
+        self.x = x
+        return out
+
+    def _next_array(self, count):
+        # states go straight into the chunk buffer, as in casr_packed.run_packed
+        x, n, mask, masks, step = self.x, self.width, self.mask, self.masks, self.step
+        n_bytes = 8 * ((n + 63) // 64)
+        data = bytearray(count * n_bytes)
+        for k in range(0, count * n_bytes, n_bytes):
+            x = step(x, n, mask, *masks)
+            data[k:k + n_bytes] = x.to_bytes(n_bytes, "little")
+        self.x = x
+        words = np.frombuffer(data, dtype='<u8')
+        if n > 64:
+            return words.reshape(count, n_bytes // 8)
+        return words.astype(word_dtype(n), copy=False)
+
+    def _jump(self, k):
+        from casr_jump import jump_word
+        self.x = jump_word(self.seed, k, self.width, self.m150)
+
+    def at(self, k):
+        if not self.jumps:
+            return super().at(k)
+        from casr_jump import jump_word
+        return jump_word(self.seed, k + 1, self.width, self.m150)
+
+
+class nl_stream(word_stream):
+    """
+    nonlinear_output of casr_nl after every clock, one bit per word.
+    m150/m30 select the Rule 150/Rule 30 cells, the others are Rule 90.
+    """
+    width = 1
+
+    def __init__(self, n, seed, m150=0, m30=0):
+        self.n = n
+        self.mask = (1 << n) - 1
+        self.seed = _as_int(seed) & self.mask
+        self.m150 = _as_int(m150) & self.mask
+        self.m30 = _as_int(m30) & self.mask & ~self.m150
+        super().__init__()
+
+    def _restart(self):
+        self.x = self.seed
+
+    def _next(self, count):
+        from casr_packed import nl_output, step_nl
+        x, n, mask, m150, m30 = self.x, self.n, self.mask, self.m150, self.m30
+        out = []
+        for _ in range(count):
+            x = step_nl(x, n, mask, m150, m30)
+            out.append(nl_output(x, n))
+        self.x = x
+        return out
+
+
+class pcg_stream(word_stream):
+    """
+    Output words of a PCG model class, jumping with its advance()
+    """
+    jumps = True
+
+    def __init__(self, variant, seed=None):
+        from pcg_cli import load_variant
+        cls = load_variant(variant)
+        self.first = cls() if seed is None else cls(_as_int(seed))
+        self.width = cls.out_bits
+        super().__init__()
+
+    def _restart(self):
+        self.gen = self.first.copy()
+
+    def _next(self, count):
+        return list(self.gen.fill(count))
+
+    def _next_array(self, count):
+        return np.frombuffer(self.gen.fill(count), dtype=np.uint64).astype(word_dtype(self.width))
+
+    def _jump(self, k):
+        self.gen = self.first.copy().advance(k)
+
+    def at(self, k):
+        return self.first.copy().advance(k).next()
+
+
+class mt_stream(word_stream):
+    """
+    mt_32_o of mt_model.mt
+    """
+
+    def __init__(self, seed=5489, p=3217, w=32, **constants):
+        self.args = (_as_int(seed), p, w)
+        self.constants = constants
+        self.width = w
+        super().__init__()
+
+    def _restart(self):
+        from mt_model import mt
+        self.gen = mt(*self.args, **self.constants)
+
+    def _next(self, count):
+        return self.gen.generate(count).tolist()
+
+    def _next_array(self, count):
+        return self.gen.generate(count).astype(word_dtype(self.width), copy=False)
+
+
+class lfsr_stream(word_stream):
+    """
+    output_rand_o of one instance of an lfsr_rngs block model
+    """
+
+    def __init__(self, model, seed, **generics):
+        self.cls = getattr(importlib.import_module(model + '_model'), model)
+        self.seed = _as_int(seed)
+        self.generics = generics
+        super().__init__()
+        self.width = self.gen.width
+
+    def _restart(self):
+        self.gen = self.cls([self.seed], **self.generics)
+
+    def _next(self, count):
+        return self.gen.generate(count)[0].tolist()
+
+    def _next_array(self, count):
+        return self.gen.generate(count)[0].astype(word_dtype(self.width), copy=False)
+
+
+def open_stream(name, seed=None, width=None, rules=0, **kwargs):
+    """
+    Stream of a generator by name, see the module docstring
+    """
+    if name in CASR or name in CASR.values():
+        if width is None or seed is None:
+            raise ValueError("CASR streams need a width and a seed")
+        return casr_stream(name, width, seed, rules)
+    if name == 'casr_nl':
+        if width is None or seed is None:
+            raise ValueError("casr_nl streams need a width and a seed")
+        return nl_stream(width, seed, **kwargs)
+    if name == 'mt':
+        return mt_stream(5489 if seed is None else seed, **kwargs)
+    if name in LFSR:
+        if seed is None:
+            raise ValueError(f"{name} needs a seed")
+        return lfsr_stream(name, seed, **kwargs)
+    return pcg_stream(name, seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the raw output words of a model to a file or pipe")
+    parser.add_argument('generator', help='open_stream name')
+    parser.add_argument('--seed', help='seed (hex)')
+    parser.add_argument('--width', type=int, help='CASR width')
+    parser.add_argument('--rules', default='0', help='casr_90150h rule vector (hex)')
+    parser.add_argument('-n', '--count', type=int, default=None, help='words to write (default: endless)')
+    parser.add_argument('--chunk', type=int, default=CHUNK, help='words per write')
+    parser.add_argument('-o', '--out', default='-', help="output file, '-' for stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        stream = open_stream(args.generator, args.seed, args.width, args.rules)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        stream.stream_to(sys.stdout.buffer if args.out == '-' else args.out, args.count, args.chunk)
+    except BrokenPipeError:
+        # the reading end of the pipe has had enough
+        sys.stderr.close()
+
+
+# Example usage
+#   python model_streams.py pcg_xsh_rr_64 | some_test_tool
+#   python model_streams.py casr_90150h --width 64 --seed 1234 --rules F0F0 -n 1000000 -o h.bin
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Primitive trinomials and pentanomials for LFSR_generic.
+
+XOR_placment of an LFSR_generic of length L is P(x) >> 1 for a primitive
+P(x) = x^L + x^a [+ x^b + x^c] + 1: bit L-1 is the x^L term (it is also
+the reset value), bit e-1 the x^e tap. The ROM of LFSR_generic.vhdl
+covers L = 2..32; this finds a sparse P for any L, preferring the
+trinomial with the smallest a, then pentanomials in order of a, b, c.
+
+Trinomials that Swan's theorem shows reducible are skipped (all of them
+when 8 divides L). A candidate is sieved with gcd(P, x^(2^d) - x) for
+small d, which throws out most reducible ones in a few squarings, then
+Rabin's test decides irreducibility and the order of x is checked
+against the prime factors of 2^L - 1. All arithmetic reduces by folding
+through the taps.
+
+The factors come from lfsr_rngs/mersenne_factors.txt, the known prime
+factors of the cyclotomic parts Phi_k(2) of 2^L - 1 for k up to 4096
+(from the Cunningham tables), so lengths up to 4096 need no factoring
+and give the same taps on any checkout. Where the table leaves a part of
+2^L - 1 unsplit, the polynomial is irreducible and its order passes
+every known factor and that part, but is not proven 2^L - 1 ("primitive":
+null in the cache). No other candidate helps there: the proof needs
+prime factors the table does not have, and for some lengths nobody has
+them (2^1277 - 1 has no known factor at all). Past the table 2^L - 1 is
+factored with a light ECM effort.
+
+Results go to lfsr_rngs/lfsr_taps.json, which later runs read back
+instead of searching again. --vhdl writes lfsr_taps_pkg.vhd, the ROM as
+tap exponents and a proven flag plus xor_placment_of(), which
+LFSR_generic uses; it warns on an unproven length. --check tests the
+factor table and every cached entry again.
+
+  python primitive_taps.py 2 4096 --vhdl
+  python primitive_taps.py 2 4096 --check
+  python primitive_taps.py 5000
+"""
+import argparse
+import json
+import os
+# model_streams puts casr/models (gf2_poly) and lfsr_rngs on the path
+from model_streams import ROOT
+from LFSR_generic_model import XOR_placment_ROM
+from gf2_poly import (X, cyclotomic_value, deg, is_irreducible, is_probable_prime, load_factor_table,
+                      mersenne_factors, pgcd, pmod, pmul, ppowmod, psqr, read_factor_table)
+
+TAPS_JSON = os.path.join(ROOT, 'lfsr_rngs', 'lfsr_taps.json')
+FACTOR_TABLE = os.path.join(ROOT, 'lfsr_rngs', 'mersenne_factors.txt')
+VHDL_PKG = os.path.join(ROOT, 'lfsr_rngs', 'lfsr_taps_pkg.vhd')
+
+# factors of degree up to this are sieved out before Rabin's test
+SIEVE_DEGREE = 16
+
+# factoring effort for 2^L - 1 past the factor table, kept low since the
+# numbers get large
+FACTOR_ITERATIONS = 1 << 16
+FACTOR_ECM = ((2000, 8),)
+
+
+def rom_exponents(length):
+    """
+    Exponents (a, b, c) of an XOR_placment_ROM entry of LFSR_generic.vhdl
+    """
+    placment = XOR_placment_ROM[length] & ((1 << (length - 1)) - 1)
+    return tuple(i + 1 for i in range(length - 2, -1, -1) if placment >> i & 1)
+
+
+def poly(length, exponents):
+    p = (1 << length) | 1
+    for e in exponents:
+        p |= 1 << e
+    return p
+
+
+def placment(length, exponents):
+    """
+    XOR_placment value of a polynomial
+    """
+    return poly(length, exponents) >> 1
+
+
+def candidates(length):
+    """
+    Middle exponents of the trinomials, then of the pentanomials
+    """
+    for a in range(1, length):
+        yield (a,)
+    for a in range(3, length):
+        for b in range(2, a):
+            for c in range(1, b):
+                yield (a, b, c)
+
+
+def swan_reducible(n, k):
+    """
+    True when Swan's theorem shows x^n + x^k + 1 to have an even number
+    of irreducible factors, so that it is reducible without any test
+    """
+    if n % 2 == 0 and k % 2 == 0:
+        # a square
+        return True
+    if n % 2 and k % 2:
+        # the reciprocal has as many factors
+        k = n - k
+    if n % 2 == 0:
+        return n != 2 * k and n * k // 2 % 4 in (0, 1)
+    if (2 * n) % k:
+        return n % 8 in (3, 5)
+    return n % 8 in (1, 7)
+
+
+def sieve(p, depth=SIEVE_DEGREE):
+    """
+    False when p has an irreducible factor of degree at most depth
+    """
+    h = X
+    acc = 1
+    for _ in range(min(depth, deg(p) // 2)):
+        h = pmod(psqr(h), p)
+        acc = pmod(pmul(acc, h ^ X), p)
+        if acc == 0:
+            return False
+    return pgcd(p, acc) == 1
+
+
+def primitivity(p):
+    """
+    For an irreducible p: True when x has order 2^n - 1, False when it
+    has a smaller one, None when the order passes every known prime
+    factor but 2^n - 1 is not fully factored
+    """
+    n = deg(p)
+    factors, unresolved = mersenne_factors(n, FACTOR_ITERATIONS, FACTOR_ECM)
+    period = (1 << n) - 1
+    for q in factors:
+        if ppowmod(X, period // q, p) == 1:
+            return False
+    return None if unresolved else True
+
+
+def find(length):
+    """
+    Exponents of the first primitive candidate of a length, with its
+    primitivity (True, or None when unproven)
+    """
+    for exponents in candidates(length):
+        if len(exponents) == 1 and swan_reducible(length, exponents[0]):
+            continue
+        p = poly(length, exponents)
+        if not sieve(p) or not is_irreducible(p):
+            continue
+        status = primitivity(p)
+        if status is not False:
+            return exponents, status
+    raise ValueError(f"No primitive trinomial or pentanomial of degree {length}")
+
+
+def load_cache(path=TAPS_JSON, table_path=FACTOR_TABLE):
+    """
+    {length: {'exponents': [...], 'primitive': True or None}}, the
+    factor table loaded into gf2_poly on the way
+    """
+    if table_path:
+        load_factor_table(read_factor_table(table_path))
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return {int(k): v for k, v in json.load(f).items()}
+
+
+def save_cache(taps, path=TAPS_JSON):
+    with open(path, 'w') as f:
+        json.dump({str(k): taps[k] for k in sorted(taps)}, f, indent=0)
+
+
+def check_table(table):
+    """
+    Problems of a factor table: listed numbers that are not prime factors
+    of their Phi_k(2), and a status the rest does not match
+    """
+    problems = []
+    for k, (status, primes) in sorted(table.items()):
+        rest = cyclotomic_value(k)
+        for p in primes:
+            if rest % p or not is_probable_prime(p):
+                problems.append(f"Phi_{k}(2): {p} is not a prime factor")
+                continue
+            while rest % p == 0:
+                rest //= p
+        prime = rest > 1 and is_probable_prime(rest)
+        if (status == '1') != (rest == 1) or (status == 'P') != prime:
+            problems.append(f"Phi_{k}(2): the rest does not match status {status}")
+    return problems
+
+
+def check_taps(taps):
+    """
+    Problems of cached entries: a polynomial that is not irreducible, or
+    a primitivity other than the factors give
+    """
+    problems = []
+    for length, entry in sorted(taps.items()):
+        p = poly(length, entry['exponents'])
+        if not is_irreducible(p):
+            problems.append(f"{length}: not irreducible")
+            continue
+        status = primitivity(p)
+        if status != entry['primitive']:
+            problems.append(f"{length}: primitivity {status}, cached {entry['primitive']}")
+    return problems
+
+
+def tap_table(lengths, taps=None, verbose=False):
+    """
+    Exponents of every length, from the ROM of LFSR_generic.vhdl for
+    2..32 and from the cache or a search otherwise. Updates taps in
+    place and returns it.
+    """
+    taps = {} if taps is None else taps
+    for length in lengths:
+        if length in XOR_placment_ROM:
+            taps[length] = {'exponents': list(rom_exponents(length)), 'primitive': True}
+        elif length not in taps:
+            exponents, status = find(length)
+            taps[length] = {'exponents': list(exponents), 'primitive': status}
+            if verbose:
+                proven = "primitive" if status else "irreducible, 2^L-1 not fully factored"
+                print(f"{length:5d}  {' '.join(map(str, exponents)):16s} {proven}")
+    return taps
+
+
+def vhdl_package(taps):
+    """
+    Text of lfsr_taps_pkg.vhd for the lengths 2..max of taps
+    """
+    top = max(taps)
+    rows = []
+    for length in range(2, top + 1):
+        exponents = (taps[length]['exponents'] + [0, 0])[:3]
+        proven = 1 if taps[length]['primitive'] else 0
+        note = "" if proven else ", 2^L-1 not fully factored"
+        rows.append(f"      ({exponents[0]}, {exponents[1]}, {exponents[2]}, {proven})" +
+                    ("," if length < top else "") + f"  -- {length}{note}")
+    return "\n".join([
+        "--------------------------------------------------------------------------------",
+        "-- Title       : LFSR tap ROM",
+        "-- Project     : hdl_rand",
+        "--------------------------------------------------------------------------------",
+        "-- File        : lfsr_taps_pkg.vhd",
+        "-- Standard    : VHDL-2008",
+        "--------------------------------------------------------------------------------",
+        "-- Description: Generated by tools/primitive_taps.py, do not edit.",
+        "-- Entry L holds the exponents a > b > c of the primitive polynomial",
+        "-- x^L + x^a (+ x^b + x^c) + 1, 0 where unused. xor_placment_of(L) is",
+        "-- the XOR_placment of LFSR_generic: the polynomial shifted down by",
+        "-- one, the x^L term giving bit L-1. The last field is 1 where the",
+        "-- polynomial is proven primitive and 0 where 2^L-1 is not fully",
+        "-- factored: it is irreducible and x passes every known factor of",
+        "-- 2^L-1, but a maximal period is not proven. xor_placment_of warns",
+        "-- on those.",
+        "--------------------------------------------------------------------------------",
+        "",
+        "library ieee;",
+        "use ieee.std_logic_1164.all;",
+        "",
+        "package lfsr_taps_pkg is",
+        f"  constant LFSR_MAX_LEN : natural := {top};",
+        "",
+        "  type lfsr_taps_type is array(0 to 3) of natural;",
+        "  type lfsr_taps_rom_type is array(2 to LFSR_MAX_LEN) of lfsr_taps_type;",
+        "",
+        "  constant LFSR_TAPS_ROM : lfsr_taps_rom_type := (",
+        *rows,
+        "    );",
+        "",
+        "  function xor_placment_of(len : natural) return std_logic_vector;",
+        "end package lfsr_taps_pkg;",
+        "",
+        "package body lfsr_taps_pkg is",
+        "",
+        "  function xor_placment_of(len : natural) return std_logic_vector is",
+        "    variable placment : std_logic_vector(len-1 downto 0) := (others => '0');",
+        "  begin",
+        "    assert LFSR_TAPS_ROM(len)(3) = 1",
+        "      report \"polynomial not proven primitive for LFSR_len \" & natural'image(len)",
+        "      severity warning;",
+        "    placment(len-1) := '1';",
+        "    for i in 0 to 2 loop",
+        "      if LFSR_TAPS_ROM(len)(i) > 0 then",
+        "        placment(LFSR_TAPS_ROM(len)(i)-1) := '1';",
+        "      end if;",
+        "    end loop;",
+        "    return placment;",
+        "  end function xor_placment_of;",
+        "",
+        "end package body lfsr_taps_pkg;",
+        "",
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Primitive trinomials/pentanomials for LFSR_generic")
+    parser.add_argument('first', type=int, help='first length (or the only one)')
+    parser.add_argument('last', type=int, nargs='?', help='last length')
+    parser.add_argument('--cache', default=TAPS_JSON, help='tap cache JSON')
+    parser.add_argument('--factors', default=FACTOR_TABLE, help='table of known factors of 2^L-1')
+    parser.add_argument('--check', action='store_true',
+                        help='test the factor table and the cached entries of the lengths')
+    parser.add_argument('--vhdl', nargs='?', const=VHDL_PKG, help='write the VHDL package (2..last)')
+    args = parser.parse_args(argv)
+
+    last = args.first if args.last is None else args.last
+    if args.first < 2 or last < args.first:
+        parser.error("lengths must satisfy 2 <= first <= last")
+    taps = load_cache(args.cache, args.factors)
+    if args.check:
+        problems = check_table(read_factor_table(args.factors)) if args.factors else []
+        problems += check_taps({k: v for k, v in taps.items() if args.first <= k <= last})
+        print("\n".join(problems) or "ok")
+        return
+    lengths = range(2 if args.vhdl else args.first, last + 1)
+    for start in range(0, len(lengths), 32):
+        # saved every 32 lengths, so an interrupted run keeps its results
+        tap_table(lengths[start:start + 32], taps, verbose=True)
+        save_cache(taps, args.cache)
+    if args.vhdl:
+        with open(args.vhdl, 'w') as f:
+            f.write(vhdl_package({k: taps[k] for k in lengths}))
+        print(args.vhdl)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+"""
+Statistical test battery in the style of NIST SP 800-22.
+
+Tests: frequency, block frequency (M = 128), runs, longest run of ones,
+serial, approximate entropy, cumulative sums (forward and backward),
+linear complexity (M = 500) and binary matrix rank (32 x 32), with the
+p-value formulas and category tables of the NIST reference code.
+
+The bits of a model_streams stream are taken word by word, LSB first
+(bit i = cell i for the CASR states). The stream is cut into chunks
+whose length is a multiple of every block length. Worker processes
+reduce each chunk to partial statistics (counts, pattern histograms,
+prefix sum extremes, boundary bits), and those merge exactly, so the
+result does not depend on the chunking and memory use does not grow with
+the number of bits.
+
+  python stat_tests.py pcg_xsh_rr_64 pcg_rxs_m_xs_32 -n 100000000 -j 8
+  python stat_tests.py casr_90150h,width=512 mt lfsr_ring,w_LFSR_g=32 -n 1000000
+"""
+import argparse
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from model_streams import CASR, open_stream
+from berlekamp_massey import linear_complexity
+from helper import bits_to_ints, ints_to_bits
+from gen_tst_vectors import DEFAULT_SETS, SEED_SET
+
+ALPHA = 0.01
+
+# bits per chunk, a multiple of every block length below
+CHUNK_BITS = 1_280_000
+
+BLOCK_FREQ_M = 128
+LINEAR_M = 500
+RANK_Q = 32
+
+# M -> (smallest, largest counted run, class probabilities)
+LONGEST_RUN = {
+    8: (1, 4, (0.2148, 0.3672, 0.2305, 0.1875)),
+    128: (4, 9, (0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124)),
+    10000: (10, 16, (0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727)),
+}
+LINEAR_PI = (0.010417, 0.03125, 0.125, 0.5, 0.25, 0.0625, 0.020833)
+RANK_PI = (0.2888, 0.5776, 0.1336)
+
+TESTS = ('frequency', 'block_frequency', 'runs', 'longest_run', 'serial_1', 'serial_2',
+         'approximate_entropy', 'cusum_forward', 'cusum_backward', 'linear_complexity', 'rank')
+
+
+def igamc(a, x):
+    """
+    Regularized upper incomplete gamma function Q(a, x)
+    """
+    if x <= 0:
+        return 1.0
+    log_front = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        ap = a
+        while abs(term) > abs(total) * 1e-15:
+            ap += 1
+            term *= x / ap
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_front))
+    # continued fraction, modified Lentz
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    i = 1
+    while True:
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            return math.exp(log_front) * h
+        i += 1
+
+
+def _phi(z):
+    return 0.5 * math.erfc(-z / math.sqrt(2))
+
+
+def parameters(n_bits):
+    """
+    Block and pattern lengths used for a sequence of n_bits
+    """
+    if n_bits >= 750000:
+        longest_m = 10000
+    elif n_bits >= 6272:
+        longest_m = 128
+    else:
+        longest_m = 8
+    log_n = int(math.log2(max(n_bits, 2)))
+    serial_m = max(3, min(16, log_n - 3))
+    apen_m = max(2, min(10, log_n - 6))
+    return {'n': n_bits, 'longest_m': longest_m, 'serial_m': serial_m, 'apen_m': apen_m,
+            'pattern_ms': sorted({serial_m, serial_m - 1, serial_m - 2, apen_m, apen_m + 1} - {0})}
+
+
+def block_lcm(params):
+    lcm = 1
+    for m in (BLOCK_FREQ_M, LINEAR_M, RANK_Q * RANK_Q, params['longest_m']):
+        lcm = lcm * m // math.gcd(lcm, m)
+    return lcm
+
+
+def _windows(bits, m):
+    """
+    Histogram of the m-bit windows (first bit most significant) lying
+    fully inside bits
+    """
+    count = len(bits) - m + 1
+    if count <= 0:
+        return np.zeros(1 << m, dtype=np.int64)
+    values = np.zeros(count, dtype=np.int64)
+    for j in range(m):
+        values = (values << 1) | bits[j:j + count]
+    return np.bincount(values, minlength=1 << m)
+
+
+def _rank_counts(bits):
+    """
+    Number of full rank, rank 31 and other 32 x 32 matrices
+    """
+    n_mat = len(bits) // (RANK_Q * RANK_Q)
+    if n_mat == 0:
+        return np.zeros(3, dtype=np.int64)
+    rows = np.packbits(bits[:n_mat * RANK_Q * RANK_Q].reshape(n_mat, RANK_Q, RANK_Q), axis=2,
+                       bitorder='little').view('<u4')[:, :, 0].copy()
+    rank = np.zeros(n_mat, dtype=np.int64)
+    index = np.arange(n_mat)
+    for col in range(RANK_Q):
+        has = (rows >> np.uint32(col)) & np.uint32(1) != 0
+        found = has.any(axis=1)
+        pivot = np.where(found, rows[index, has.argmax(axis=1)], np.uint32(0))
+        # clears the column from every row holding it, the pivot row included
+        rows ^= np.where(has, pivot[:, None], np.uint32(0))
+        rank += found
+    return np.array([(rank == 32).sum(), (rank == 31).sum(), (rank < 31).sum()])
+
+
+def chunk_stats(packed, n_bits, params):
+    """
+    Partial statistics of one chunk (np.packbits little-endian bytes)
+    """
+    bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=n_bits, bitorder='little')
+    steps = 2 * bits.astype(np.int64) - 1
+    prefix = np.cumsum(steps)
+    stats = {
+        'n': n_bits,
+        'ones': int(bits.sum()),
+        'transitions': int(np.count_nonzero(bits[1:] != bits[:-1])),
+        'first': int(bits[0]),
+        'last': int(bits[-1]),
+        'sum': int(prefix[-1]),
+        'max_incl': int(prefix.max()), 'min_incl': int(prefix.min()),
+        'max_excl': max(0, int(prefix[:-1].max(initial=0))), 'min_excl': min(0, int(prefix[:-1].min(initial=0))),
+    }
+
+    n_blocks = n_bits // BLOCK_FREQ_M
+    ratios = bits[:n_blocks * BLOCK_FREQ_M].reshape(n_blocks, BLOCK_FREQ_M).mean(axis=1)
+    stats['block_freq'] = (float(((ratios - 0.5) ** 2).sum()), n_blocks)
+
+    m = params['longest_m']
+    low, high, _ = LONGEST_RUN[m]
+    n_blocks = n_bits // m
+    blocks = np.zeros((n_blocks, m + 2), dtype=np.int8)
+    blocks[:, 1:-1] = bits[:n_blocks * m].reshape(n_blocks, m)
+    edges = np.diff(blocks.ravel())
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    longest = np.zeros(n_blocks, dtype=np.int64)
+    np.maximum.at(longest, starts // (m + 2), ends - starts)
+    stats['longest_run'] = np.bincount(np.clip(longest, low, high) - low, minlength=high - low + 1)
+
+    max_m = params['pattern_ms'][-1]
+    stats['head'] = bits[:max_m - 1].copy()
+    stats['tail'] = bits[-(max_m - 1):].copy()
+    stats['patterns'] = {pm: _windows(bits, pm) for pm in params['pattern_ms']}
+
+    n_blocks = n_bits // LINEAR_M
+    classes = np.zeros(7, dtype=np.int64)
+    if n_blocks:
+        mu = LINEAR_M / 2 + (9 + (-1) ** (LINEAR_M + 1)) / 36 - (LINEAR_M / 3 + 2 / 9) / 2 ** LINEAR_M
+        sign = (-1) ** LINEAR_M
+        for x in bits_to_ints(bits[:n_blocks * LINEAR_M].reshape(n_blocks, LINEAR_M)):
+            t = sign * (linear_complexity(x, LINEAR_M) - mu) + 2 / 9
+            classes[min(6, max(0, math.ceil(t + 2.5)))] += 1
+    stats['linear'] = classes
+    stats['rank'] = _rank_counts(bits)
+    return stats
+
+
+def merge(a, b):
+    """
+    Statistics of chunk a followed by chunk b
+    """
+    if a is None:
+        return b
+    merged = {
+        'n': a['n'] + b['n'],
+        'ones': a['ones'] + b['ones'],
+        'transitions': a['transitions'] + b['transitions'] + (a['last'] != b['first']),
+        'first': a['first'],
+        'last': b['last'],
+        'sum': a['sum'] + b['sum'],
+        'max_incl': max(a['max_incl'], a['sum'] + b['max_incl']),
+        'min_incl': min(a['min_incl'], a['sum'] + b['min_incl']),
+        'max_excl': max(a['max_excl'], a['sum'] + b['max_excl']),
+        'min_excl': min(a['min_excl'], a['sum'] + b['min_excl']),
+        'block_freq': (a['block_freq'][0] + b['block_freq'][0], a['block_freq'][1] + b['block_freq'][1]),
+        'longest_run': a['longest_run'] + b['longest_run'],
+        'head': a['head'],
+        'tail': b['tail'],
+        'linear': a['linear'] + b['linear'],
+        'rank': a['rank'] + b['rank'],
+    }
+    # windows running across the boundary start in the last m-1 bits of a
+    merged['patterns'] = {m: a['patterns'][m] + b['patterns'][m] + _windows(
+        np.concatenate([a['tail'][len(a['tail']) - (m - 1):], b['head'][:m - 1]]), m)
+        for m in a['patterns']}
+    return merged
+
+
+def _wrapped_counts(stats, m):
+    """
+    Overlapping m-bit pattern counts with the sequence wrapped around
+    """
+    if m == 0:
+        return np.array([stats['n']])
+    wrap = np.concatenate([stats['tail'][len(stats['tail']) - (m - 1):], stats['head'][:m - 1]])
+    return stats['patterns'][m] + _windows(wrap, m)
+
+
+def _chi2(counts, probabilities):
+    total = counts.sum()
+    return sum((v - total * p) ** 2 / (total * p) for v, p in zip(counts, probabilities))
+
+
+def p_values(stats, params):
+    """
+    p-value of every test, None where the sequence is too short for it
+    """
+    n = stats['n']
+    p = dict.fromkeys(TESTS)
+    p['frequency'] = math.erfc(abs(2 * stats['ones'] - n) / math.sqrt(n) / math.sqrt(2))
+
+    total, n_blocks = stats['block_freq']
+    if n_blocks:
+        p['block_frequency'] = igamc(n_blocks / 2, 4 * BLOCK_FREQ_M * total / 2)
+
+    pi = stats['ones'] / n
+    if abs(pi - 0.5) >= 2 / math.sqrt(n):
+        p['runs'] = 0.0
+    else:
+        runs = stats['transitions'] + 1
+        p['runs'] = math.erfc(abs(runs - 2 * n * pi * (1 - pi)) / (2 * math.sqrt(2 * n) * pi * (1 - pi)))
+
+    counts = stats['longest_run']
+    if counts.sum():
+        probabilities = LONGEST_RUN[params['longest_m']][2]
+        p['longest_run'] = igamc((len(probabilities) - 1) / 2, _chi2(counts, probabilities) / 2)
+
+    psi = {}
+    for m in (params['serial_m'], params['serial_m'] - 1, params['serial_m'] - 2):
+        counts = _wrapped_counts(stats, m).astype(float)
+        psi[m] = (2 ** m / n) * float((counts ** 2).sum()) - n if m else 0.0
+    m = params['serial_m']
+    p['serial_1'] = igamc(2 ** (m - 2), (psi[m] - psi[m - 1]) / 2)
+    p['serial_2'] = igamc(2 ** (m - 3), (psi[m] - 2 * psi[m - 1] + psi[m - 2]) / 2)
+
+    phi = {}
+    for m in (params['apen_m'], params['apen_m'] + 1):
+        counts = _wrapped_counts(stats, m)
+        freq = counts[counts > 0] / n
+        phi[m] = float((freq * np.log(freq)).sum())
+    m = params['apen_m']
+    apen = phi[m] - phi[m + 1]
+    p['approximate_entropy'] = igamc(2 ** (m - 1), n * (math.log(2) - apen))
+
+    z_forward = max(stats['max_incl'], -stats['min_incl'])
+    z_backward = max(stats['sum'] - stats['min_excl'], stats['max_excl'] - stats['sum'])
+    p['cusum_forward'] = _cusum_p(z_forward, n)
+    p['cusum_backward'] = _cusum_p(z_backward, n)
+
+    if stats['linear'].sum():
+        p['linear_complexity'] = igamc(3, _chi2(stats['linear'], LINEAR_PI) / 2)
+    if stats['rank'].sum():
+        p['rank'] = math.exp(-_chi2(stats['rank'], RANK_PI) / 2)
+    return p
+
+
+def _cusum_p(z, n):
+    sqrt_n = math.sqrt(n)
+    total = 1.0
+    for k in range(int((-n / z + 1) / 4), int((n / z - 1) / 4) + 1):
+        total -= _phi((4 * k + 1) * z / sqrt_n) - _phi((4 * k - 1) * z / sqrt_n)
+    for k in range(int((-n / z - 3) / 4), int((n / z - 1) / 4) + 1):
+        total += _phi((4 * k + 3) * z / sqrt_n) - _phi((4 * k + 1) * z / sqrt_n)
+    return min(1.0, max(0.0, total))
+
+
+def iter_chunks(stream, n_bits, chunk_bits=CHUNK_BITS):
+    """
+    (packed bytes, bit count) chunks of the first n_bits of a stream,
+    chunk_bits each except the last, which takes the remainder as well
+    """
+    width = stream.width
+    n_chunks = max(1, n_bits // chunk_bits)
+    pending = np.zeros(0, dtype=np.uint8)
+    for k in range(n_chunks):
+        need = chunk_bits if k < n_chunks - 1 else n_bits - chunk_bits * (n_chunks - 1)
+        if len(pending) < need:
+            words = stream.words(-(-(need - len(pending)) // width))
+            pending = np.concatenate([pending, ints_to_bits(words, width).ravel()])
+        bits, pending = pending[:need], pending[need:]
+        yield np.packbits(bits, bitorder='little').tobytes(), need
+
+
+def run_battery(stream, n_bits, processes=None, chunk_bits=CHUNK_BITS):
+    """
+    p-values of every test on the first n_bits of a stream. Chunks are
+    handed to a process pool, at most two per worker in flight.
+    """
+    params = parameters(n_bits)
+    if n_bits < params['pattern_ms'][-1]:
+        raise ValueError(f"Need at least {params['pattern_ms'][-1]} bits")
+    if chunk_bits < n_bits and chunk_bits % block_lcm(params):
+        raise ValueError(f"chunk_bits must be a multiple of {block_lcm(params)}")
+    stats = None
+    chunks = iter_chunks(stream, n_bits, chunk_bits)
+    if processes == 1:
+        for packed, count in chunks:
+            stats = merge(stats, chunk_stats(packed, count, params))
+        return p_values(stats, params)
+    with ProcessPoolExecutor(processes) as pool:
+        in_flight = deque()
+        limit = 2 * (processes or os.cpu_count() or 1)
+        for packed, count in chunks:
+            in_flight.append(pool.submit(chunk_stats, packed, count, params))
+            if len(in_flight) >= limit:
+                stats = merge(stats, in_flight.popleft().result())
+        while in_flight:
+            stats = merge(stats, in_flight.popleft().result())
+    return p_values(stats, params)
+
+
+def summary_table(results, alpha=ALPHA):
+    """
+    Text table of {generator: p-values}, one column per generator
+    """
+    names = list(results)
+    width = max([12] + [len(name) for name in names])
+    test_width = max(len(t) for t in TESTS)
+    lines = [f"{'test':<{test_width}}  " + "  ".join(f"{name:>{width}}" for name in names)]
+    passed = dict.fromkeys(names, 0)
+    for test in TESTS:
+        cells = []
+        for name in names:
+            p = results[name][test]
+            if p is None:
+                cells.append(f"{'n/a':>{width}}")
+                continue
+            ok = p >= alpha
+            passed[name] += ok
+            cells.append(f"{p:.4f} {'ok' if ok else 'FAIL':>4}".rjust(width))
+        lines.append(f"{test:<{test_width}}  " + "  ".join(cells))
+    lines.append(f"{'passed':<{test_width}}  " + "  ".join(
+        f"{passed[name]}/{sum(results[name][t] is not None for t in TESTS)}".rjust(width) for name in names))
+    return "\n".join(lines)
+
+
+def parse_spec(spec):
+    """
+    'name,key=value,...' -> open_stream arguments. CASR rings default to
+    the casr_tst_vectors seed set 1 at the testbench widths (64 cells for
+    casr_nl).
+    """
+    name, *pairs = spec.split(',')
+    kwargs = {}
+    for pair in pairs:
+        key, _, value = pair.partition('=')
+        kwargs[key] = value if key in ('seed', 'rules') else int(value, 0)
+    short = CASR.get(name, name)
+    if short in dict(SEED_SET):
+        seed = int(DEFAULT_SETS[0]['seed'], 16)
+        kwargs.setdefault('width', dict(SEED_SET)[short])
+        kwargs.setdefault('seed', seed)
+        kwargs.setdefault('rules', (seed >> 256) | ((seed & ((1 << 256) - 1)) << 256))
+    elif name == 'casr_nl':
+        kwargs.setdefault('width', 64)
+        kwargs.setdefault('seed', int(DEFAULT_SETS[0]['seed'], 16))
+    elif name in ('bit_select_rand', 'select_slide_rand', 'lfsr_ring'):
+        kwargs.setdefault('seed', 0x12345678)
+    return name, kwargs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statistical tests on the model outputs")
+    parser.add_argument('generators', nargs='+', help="model_streams names, optionally 'name,key=value,...'")
+    parser.add_argument('-n', '--bits', type=int, default=1_000_000, help='bits tested per generator')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--alpha', type=float, default=ALPHA, help='significance level')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for spec in args.generators:
+        name, kwargs = parse_spec(spec)
+        try:
+            stream = open_stream(name, **kwargs)
+        except (ValueError, TypeError, ImportError) as e:
+            parser.error(f"{spec}: {e}")
+        results[spec.split(',')[0]] = run_battery(stream, args.bits, args.jobs)
+    print(f"{args.bits} bits per generator, alpha = {args.alpha}")
+    print(summary_table(results, args.alpha))
+
+
+if __name__ == "__main__":
+    main()